@@ -1,23 +1,60 @@
-from .core import check, check_args, validator, One
+import importlib
+
+from .core import check, check_many, check_parallel, is_valid, check_args, precompile, compile_checker, \
+    intern_checker, set_repr_limits, set_disabled, set_check_level, set_code_cache, Cost, validator, One
 from .comparable import Comparable
 from .optional import Optional
+from .cached import Cached
 from .numeric import Int, Float, Number, PositiveInt, PositiveNumber, PositiveFloat, NonNegativeInt,\
     NonNegativeNumber, NonNegativeFloat, NegativeInt, NegativeNumber, NegativeFloat, NonPositiveInt, \
     NonPositiveNumber, NonPositiveFloat, Sized, NonEmpty
-from .string import String
-from .collection import Collection, Set
-from .sequence import Sequence, NonEmptySequence, Tuple, NonEmptyTuple, MutableSequence, NonEmptyMutableSequence, \
-    List, NonEmptyList
-from .iter import Iterator, Iterable
-from .pathlike import PathLike, ExistingDir, ExistingFile
 
 
-__all__ = ['check', 'check_args', 'validator', 'One',
+# The following submodules are imported when one of their names is first accessed (see __getattr__), e.g. a program that
+# only checks numbers does not need to import pathlib and re
+_lazy_submodules = {
+    'sampling': ['EveryNth', 'RandomFraction', 'FirstN', 'RateLimit'],
+    'string': ['String'],
+    'collection': ['Collection', 'Set'],
+    'sequence': ['Sequence', 'NonEmptySequence', 'Tuple', 'NonEmptyTuple', 'MutableSequence', 'NonEmptyMutableSequence',
+                 'List', 'NonEmptyList'],
+    'iter': ['Iterator', 'Iterable'],
+    'pathlike': ['PathLike', 'ExistingDir', 'ExistingFile'],
+}
+
+_lazy_names = {name: submodule for submodule, names in _lazy_submodules.items() for name in names}
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name not in _lazy_names:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    # Once imported, the name is set as a global, so that __getattr__ is not called for it again
+    value = getattr(importlib.import_module(f'.{_lazy_names[name]}', __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_submodules) | set(_lazy_names))
+
+
+__all__ = ['check', 'check_many', 'check_parallel', 'is_valid', 'check_args', 'precompile', 'compile_checker',
+           'intern_checker', 'set_repr_limits', 'set_disabled', 'set_check_level', 'set_code_cache', 'Cost',
+           'validator', 'One',
 
            'Comparable',
 
            'Optional',
 
+           'Cached',
+
+           'EveryNth', 'RandomFraction', 'FirstN', 'RateLimit',
+
            'Int', 'Float', 'Number', 'PositiveInt', 'PositiveNumber', 'PositiveFloat', 'NonNegativeInt',
            'NonNegativeNumber', 'NonNegativeFloat', 'NegativeInt', 'NegativeNumber', 'NegativeFloat', 'NonPositiveInt',
            'NonPositiveNumber', 'NonPositiveFloat', 'Sized', 'NonEmpty',
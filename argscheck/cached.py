@@ -0,0 +1,245 @@
+"""
+Cached
+======
+
+This page documents the :class:`.Cached` checker.
+"""
+
+from functools import lru_cache
+
+from .core import Checker, Wrapper, _structural_key
+from .utils import is_immutable, CacheInfo, LRUCache, Sentinel
+
+
+_missing = Sentinel('<MISSING>')
+
+# Marks a cached result whose value was not converted by the check, so the checked value itself can be returned
+_unchanged = Sentinel('<UNCHANGED>')
+
+# Values of these types are cached as-is (lru_cache(typed=True) tells apart e.g. 1, 1.0 and True). Other immutable
+# values, e.g. tuples, are cached along with a key that tells apart their items by type as well
+_atomic_types = {type(None), bool, int, float, complex, str, bytes}
+
+# Values of these types are remembered by their identity if the checker is created with by_identity=True
+_container_types = (tuple, frozenset)
+
+
+class _Uncached(Exception):
+    """Raised from a cached check to prevent its result from being cached."""
+
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+
+
+class Cached(Checker):
+    """
+    Check `x` like the checker described by `args`, and remember the result for each (hashable and immutable) value
+    that passed the check, so that checking it again is a single lookup.
+
+    Only values of immutable builtin types (e.g. `str`, `int`, `float`, and `tuple` or `frozenset` of those) are cached.
+    Other values, as well as values that fail the check, are checked as usual.
+
+    :param args: *Tuple[CheckerLike]* – Describes the check whose results are cached.
+    :param maxsize: *int* – Maximum number of cached results, the least recently used result is evicted first.
+    :param enabled: *Optional[bool]* – Whether results are cached. By default they are, unless the check reads the
+        file system (e.g. :class:`~argscheck.pathlike.ExistingFile`), in which case its result may change over time.
+    :param by_identity: *bool* – Whether `tuple` and `frozenset` values are remembered by their identity rather than
+        by their items, so that passing the same (large) container again is a single lookup, instead of hashing all of
+        its items. Such a container is kept alive for as long as its result is cached, in a separate cache of up to
+        `maxsize` results.
+
+    :Example:
+
+    .. code-block:: python
+
+        from argscheck import check, Cached, String, Tuple
+
+
+        checker = Cached(String('[a-z]+(-[a-z]+)*'), maxsize=256)
+
+        check(checker, 'eu-west')  # Passes, 'eu-west' is returned
+        check(checker, 'eu-west')  # Passes, 'eu-west' is returned without matching the pattern again
+        check(checker, 'EU')       # Fails, a ValueError is raised
+
+        checker.cache_info()       # CacheInfo(hits=1, misses=2, maxsize=256, currsize=1)
+
+        # The routing table is checked once, later calls with the same tuple only look up its identity
+        routes = tuple((f'10.0.{i}.0', i) for i in range(10000))
+        checker = Cached(Tuple(Tuple(str, int)), by_identity=True)
+
+        check(checker, routes)
+        check(checker, routes)
+    """
+
+    __slots__ = ('checker', 'maxsize', 'enabled', 'by_identity', '_lookup', '_identities')
+
+    # The caches are state rather than options, checkers that differ only by their cached values are equal
+    _unkeyed = ('_lookup', '_identities')
+
+    def __init__(self, *args, maxsize=1024, enabled=None, by_identity=False, **kwargs):
+        super().__init__(**kwargs)
+
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 0:
+            self._raise_init_type_error('must be a non-negative int', maxsize=maxsize)
+
+        if enabled is not None and not isinstance(enabled, bool):
+            self._raise_init_type_error('must be a bool (if present)', enabled=enabled)
+
+        if not isinstance(by_identity, bool):
+            self._raise_init_type_error('must be a bool', by_identity=by_identity)
+
+        self.checker = Checker.from_checker_likes(args)
+        self.maxsize = maxsize
+        self.enabled = not self.checker._volatile() if enabled is None else enabled
+        self.by_identity = by_identity
+        self._lookup = lru_cache(maxsize, typed=True)(self._check_uncached)
+        self._identities = LRUCache(maxsize)
+
+    def check(self, name, value, **kwargs):
+        passed, value = super().check(name, value)
+        if not passed:
+            return False, value
+
+        new_value = self._cached(value) if self.enabled else _missing
+
+        if new_value is _missing:
+            return self.checker._compile('check')(name, value)
+
+        return True, value if new_value is _unchanged else new_value
+
+    def _emit(self, gen, name, value):
+        super()._emit(gen, name, value)
+
+        if not self.enabled:
+            gen.emit(self.checker, name, value)
+
+            return
+
+        # The lookup of atomic values is inlined, other values are looked up by _cached()
+        new_value, uncached, missing = gen.var('value'), gen.var('uncached'), gen.const(_missing, 'missing')
+        gen.line(f'{new_value} = {missing}')
+
+        with gen.block(f'if type({value}) in {gen.const(_atomic_types, "atomic")}:'):
+            with gen.block('try:'):
+                gen.line(f'{new_value} = {gen.const(self._lookup, "lookup")}({value}, None)')
+
+            with gen.block(f'except {gen.const(_Uncached, "Uncached")} as {uncached}:'):
+                with gen.block(f'if {uncached}.result is not None:'):
+                    gen.line(f'{new_value} = {uncached}.result[1]')
+
+        with gen.block('else:'):
+            gen.line(f'{new_value} = {gen.const(self._cached, "cached")}({value})')
+
+        with gen.block(f'if {new_value} is {missing}:'):
+            gen.emit(self.checker, name, value)
+
+        with gen.block(f'elif {new_value} is not {gen.const(_unchanged, "unchanged")}:'):
+            gen.line(f'{value} = {new_value}')
+
+    def _cached(self, value):
+        """Return the cached (or newly cached) checked value, _unchanged if it is value itself, or _missing if value
+        failed the check or can not be cached."""
+        if type(value) in _atomic_types:
+            key = None
+        elif self.by_identity and type(value) in _container_types:
+            return self._cached_by_identity(value)
+        elif is_immutable(value):
+            key = _structural_key(value)
+        else:
+            return _missing
+
+        try:
+            return self._lookup(value, key)
+        except _Uncached as uncached:
+            return _missing if uncached.result is None else uncached.result[1]
+
+    def _cached_by_identity(self, value):
+        """Like _cached(), but value (a tuple or a frozenset) is looked up by its identity."""
+        # Each entry holds a reference to its value, so the value's id can not be reused by another object while the
+        # entry exists. Values are deeply immutable, so the cached result remains valid for as long as the entry exists
+        entry = self._identities.get(id(value))
+
+        if entry is not None:
+            return entry[1]
+
+        if not is_immutable(value):
+            return _missing
+
+        try:
+            new_value = self._check_uncached(value, None)
+        except _Uncached as uncached:
+            return _missing if uncached.result is None else uncached.result[1]
+
+        self._identities.set(id(value), (value, new_value))
+
+        return new_value
+
+    def _check_uncached(self, value, key):
+        # Failures (and deferred checks) are checked again with the argument's name, so errors refer to it. Items of
+        # collections are checked by a deferred iterable, which raises their errors instead of returning them
+        try:
+            result = self.checker._compile('check')('', value)
+        except Exception:
+            raise _Uncached(None)
+
+        if isinstance(result, Wrapper) or not result[0]:
+            raise _Uncached(None)
+
+        # Converted values are only cached if they are immutable, i.e. if it is safe to return them more than once
+        new_value = result[1]
+
+        if new_value is value:
+            return _unchanged
+
+        if not is_immutable(new_value):
+            raise _Uncached(result)
+
+        return new_value
+
+    def _replace(self, **changes):
+        # The cache of the new checker must not be shared, since it calls the original checker on misses
+        checker = super()._replace(**changes)
+        object.__setattr__(checker, '_lookup', lru_cache(checker.maxsize, typed=True)(checker._check_uncached))
+        object.__setattr__(checker, '_identities', LRUCache(checker.maxsize))
+
+        return checker
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state['_lookup'], state['_identities']
+
+        return state
+
+    def __setstate__(self, state):
+        # The cached results are not pickled, an unpickled checker starts with an empty cache
+        lookup = lru_cache(state['maxsize'], typed=True)(self._check_uncached)
+        super().__setstate__(dict(state, _lookup=lookup, _identities=LRUCache(state['maxsize'])))
+
+    def _type_only(self):
+        return super()._type_only() and self.checker._type_only()
+
+    def expected(self):
+        return super().expected() + self.checker._expected()
+
+    def cache_info(self):
+        """
+        Return statistics of the cache: number of hits and misses, maximum and current size and the hit ratio (as the
+        ``hit_ratio`` attribute). Values remembered by their identity (see `by_identity`) are counted along with the
+        rest.
+
+        :return: *CacheInfo*
+        """
+
+        hits, misses, maxsize, currsize = self._lookup.cache_info()
+        identities = self._identities.info()
+
+        return CacheInfo(hits + identities.hits, misses + identities.misses, maxsize, currsize + identities.currsize)
+
+    def cache_clear(self):
+        """
+        Discard all cached results and reset the statistics.
+        """
+
+        self._lookup.cache_clear()
+        self._identities.clear()
@@ -15,10 +15,16 @@ Collections can be homogeneous, i.e. all items in it satisfy the same set of con
 Homogeneity can be checked for using by providing one or more positional arguments to the checker's constructor.
 """
 
-from .core import check, Typed, Wrapper
+from .core import check, Typed, Wrapper, Cost, RAISE_ON_ERROR_DEFAULT
+from .utils import join
 from . import Comparable
 from .numeric import Sized
 from .iter import Iterable
+from .sequence import _memoized_types
+
+
+# Iterates over the items of a collection without checking them, so they can be checked one by one
+_any_items = Iterable()
 
 
 class Collection(Sized, Typed):
@@ -57,6 +63,74 @@ class Collection(Sized, Typed):
         if not passed:
             return False, value
 
+        return self._check_items(name, value, **kwargs)
+
+    def _emit(self, gen, name, value):
+        super()._emit(gen, name, value)
+
+        if self.iterable is None:
+            return
+
+        # Only the verdict is needed, so items are checked inline and no new collection is created
+        if not gen.converts:
+            item_checker, items, item = self.iterable.item_checker, gen.var('items'), gen.var('item')
+
+            # Creating the new collection may fail (see _check_items()), which only checking the collection finds out,
+            # unless it is of a type that can always be created from the (possibly converted) items
+            if item_checker is None or item_checker._type_only():
+                types = (list, tuple, set, frozenset)
+            else:
+                types = (list, tuple)
+
+            # Items that fail raise their error from the deferred Iterable checker
+            with gen.block(f'if type({value}) not in {gen.const(types, "types")}:'):
+                with gen.block('try:'):
+                    with gen.block(f"if not {gen.const(self._check_items, 'check_items')}('', {value})[0]:"):
+                        gen.fail(None)
+
+                with gen.block('except NotImplementedError:'):
+                    gen.line('raise')
+
+                with gen.block('except Exception:'):
+                    gen.fail(None)
+
+            if item_checker is None:
+                return
+
+            with gen.block('else:'):
+                with gen.block('try:'):
+                    gen.line(f'{items} = iter({value})')
+
+                with gen.block('except TypeError:'):
+                    gen.fail(None)
+
+                with gen.block(f'for {item} in {items}:'):
+                    with gen.deferred(f'{self!r} does not does not support nesting deferred checkers.'):
+                        gen.emit(item_checker, "''", item)
+
+            return
+
+        # Items are checked by the Iterable checker, which is deferred, so this part is not inlined
+        result, passed, new_value = gen.var('result'), gen.var('passed'), gen.var('value')
+        arguments = join(', ', [name, value, gen.kwargs_for(self)], on_empty='drop')
+        gen.line(f'{result} = {gen.const(self, "checker")}._check_items({arguments})')
+        gen.line(f'{passed}, {new_value} = {result}')
+
+        with gen.block(f'if not {passed}:'):
+            gen.fail(new_value)
+
+        gen.line(f'{value} = {new_value}')
+
+    def _level_changes(self, level):
+        changes = super()._level_changes(level)
+
+        # Checking the items is dropped below the ITEMS tier
+        if level < Cost.ITEMS and self.iterable is not None:
+            changes['iterable'] = None
+
+        return changes
+
+    def _check_items(self, name, value, **kwargs):
         # If Collection was constructed with an empty *args, no need to iterate over items in the collection
         if self.iterable is None:
             return True, value
@@ -64,12 +138,33 @@ class Collection(Sized, Typed):
         if not name:
             name = repr(self).lower()
 
-        items = list(check(self.iterable, value, name, **kwargs))
+        raise_on_error = kwargs.get('raise_on_error', RAISE_ON_ERROR_DEFAULT)
+        items = []
+        memo = {}
+
+        # Tuples and frozensets that are referenced more than once (e.g. the same tuple in many items) are checked
+        # once per call, same as in _check_nested(). The memo holds on to each item, so its identity can not be reused
+        for pre_check_item in check(_any_items, value, name):
+            memoized = type(pre_check_item) in _memoized_types
+            entry = memo.get(id(pre_check_item)) if memoized else None
+
+            if entry is not None and entry[0] is pre_check_item:
+                items.append(entry[1])
+
+                continue
 
-        for item in items:
-            if isinstance(item, Wrapper):
+            post_check_item = check(self.iterable.item_checker, pre_check_item, f'item {len(items)} from {name}',
+                                    raise_on_error)
+
+            if isinstance(post_check_item, Wrapper):
                 raise NotImplementedError(f'{self!r} does not does not support nesting deferred checkers.')
 
+            # With raise_on_error=False, each item is a (passed, new_value, old_value) tuple, which is not remembered
+            if memoized and raise_on_error and type(post_check_item) in _memoized_types:
+                memo[id(pre_check_item)] = pre_check_item, post_check_item
+
+            items.append(post_check_item)
+
         try:
             value = type(value)(items)
         except TypeError:
@@ -7,7 +7,7 @@ This page documents the :class:`.Comparable` checker.
 
 import operator
 
-from .core import Checker
+from .core import Checker, Cost, _structural_key
 
 
 class _Descriptor:
@@ -21,8 +21,14 @@ class _Descriptor:
     def __set_name__(self, owner, name):
         self.name = name
 
+        # The value is stored in a slot of the same name, prefixed with an underscore
+        self.slot = owner.__dict__['_' + name]
+
     def __get__(self, obj, owner=None):
-        return obj.__dict__.get(self.name, None)
+        try:
+            return self.slot.__get__(obj, owner)
+        except AttributeError:
+            return None
 
     def __set__(self, obj, value):
         if value is not None:
@@ -53,7 +59,7 @@ class _Descriptor:
 
             value = _Comparer(value, self.long_name, self.comp_op)
 
-        obj.__dict__[self.name] = value
+        self.slot.__set__(obj, value)
 
 
 class Comparable(Checker):
@@ -112,6 +118,8 @@ class Comparable(Checker):
        This is due to how Python's chained comparison handling is implemented.
     """
 
+    __slots__ = ('other_type', '_lt', '_le', '_ne', '_eq', '_ge', '_gt')
+
     lt = _Descriptor(operator.lt, excludes={'le', 'eq'}, greater_than={'gt', 'ge'}, long_name='less than')
     le = _Descriptor(operator.le, excludes={'lt', 'eq'}, greater_than={'gt', 'ge'}, long_name='less than or equal to')
     gt = _Descriptor(operator.gt, excludes={'ge', 'eq'}, less_than={'lt', 'le'}, long_name='greater than')
@@ -132,34 +140,22 @@ class Comparable(Checker):
         self.lt, self.le, self.ne, self.eq, self.ge, self.gt = lt, le, ne, eq, ge, gt
 
     def __lt__(self, other):
-        self.lt = other
-
-        return self
+        return self._replace(lt=other)
 
     def __gt__(self, other):
-        self.gt = other
-
-        return self
+        return self._replace(gt=other)
 
     def __le__(self, other):
-        self.le = other
-
-        return self
+        return self._replace(le=other)
 
     def __ge__(self, other):
-        self.ge = other
-
-        return self
+        return self._replace(ge=other)
 
     def __ne__(self, other):
-        self.ne = other
-
-        return self
+        return self._replace(ne=other)
 
     def __eq__(self, other):
-        self.eq = other
-
-        return self
+        return self._replace(eq=other)
 
     def check(self, name, value, **kwargs):
         passed, value = super().check(name, value)
@@ -178,12 +174,40 @@ class Comparable(Checker):
 
         return True, value
 
+    def _emit(self, gen, name, value):
+        super()._emit(gen, name, value)
+
+        for comparator in self._comparators():
+            result = gen.var('result')
+
+            with gen.block('try:'):
+                gen.line(f'{result} = {comparator.source(value, gen.const(comparator.other, "other"))}')
+
+            with gen.block('except TypeError:'):
+                gen.fail(gen.error(self, TypeError, name, value), in_except=True)
+
+            with gen.block(f'if not {result}:'):
+                gen.fail(gen.error(self, ValueError, name, value))
+
     def expected(self):
         expected = [f'{comparator.long_name} {comparator.other!r}' for comparator in self._comparators()]
         expected = ', '.join(expected)
 
         return super().expected() + [expected]
 
+    def _type_only(self):
+        return super()._type_only() and next(self._comparators(), None) is None
+
+    def _level_changes(self, level):
+        changes = super()._level_changes(level)
+
+        # Comparisons are dropped below the VALUE tier
+        if level < Cost.VALUE:
+            names = ('lt', 'le', 'ne', 'eq', 'ge', 'gt')
+            changes.update({name: None for name in names if getattr(self, name) is not None})
+
+        return changes
+
     def _comparators(self):
         for comparator in (self.lt, self.le, self.ne, self.eq, self.ge, self.gt):
             if comparator is not None:
@@ -191,6 +215,11 @@ class Comparable(Checker):
 
 
 class _Comparer:
+    __slots__ = ('other', 'long_name', 'comp_op')
+
+    _symbols = {operator.lt: '<', operator.le: '<=', operator.ne: '!=', operator.eq: '==', operator.ge: '>=',
+                operator.gt: '>'}
+
     def __init__(self, other, long_name, comp_op):
         self.other = other
         self.long_name = long_name
@@ -198,3 +227,10 @@ class _Comparer:
 
     def __call__(self, value):
         return self.comp_op(value, self.other)
+
+    def structural_key(self):
+        return self.comp_op, _structural_key(self.other)
+
+    def source(self, value, other):
+        """Return a source code expression equivalent to calling this comparer."""
+        return f'{value} {self._symbols[self.comp_op]} {other}'
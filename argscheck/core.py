@@ -10,16 +10,88 @@ more complex conditions.
 Also present is the documentation of the :class:`.One` checker.
 """
 
+import abc
+import collections.abc
+import enum
+import os
 import sys
+from contextlib import contextmanager
 from functools import wraps
 import inspect
+import operator
+import threading
+import weakref
 
-from .utils import extend_docstring, partition, join
+from .utils import extend_docstring, partition, join, make_function, is_immutable, LRUCache, Sentinel, BoundedRepr, \
+    set_code_cache_dir
 
 
 # Reusable default value for raise_on_error parameter
 RAISE_ON_ERROR_DEFAULT = True
 
+# Checkers resolved from hashable checker-likes (types, checker classes and tuples of those) by check(), so that
+# repeated inline checks such as check((int, float), x) do not build a new checker on every call
+_checker_likes_cache = LRUCache(maxsize=256)
+
+# Checkers constructed with the class level shorthands, e.g. List[int] or Int < 3, see _CheckerMeta._shared()
+_shared_checkers = LRUCache(maxsize=256)
+
+_missing = Sentinel('<MISSING>')
+
+# Canonical checker for each structural key, see intern_checker()
+_interned = weakref.WeakValueDictionary()
+_interned_lock = threading.Lock()
+
+# Generated functions by structural key of the checker they were generated from, see Checker._compile(). Functions
+# are generated under the (reentrant, since nested checkers are compiled recursively) lock
+_compiled_fns = weakref.WeakValueDictionary()
+_compile_lock = threading.RLock()
+
+# Used for the value that failed a check in error messages, see set_repr_limits()
+_value_repr = BoundedRepr(max_length=1000, max_items=20, max_level=4)
+
+# Maximum number of argument type signatures remembered by each function decorated with check_args
+_max_type_signatures = 256
+
+# Whether checking is turned off, see set_disabled()
+_disabled = os.environ.get('ARGSCHECK_DISABLE', '').strip().lower() not in ('', '0', 'false', 'no', 'off')
+
+
+class Cost(enum.IntEnum):
+    """
+    Cost tiers of the checks performed by checkers, from cheapest to most expensive. Checks of tiers above the current
+    level (see :func:`.set_check_level`) are skipped.
+    """
+
+    #: Type checks, i.e. ``isinstance()``.
+    TYPE = 1
+
+    #: Checks that look at the value as a whole in (roughly) constant time, e.g. comparisons, lengths, regex patterns
+    #: and path suffixes.
+    VALUE = 2
+
+    #: Checks of each of the items of a collection, sequence, iterator etc., which take time linear in their number.
+    ITEMS = 3
+
+    #: Checks that access the file system, e.g. whether a path points to an existing file.
+    IO = 4
+
+
+def _parse_level(value):
+    try:
+        return Cost[value.strip().upper()] if not value.strip().isdigit() else Cost(int(value))
+    except (KeyError, ValueError):
+        names = ', '.join(level.name for level in Cost)
+
+        raise ValueError(f'ARGSCHECK_LEVEL must be one of {names} (or their values), got {value!r} instead.') from None
+
+
+# Highest cost tier of the checks that are performed, see set_check_level()
+_level = _parse_level(os.environ['ARGSCHECK_LEVEL']) if os.environ.get('ARGSCHECK_LEVEL') else Cost.IO
+
+# The on-disk cache of compiled code is off unless a directory is given, see set_code_cache()
+set_code_cache_dir(os.environ.get('ARGSCHECK_CODE_CACHE') or None)
+
 
 def check(checker_like, value, name='', raise_on_error=RAISE_ON_ERROR_DEFAULT):
     """
@@ -63,8 +135,18 @@ def check(checker_like, value, name='', raise_on_error=RAISE_ON_ERROR_DEFAULT):
 
         passed, value, _ = check(int, 1, raise_on_error=False)      # passed is True, value is 1.
         passed, value, _ = check(int, 'one', raise_on_error=False)  # passed is False, value is a TypeError.
+
+    The exception of a failed check formats its message only when it is needed, so it is an instance of a subclass of
+    the exception type (e.g. of `ValueError`) rather than of that type itself. It can be caught and tested with
+    `isinstance()` as usual, but `type(e) is ValueError` is False.
+
+    If checking is disabled (see :func:`.set_disabled`), `value` is returned as-is (or `(True, value, value)` with
+    `raise_on_error=False`) without checking it.
     """
 
+    if _disabled:
+        return (True, value, value) if raise_on_error is False else value
+
     # raise_on_error must be a boolean
     if not isinstance(raise_on_error, bool):
         class_name = raise_on_error.__class__.__name__
@@ -72,7 +154,10 @@ def check(checker_like, value, name='', raise_on_error=RAISE_ON_ERROR_DEFAULT):
         raise TypeError(f'check() expects that raise_on_error is bool, got {class_name} instead.')
 
     # Transform checker-like to checker and apply it to the argument's value
-    checker = Checker.from_checker_likes(checker_like)
+    checker = _resolve_checker_like(checker_like)
+    if _level is not Cost.IO:
+        checker = checker.at_level(_level)
+
     result = checker.check(name, value, raise_on_error=raise_on_error)
 
     # If a wrapper is returned, just return it (checking will take place on evaluation). Otherwise, return or raise
@@ -90,155 +175,1375 @@ def check(checker_like, value, name='', raise_on_error=RAISE_ON_ERROR_DEFAULT):
             raise new_value
 
 
-def check_args(function=None, raise_on_error=RAISE_ON_ERROR_DEFAULT):
+def _resolve_checker_like(checker_like):
+    # Checker instances need no resolving
+    if isinstance(checker_like, Checker):
+        return checker_like
+
+    # Unhashable checker-likes (e.g. a tuple containing a Comparable instance) are not cached
+    try:
+        checker = _checker_likes_cache.get(checker_like)
+    except TypeError:
+        return Checker.from_checker_likes(checker_like)
+
+    if checker is None:
+        checker = Checker.from_checker_likes(checker_like)
+        _checker_likes_cache.set(checker_like, checker)
+
+    return checker
+
+
+check.cache_info = _checker_likes_cache.info
+check.cache_clear = _checker_likes_cache.clear
+
+
+def check_many(checker_like, values, name='', raise_on_error=RAISE_ON_ERROR_DEFAULT):
+    """
+    Check (and possibly convert) each value in a batch of values. Same as calling :func:`.check` on each value, but the
+    checker is resolved and specialized only once for the entire batch.
+
+    The default behaviour is to return a list with the checked (and possibly converted) values, or raise an exception
+    for the first value that fails the check.
+
+    :param checker_like: *CheckerLike* – Describes the check performed on each value.
+    :param values: *Iterable[Any]* - The values being checked.
+    :param name: *Optional[str]* - Optional name of the values being checked. Will be used in error messages, along
+        with the position of the failed value.
+    :param raise_on_error: *bool* - Whether to use the default or the alternative behaviour of this function.
+
+    :Example:
+
+    .. code-block:: python
+
+        from argscheck import check_many, Int
+
+
+        check_many(Int(ge=0), [1, 2, 3])   # Passes, [1, 2, 3] is returned.
+        check_many(Int(ge=0), [1, -2, 3])  # Fails, a ValueError is raised (for item 1).
+
+    With `raise_on_error=False`, exceptions are never raised and the return value is `(passed, new_values, errors)`:
+
+    * `passed` - is a ``bytearray`` with a 1 for each value that passed the check, and a 0 for each value that failed.
+    * `new_values` - is a list with the checked (and possibly converted) value for each value that passed the check,
+      and the original value for each value that failed.
+    * `errors` - is a dict mapping the position of each value that failed the check to its exception.
+
+    :Example:
+
+    .. code-block:: python
+
+        from argscheck import check_many, Int
+
+
+        passed, values, errors = check_many(Int(ge=0), [1, -2, 'a'], raise_on_error=False)
+
+        # passed is bytearray(b'\\x01\\x00\\x00'), values is [1, -2, 'a']
+        # errors is {1: ValueError(...), 2: TypeError(...)}
+    """
+
+    if not isinstance(raise_on_error, bool):
+        class_name = raise_on_error.__class__.__name__
+
+        raise TypeError(f'check_many() expects that raise_on_error is bool, got {class_name} instead.')
+
+    checker = _resolve_checker_like(checker_like).at_level(_level)
+    item_name = name + '[{}]' if name else 'item {}'
+
+    return _check_many(checker, values, item_name, raise_on_error)
+
+
+def _check_many(checker, values, item_name, raise_on_error, start=0):
+    # Values are first checked without a name, which is only needed for the error message of failed values
+    check_value = checker._compile('raise')
+
+    if raise_on_error:
+        new_values = []
+        append = new_values.append
+
+        for i, value in enumerate(values, start):
+            try:
+                append(check_value(value))
+                continue
+            except Exception:
+                pass
+
+            # Check again with the value's name, so that the raised error points at the failed value
+            append(check_value(value, item_name.format(i)))
+
+        return new_values
+
+    # With deferred checkers, wrappers must be created with raise_on_error=False, so the fast path can not be used
+    check_result = checker._compile('check')
+    fast = not check_value.may_defer
+    passed, new_values, errors = bytearray(), [], {}
+
+    for i, value in enumerate(values, start):
+        if fast:
+            try:
+                new_values.append(check_value(value))
+                passed.append(1)
+                continue
+            except Exception:
+                pass
+
+        result = check_result(item_name.format(i), value, raise_on_error=False)
+
+        if isinstance(result, Wrapper):
+            new_values.append(result)
+            passed.append(1)
+        elif result[0]:
+            new_values.append(result[1])
+            passed.append(1)
+        else:
+            new_values.append(value)
+            passed.append(0)
+            errors[i] = result[1]
+
+    return passed, new_values, errors
+
+
+def check_parallel(checker_like, values, name='', raise_on_error=RAISE_ON_ERROR_DEFAULT, chunk_size=None,
+                   executor=None, max_workers=None):
+    """
+    Same as :func:`.check_many`, but the values are split into chunks that are checked in parallel by a pool of worker
+    processes, so that checking a huge batch of values can use all CPU cores. The results are returned in the original
+    order, and with the default behaviour, the raised exception is that of the first value (by position) that fails.
+
+    The checker and the values are pickled and sent to the workers, and the checked values are pickled and sent back.
+    Hence, this only pays off if checking a value costs considerably more than pickling it.
+
+    :param checker_like: *CheckerLike* – Describes the check performed on each value, must not contain deferred
+        checkers, such as :class:`.Iterable`.
+    :param values: *Iterable[Any]* - The values being checked.
+    :param name: *Optional[str]* - See :func:`.check_many`.
+    :param raise_on_error: *bool* - See :func:`.check_many`.
+    :param chunk_size: *Optional[int]* - Number of values checked by a worker at a time. By default, the values are
+        split into four chunks per worker.
+    :param executor: *Optional[concurrent.futures.Executor]* - Executor that checks the chunks. By default, a new
+        ``ProcessPoolExecutor`` with `max_workers` workers is created (and shut down) on each call, passing an executor
+        that is kept alive saves that overhead.
+    :param max_workers: *Optional[int]* - Number of workers, one per CPU core by default. If `executor` is passed, this
+        should be its number of workers, which is only used for splitting the values into chunks.
+
+    :Example:
+
+    .. code-block:: python
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        from argscheck import check_parallel, String
+
+
+        if __name__ == '__main__':
+            values = ['abc'] * 1_000_000
+
+            with ProcessPoolExecutor() as executor:
+                check_parallel(String('[a-z]+'), values, executor=executor)  # Passes, a list of the values is returned
+    """
+
+    if not isinstance(raise_on_error, bool):
+        class_name = raise_on_error.__class__.__name__
+
+        raise TypeError(f'check_parallel() expects that raise_on_error is bool, got {class_name} instead.')
+
+    if chunk_size is not None and (not isinstance(chunk_size, int) or isinstance(chunk_size, bool) or chunk_size < 1):
+        raise TypeError(f'check_parallel() expects chunk_size to be a positive int, got chunk_size={chunk_size!r}.')
+
+    if max_workers is not None and (not isinstance(max_workers, int) or isinstance(max_workers, bool) or
+                                    max_workers < 1):
+        raise TypeError(f'check_parallel() expects max_workers to be a positive int, got max_workers={max_workers!r}.')
+
+    checker = _resolve_checker_like(checker_like).at_level(_level)
+
+    # Deferred checkers return wrappers of the values, which can not be sent back from the workers
+    if checker._compile('raise').may_defer:
+        raise TypeError(f'check_parallel() does not support deferred checkers, got {checker!r}.')
+
+    if not isinstance(values, collections.abc.Sequence):
+        values = list(values)
+
+    own_executor = executor is None
+
+    # Imported here, since importing concurrent.futures (and logging along with it) is relatively slow
+    if own_executor:
+        import concurrent.futures
+
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers)
+
+    futures = []
+
+    try:
+        if chunk_size is None:
+            workers = max_workers or os.cpu_count() or 1
+            chunk_size = max(-(-len(values) // (workers * 4)), 1)
+
+        item_name = name + '[{}]' if name else 'item {}'
+        futures = [executor.submit(_check_many, checker, values[start:start + chunk_size], item_name, False, start)
+                   for start in range(0, len(values), chunk_size)]
+        passed, new_values, errors = bytearray(), [], {}
+
+        # Chunks are gathered in order, so the first error found is that of the first value that failed
+        for future in futures:
+            chunk_passed, chunk_values, chunk_errors = future.result()
+
+            if raise_on_error and chunk_errors:
+                raise chunk_errors[min(chunk_errors)]
+
+            passed += chunk_passed
+            new_values += chunk_values
+            errors.update(chunk_errors)
+    finally:
+        # Once a value failed, the chunks that were not started yet are not needed (shutdown(cancel_futures=True) would
+        # do the same, but requires Python 3.9)
+        for future in futures:
+            future.cancel()
+
+        if own_executor:
+            executor.shutdown()
+
+    return new_values if raise_on_error else (passed, new_values, errors)
+
+
+def is_valid(checker_like, value):
+    """
+    Check whether an argument passes a check, without raising or even creating an exception if it does not. This is
+    useful when only a yes/no answer is needed, e.g. for filtering values or choosing between code paths.
+
+    Conversions are skipped, so nothing but the verdict is computed. The verdict is always that of :func:`.check`, i.e.
+    `True` if and only if checking `value` would not raise. Hence, sequences and collections whose converted items may
+    fail to be set (e.g. :class:`.MutableSequence` of a `tuple`) are checked with their conversions.
+
+    :param checker_like: *CheckerLike* – Describes the check performed on `value`.
+    :param value: *Any* - The value of the argument being checked.
+    :return: *bool* – Whether `value` passes the check.
+    :raise: NotImplementedError. If `checker_like` contains a deferred checker, such as :class:`.Iterable`.
+
+    :Example:
+
+    .. code-block:: python
+
+        from argscheck import is_valid, Int
+
+
+        is_valid(Int(ge=0), 1)   # True is returned
+        is_valid(Int(ge=0), -1)  # False is returned
+        is_valid(int, 'one')     # False is returned
+    """
+
+    checker = _resolve_checker_like(checker_like)
+    if _level is not Cost.IO:
+        checker = checker.at_level(_level)
+
+    return checker.accepts(value)
+
+
+def check_args(function=None, raise_on_error=RAISE_ON_ERROR_DEFAULT, check_defaults_once=True, sample=None,
+               level=None, lazy=False):
     """
     A decorator that makes a function (or a method) automatically perform argument checking each time its called.
 
-    The checker used on each parameter is extracted from its annotation in the function definition statement
-    (parameters without annotation will not be checked).
+    The checker used on each parameter is extracted from its annotation in the function definition statement
+    (parameters without annotation will not be checked).
+
+    Default values of parameters are checked once, when the decorator is applied, and the checked (and possibly
+    converted) default is reused whenever the argument is omitted. This is only done when both the default and the
+    checked value are immutable (e.g. numbers, strings or tuples of those) and the check passes, other defaults are
+    checked on every call like any other argument.
+
+    :param function: *Optional[Callable]* – The decorated function.
+    :param raise_on_error: *bool* – See :func:`.check`.
+    :param check_defaults_once: *bool* – Pass `False` to check default values on every call, e.g. when a check depends
+        on the filesystem or on the current time, and so its result may change between calls.
+    :param sample: *Optional[Callable[[], bool]]* – Check only some of the calls, those for which `sample()` returns
+        `True`, e.g. one of the policies in :mod:`argscheck.sampling`. Other calls skip the checks, but not the
+        conversions, so the decorated function gets the same values either way (e.g. an :class:`.Optional` default
+        still replaces `None`). Arguments that are converted are therefore still type checked, the checks of all other
+        arguments are skipped altogether (with `raise_on_error=False`, they are passed as `(True, value, value)`).
+    :param level: *Optional[Cost]* – Highest cost tier of the checks that are performed, by default, the level set by
+        :func:`.set_check_level` when the decorator is applied.
+    :param lazy: *bool* – Pass `True` to build the checkers (and check the default values) on the first call, instead
+        of when the decorator is applied, so that decorating functions that are never called costs next to nothing.
+        Use :func:`.precompile` to build them ahead of time, e.g. before a server starts taking requests. Note that
+        errors in annotations are then only raised on the first call.
+
+    :Example:
+
+    .. code-block:: python
+
+        from argscheck import check_args, Number, Float
+
+
+        @check_args
+        def convex_sum(a: Number, b: Number, alpha: (0.0 <= Float) <= 1.0):
+            return alpha * a + (1.0 - alpha) * b
+
+
+        convex_sum(0, 2, 0.0)    # Passes, 2.0 is returned
+        convex_sum(0, 2, 1.1)    # Fails, a ValueError is raised (1.1 is greater than 1.0)
+        convex_sum(0, [2], 0.5)  # Fails, a TypeError is raised ([2] is not a number)
+
+    Just like with :func:`.check`, we may prefer to handle errors ourselves, in which case we can use the alternative
+    behaviour by passing a flag to the decorator.
+
+    :Example:
+
+    .. code-block:: python
+
+        import logging
+        from argscheck import check_args, Number, Float
+
+
+        @check_args(raise_on_error=False)
+        def convex_sum(a: Number, b: Number, alpha: (0.0 <= Float) <= 1.0):
+            # Check a
+            passed, exception, a = a
+            if not passed:
+                logging.critical('Error in a=%s argument of convex_sum: %s', a, exception)
+                raise exception
+
+            # Check b
+            passed, exception, b = b
+            if not passed:
+                logging.critical('Error in b=%s argument of convex_sum: %s', b, exception)
+                raise exception
+
+            # Check alpha
+            passed, exception, alpha = alpha
+            if not passed:
+                logging.critical('Error in alpha=%s argument of convex_sum: %s', alpha, exception)
+                raise exception
+
+            return alpha * a + (1.0 - alpha) * b
+
+
+        convex_sum(0, 2, 0.0)    # Passes, 2.0 is returned
+        convex_sum(0, 2, 1.1)    # Fails, a ValueError is raised (1.1 is greater than 1.0)
+        convex_sum(0, [2], 0.5)  # Fails, a TypeError is raised ([2] is not a number)
+
+    If checking is disabled (see :func:`.set_disabled`) when the decorator is applied, the decorated function itself is
+    returned, so calling it costs nothing extra. This is not the case with `raise_on_error=False`, since the function
+    relies on receiving its arguments as the results of their checks.
+    """
+
+    if not isinstance(raise_on_error, bool):
+        class_name = raise_on_error.__class__.__name__
+
+        raise TypeError(f'check_args() expects that raise_on_error is bool, got {class_name} instead.')
+
+    if not isinstance(check_defaults_once, bool):
+        class_name = check_defaults_once.__class__.__name__
+
+        raise TypeError(f'check_args() expects that check_defaults_once is bool, got {class_name} instead.')
+
+    if sample is not None and not callable(sample):
+        raise TypeError(f'check_args() expects that sample is callable (if present), got sample={sample!r} instead.')
+
+    if level is not None:
+        level = _validate_level(level, 'check_args()')
+
+    if not isinstance(lazy, bool):
+        raise TypeError(f'check_args() expects that lazy is bool, got {lazy.__class__.__name__} instead.')
+
+    def decorator(fn):
+        if _disabled and raise_on_error:
+            return fn
+
+        if lazy:
+            return _make_lazy_fn(fn, build_checked_fn, _level if level is None else level)
+
+        return build_checked_fn(fn, _level if level is None else level)
+
+    def build_checked_fn(fn, level):
+        checkers = {}
+
+        # Extract signature, iterate over parameters and create checkers from annotations
+        signature = inspect.signature(fn)
+
+        for name, parameter in signature.parameters.items():
+            annotation = parameter.annotation
+
+            # Skip parameters without annotations
+            if annotation is parameter.empty:
+                continue
+
+            checker = Checker.from_checker_likes(annotation, f'{fn.__name__}({name})')
+            checkers[name] = checker.at_level(level)
+
+        # Build a function that performs argument checking, then, calls original function
+        checked_fn = _make_checked_fn(fn, signature, checkers, raise_on_error, check_defaults_once, sample)
+
+        return wraps(fn)(checked_fn)
+
+    if function is None:
+        # When applied like @check_args(...)
+        return decorator
+    else:
+        # When applied like @check_args
+        return decorator(function)
+
+
+def _make_lazy_fn(fn, build_checked_fn, level):
+    """
+    Return a function that builds the checked version of `fn` on its first call (or when passed to precompile()), and
+    from then on, calls it.
+    """
+
+    checked_fn = None
+
+    def build():
+        """Build the checked function, unless it was already built. Return whether it was built."""
+        nonlocal checked_fn
+
+        # Concurrent first calls build the checked function only once
+        with _compile_lock:
+            if checked_fn is not None:
+                return False
+
+            checked_fn = build_checked_fn(fn, level)
+
+        return True
+
+    @wraps(fn)
+    def lazy_fn(*args, **kwargs):
+        if checked_fn is None:
+            build()
+
+        return checked_fn(*args, **kwargs)
+
+    lazy_fn._argscheck_build = build
+
+    return lazy_fn
+
+
+def precompile(*modules_or_functions):
+    """
+    Build the checkers of functions decorated with ``check_args(lazy=True)``, so that their first call is as fast as any
+    other call. Other functions (and functions that were already built) are skipped.
+
+    :param modules_or_functions: *Tuple[Union[ModuleType, type, Callable, Iterable]]* – Functions, classes (whose
+        methods are precompiled), modules (whose functions and classes are precompiled) or iterables of those.
+    :return: *int* – Number of functions that were built.
+
+    :Example:
+
+    .. code-block:: python
+
+        import argscheck
+        import my_service.handlers
+
+
+        # Before taking requests
+        argscheck.precompile(my_service.handlers)
+    """
+
+    count = 0
+    seen = set()
+    pending = []
+
+    # Iterables are only expanded if passed directly, attributes of classes and modules may be iterators (which would be
+    # drained) or even endless ones
+    for obj in modules_or_functions:
+        if isinstance(obj, collections.abc.Iterable) and not isinstance(obj, (str, bytes)) and \
+                not inspect.isclass(obj):
+            pending.extend(obj)
+        else:
+            pending.append(obj)
+
+    while pending:
+        obj = pending.pop()
+
+        # Modules and classes may refer to each other (or themselves), visit each only once
+        if id(obj) in seen:
+            continue
+
+        seen.add(id(obj))
+
+        if isinstance(obj, (staticmethod, classmethod)):
+            obj = obj.__func__
+
+        if inspect.ismodule(obj):
+            # Only classes and functions defined in the module itself, not imported ones
+            pending.extend(value for value in vars(obj).values()
+                           if (inspect.isclass(value) or hasattr(value, '_argscheck_build')) and
+                           getattr(value, '__module__', None) == obj.__name__)
+        elif inspect.isclass(obj):
+            pending.extend(value for value in vars(obj).values()
+                           if inspect.isclass(value) or inspect.isfunction(value) or
+                           isinstance(value, (staticmethod, classmethod)))
+        elif hasattr(obj, '_argscheck_build'):
+            count += obj._argscheck_build()
+
+    return count
+
+
+def _check_default(checker, default, name, raise_on_error):
+    """
+    Check the default value of a parameter ahead of time. Return what checking it on each call would return, or
+    _missing if the result can not be reused across calls.
+    """
+
+    # A mutable default may be changed between calls
+    if not is_immutable(default):
+        return _missing
+
+    # The checker is already at the level of check_args(), check() would reduce it to the process-wide level instead
+    result = checker.check(name, default, raise_on_error=raise_on_error)
+
+    # Wrappers are consumed as they are used, and errors should be raised afresh on each call
+    if isinstance(result, Wrapper):
+        return _missing
+
+    passed, new_value = result
+
+    if not passed or not is_immutable(new_value):
+        return _missing
+
+    return new_value if raise_on_error else (True, new_value, default)
+
+
+def _make_checked_fn(fn, signature, checkers, raise_on_error, check_defaults_once, sample=None):
+    """
+    Generate a function with the same parameters as `fn`, that checks its arguments with `checkers` and then calls
+    `fn` with the checked values.
+
+    Unlike binding arguments with `signature.bind()`, each argument is already a local variable of the generated
+    function, so each checker can be called on it directly. Default values that were checked ahead of time are
+    replaced by a sentinel, which tells the generated function to use the checked default instead of checking again.
+
+    If `sample` is given, calls for which it returns False skip all checks but the type checks of arguments that are
+    converted, and pass the checked defaults and the converted arguments (with raise_on_error=False, as passing results)
+    on to `fn`.
+
+    With raise_on_error=True, the exact types of the arguments whose check depends on their type are remembered once all
+    checks pass. When a call's arguments have types that already passed, arguments whose check depends only on their
+    type (see Checker._type_only()) are not checked at all, and the others skip their top level type check.
+    """
+
+    # Names used by the generated code must not be shadowed by any of the parameters
+    prefix = '_argscheck'
+    while any(name.startswith(prefix) for name in signature.parameters):
+        prefix += '_'
+
+    # Builtins as well, a parameter may be named e.g. `type`
+    namespace = {f'{prefix}_fn': fn, f'{prefix}_Wrapper': Wrapper, f'{prefix}_missing': _missing,
+                 f'{prefix}_sample': sample, f'{prefix}_type': type, f'{prefix}_len': len,
+                 f'{prefix}_isinstance': isinstance}
+    parameters, call_args, call_kwargs, lines, unsampled_lines, known_types_lines, keyed = [], [], [], [], [], [], []
+    kinds = inspect.Parameter
+    parameter_kind = None
+
+    for i, (name, parameter) in enumerate(signature.parameters.items()):
+        kind = parameter.kind
+        checked_default = _missing
+
+        # Mark the end of positional-only parameters and the start of keyword-only parameters
+        if parameters and parameter_kind == kinds.POSITIONAL_ONLY and kind != kinds.POSITIONAL_ONLY:
+            parameters.append('/')
+        if kind == kinds.KEYWORD_ONLY and parameter_kind not in (kinds.KEYWORD_ONLY, kinds.VAR_POSITIONAL):
+            parameters.append('*')
+
+        parameter_kind = kind
+
+        if kind == kinds.VAR_POSITIONAL:
+            parameters.append(f'*{name}')
+            call_args.append(f'*{name}')
+        elif kind == kinds.VAR_KEYWORD:
+            parameters.append(f'**{name}')
+            call_kwargs.append(f'**{name}')
+        else:
+            if parameter.default is parameter.empty:
+                parameters.append(name)
+            else:
+                if check_defaults_once and name in checkers:
+                    checked_default = _check_default(checkers[name], parameter.default, name, raise_on_error)
+
+                if checked_default is _missing:
+                    namespace[f'{prefix}_default{i}'] = parameter.default
+                    parameters.append(f'{name}={prefix}_default{i}')
+                else:
+                    namespace[f'{prefix}_default{i}'] = checked_default
+                    parameters.append(f'{name}={prefix}_missing')
+
+            if kind == kinds.KEYWORD_ONLY:
+                call_kwargs.append(f'{name}={name}')
+            else:
+                call_args.append(name)
+
+        if name not in checkers:
+            continue
+
+        # An omitted argument takes the default value that was already checked
+        indent = ''
+        if checked_default is not _missing:
+            lines.append(f'if {name} is {prefix}_missing:')
+            lines.append(f'    {name} = {prefix}_default{i}')
+            lines.append('else:')
+            indent = '    '
+
+        # Unsampled calls pass arguments as-is (as if they passed their checks, with raise_on_error=False), except that
+        # omitted arguments still take the checked default, and arguments are still converted (e.g. None is replaced by
+        # a default value) by the checker at the TYPE level, so the function gets the same values either way
+        converter = checkers[name].at_level(Cost.TYPE) if sample is not None else None
+        converts = converter is not None and not converter._type_only()
+
+        if checked_default is not _missing:
+            unsampled_lines.append(f'if {name} is {prefix}_missing:')
+            unsampled_lines.append(f'    {name} = {prefix}_default{i}')
+
+            if converts or not raise_on_error:
+                unsampled_lines.append('else:')
+
+        if converts and raise_on_error:
+            namespace[f'{prefix}_convert{i}'] = converter._compile('raise')
+            unsampled_lines.append(f'{indent}{name} = {prefix}_convert{i}({name}, {name!r})')
+        elif converts:
+            namespace[f'{prefix}_convert{i}'] = converter._compile('check')
+            unsampled_lines.append(f'{indent}{prefix}_result = {prefix}_convert{i}({name!r}, {name}, '
+                                   f'raise_on_error=False)')
+            unsampled_lines.append(f'{indent}{name} = {prefix}_result if {prefix}_isinstance({prefix}_result, '
+                                   f'{prefix}_Wrapper) else ({prefix}_result[0], {prefix}_result[1], {name})')
+        elif not raise_on_error:
+            unsampled_lines.append(f'{indent}{name} = (True, {name}, {name})')
+
+        # Same as check(checker, name, value, raise_on_error), only with a compiled checker
+        if raise_on_error:
+            checker = checkers[name]
+            namespace[f'{prefix}_check{i}'] = checker._compile('raise')
+            lines.append(f'{indent}{name} = {prefix}_check{i}({name}, {name!r})')
+
+            # If the argument's type is known to pass, a type only check can be skipped, and a check that starts with a
+            # type check can skip just that. Otherwise, the argument is checked as usual
+            if checker._type_only():
+                keyed.append(name)
+                known_types_lines.extend(lines[-4:-2] if indent else [])
+            elif isinstance(checker, Typed) and object not in checker.types and _isinstance_by_type(checker.types) and \
+                    _Emitter.can_inline(checker):
+                keyed.append(name)
+                namespace[f'{prefix}_value{i}'] = checker._compile('raise', known_type=True)
+                known_types_lines.extend(lines[-4:-1] if indent else [])
+                known_types_lines.append(f'{indent}{name} = {prefix}_value{i}({name}, {name!r})')
+            else:
+                known_types_lines.extend(lines[-4:] if indent else lines[-1:])
+        else:
+            namespace[f'{prefix}_check{i}'] = checkers[name]._compile('check')
+            lines.append(f'{indent}{prefix}_result = {prefix}_check{i}({name!r}, {name}, raise_on_error=False)')
+            lines.append(f'{indent}{name} = {prefix}_result if {prefix}_isinstance({prefix}_result, {prefix}_Wrapper) '
+                         f'else ({prefix}_result[0], {prefix}_result[1], {name})')
+
+    if parameters and parameter_kind == kinds.POSITIONAL_ONLY:
+        parameters.append('/')
+
+    fn_name = getattr(fn, '__name__', '')
+    fn_name = fn_name if fn_name.isidentifier() else 'checked_fn'
+    call = f'return {prefix}_fn({", ".join(call_args + call_kwargs)})'
+
+    # Passed type signatures, no more are added once there are _max_type_signatures of them (so that e.g. a function
+    # that is called with values of ever new classes does not leak memory)
+    if keyed and any(checkers[name]._type_only() for name in keyed):
+        namespace[f'{prefix}_types'] = {}
+        key = f'{prefix}_type({keyed[0]})' if len(keyed) == 1 else \
+            f'({", ".join(f"{prefix}_type({name})" for name in keyed)})'
+        lines[:0] = [f'{prefix}_key = {key}', f'if {prefix}_key in {prefix}_types:']
+        lines[2:2] = [f'    {line}' for line in known_types_lines + [call]]
+        lines.append(f'if {prefix}_len({prefix}_types) < {_max_type_signatures}:')
+        lines.append(f'    {prefix}_types[{prefix}_key] = None')
+
+    lines.append(call)
+
+    if sample is not None:
+        lines[:0] = [f'if not {prefix}_sample():'] + [f'    {line}' for line in unsampled_lines + [call]]
+    source = f'def {fn_name}({", ".join(parameters)}):\n' + ''.join(f'    {line}\n' for line in lines)
+
+    return make_function(fn_name, source, namespace, f'check_args {fn_name}')
+
+
+def compile_checker(checker_like, raise_on_error=RAISE_ON_ERROR_DEFAULT):
+    """
+    Compile a checker-like into a function that performs the same check as :func:`.check`, only faster.
+
+    Normally, the checking logic of a checker is spread over several ``check()`` methods that call each other (one per
+    base class) and nested checkers (e.g. the items of a :class:`.Sequence`) are called through that same chain. Here,
+    all of these conditions are gathered into a single generated function, so a call costs little more than the
+    conditions themselves.
+
+    :param checker_like: *CheckerLike* – Describes the check performed by the returned function.
+    :param raise_on_error: *bool* - Same as in :func:`.check`.
+    :return: *Callable* - A function ``fn(value, name='')`` that behaves like ``check(checker_like, value, name,
+        raise_on_error)``.
+
+    :Example:
+
+    .. code-block:: python
+
+        from argscheck import compile_checker, Sequence, Float
+
+
+        check_weights = compile_checker(Sequence(0.0 <= Float, len_ge=1))
+
+        check_weights([0.1, 0.9])   # Passes, [0.1, 0.9] is returned
+        check_weights([0.1, -0.9])  # Fails, a ValueError is raised
+    """
+
+    if not isinstance(raise_on_error, bool):
+        class_name = raise_on_error.__class__.__name__
+
+        raise TypeError(f'compile_checker() expects that raise_on_error is bool, got {class_name} instead.')
+
+    checker = _resolve_checker_like(checker_like).at_level(_level)
+
+    if raise_on_error:
+        return checker._compile('raise')
+
+    fn = checker._compile('check')
+
+    def compiled_check(value, name=''):
+        result = fn(name, value, raise_on_error=False)
+
+        if isinstance(result, Wrapper):
+            return result
+
+        passed, new_value = result
+
+        return passed, new_value, value
+
+    return compiled_check
+
+
+def intern_checker(checker_like):
+    """
+    Return a canonical checker for a checker-like. Structurally equal checkers, i.e. checkers of the same class that
+    were created with equal arguments (see :meth:`Checker.structural_key`), are interned as the very same object. This
+    saves memory when the same checker is created in many places and lets such checkers share everything that is
+    derived from them, e.g. their compiled forms.
+
+    Checkers with unhashable arguments, such as ``Comparable(ne=[1, 2])``, can not be interned and are returned as-is.
+
+    Only checkers of the same class are unified. Shorthand classes are not normalized to their base class, so e.g.
+    ``NonNegativeInt()`` and ``Int(ge=0)`` are interned as two distinct checkers.
+
+    :param checker_like: *CheckerLike* – The checker-like to intern.
+    :return: *Checker*
+
+    :Example:
+
+    .. code-block:: python
+
+        from argscheck import intern_checker, Int, NonNegativeInt, Sequence
+
+
+        intern_checker(Int(ge=0)) is intern_checker(Int(ge=0))                      # True
+        intern_checker(Sequence(Int(ge=0))) is intern_checker(Sequence(Int(ge=0)))  # True
+        intern_checker(Int(ge=0)) is intern_checker(Int(ge=1))                      # False
+        intern_checker(Int(ge=0)) is intern_checker(NonNegativeInt())               # False
+    """
+
+    checker = _resolve_checker_like(checker_like)
+
+    try:
+        key = checker.structural_key()
+    except TypeError:
+        return checker
+
+    with _interned_lock:
+        interned = _interned.get(key)
+
+        if interned is not None:
+            return interned
+
+        _interned[key] = checker
+
+        return checker
+
+
+class _TypeKey:
+    """
+    Stands for a type in structural keys. Types can not be used directly, because == between checker classes is a
+    comparison shorthand (see _CheckerMeta) and not an actual comparison. Also used to key checker instances by identity
+    (see _shared_key()).
+    """
+
+    __slots__ = ('type',)
+
+    def __init__(self, type_):
+        self.type = type_
+
+    def __eq__(self, other):
+        return isinstance(other, _TypeKey) and self.type is other.type
+
+    def __hash__(self):
+        return id(self.type)
+
+
+def _structural_key(value):
+    """Return a hashable key for an attribute value of a checker, see Checker.structural_key()."""
+    if isinstance(value, type):
+        return _TypeKey(value)
+
+    if hasattr(type(value), 'structural_key'):
+        return value.structural_key()
+
+    # The type is part of the key, so e.g. 0, 0.0 and False are told apart, also when they are items of a tuple.
+    # Mutable values such as lists are deliberately not supported, a checker could not be shared if they may change
+    if isinstance(value, tuple):
+        return _TypeKey(type(value)), tuple(_structural_key(item) for item in value)
+
+    if isinstance(value, frozenset):
+        return _TypeKey(type(value)), frozenset(_structural_key(item) for item in value)
+
+    # Raises TypeError if value is not hashable
+    hash(value)
+
+    return _TypeKey(type(value)), value
+
+
+def _shared_key(value):
+    """
+    Same as _structural_key(), only faster for the arguments commonly passed to the class level shorthands. Checker
+    instances are keyed by identity (hashing their structural key is relatively slow), which is enough for nested
+    shorthands such as Optional[Set[str]], since the inner checker is itself shared.
+    """
+    # Checker classes and instances are compared with _TypeKey, since == between them is a shorthand, other types
+    # compare as usual
+    if isinstance(value, (_CheckerMeta, Checker)):
+        return _TypeKey(value)
+
+    if isinstance(value, type):
+        return value
+
+    if type(value) in (int, float, str, bool):
+        return type(value), value
+
+    return _structural_key(value)
+
+
+def validator(checker, name, raise_on_error=RAISE_ON_ERROR_DEFAULT, **kwargs):
+    """
+    Create a `validator <https://pydantic-docs.helpmanual.io/usage/validators/>`_ for a field in a
+    ``pydantic`` model. The validator will perform the checking and conversion by internally calling the
+    :func:`.check` function.
+
+    :param checker: *CheckerLike* - Describes the check that will be performed on the field.
+    :param name: *str* – Name of field for which validator is created.
+    :param raise_on_error: *bool* – See :func:`.check`.
+    :param kwargs: *Optional* – Passed to ``pydantic.validator`` as-is.
+
+    :Example:
+
+    .. code-block:: python
+
+        from typing import Any
+
+        from pydantic import BaseModel
+        from argscheck import validator, Optional
+
+
+        class UserModel(BaseModel):
+            items: Any
+            check_items = validator(Optional(dict, default_factory=dict), 'items')
+
+
+        UserModel(items={'a': 1, 'b': 2}).items  # Passes, {'a': 1, 'b': 2} is returned
+        UserModel(items=None).items              # Passes, {} is returned
+        UserModel(items=[1, 2]).items            # Fails, a TypeError is raised
+    """
+
+    import pydantic
+
+    return pydantic.validator(name, **kwargs)(lambda value: check(checker, value, name, raise_on_error=raise_on_error))
+
+
+def set_repr_limits(max_length=1000, max_items=20, max_level=4):
+    """
+    Set how much of the offending value is shown in the message of an error raised (or returned) by a failed check.
+    Larger values are truncated, so that formatting the error message remains cheap even if the value is a huge list
+    or a deeply nested dictionary. Calling this function without arguments restores the default limits.
+
+    :param max_length: *int* – Maximum number of characters used to represent the value.
+    :param max_items: *int* – Maximum number of items shown for each container (list, tuple, dict, set etc.).
+    :param max_level: *int* – Maximum nesting level of containers, deeper containers are replaced with ``...``.
+
+    :Example:
+
+    .. code-block:: python
+
+        from argscheck import check, set_repr_limits
+
+        set_repr_limits(max_items=3)
+
+        check(str, list(range(100)))  # Fails, error message shows "ACTUAL: [0, 1, 2, ...]"
+    """
+
+    for name, limit in [('max_length', max_length), ('max_items', max_items), ('max_level', max_level)]:
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 0:
+            raise TypeError(f'set_repr_limits() expects {name} to be a non-negative int, got {name}={limit!r}.')
+
+    global _value_repr
+
+    # The limits are replaced all at once, so that errors formatted concurrently never see them half-configured
+    _value_repr = BoundedRepr(max_length, max_items, max_level)
+
+
+def set_disabled(disabled=True):
+    """
+    Turn argument checking off (or back on) for the entire process. While it is off, :func:`.check` returns the value
+    as-is and :func:`.check_args` returns the decorated function unchanged, so argument checking costs nothing at all.
+    Other functions, e.g. :func:`.is_valid`, keep checking.
+
+    Functions decorated with :func:`.check_args` are not affected by later calls, so this must be called at startup,
+    before any of them is decorated (i.e. before the modules defining them are imported). Alternatively, set the
+    ``ARGSCHECK_DISABLE`` environment variable to ``1`` before ``argscheck`` is imported.
+
+    :param disabled: *bool* – Whether argument checking is turned off.
+
+    :Example:
+
+    .. code-block:: python
+
+        import argscheck
+
+        argscheck.set_disabled()
+
+        from my_package import convex_sum  # Decorated with @check_args, but its arguments are not checked
+    """
+
+    global _disabled
+
+    if not isinstance(disabled, bool):
+        raise TypeError(f'set_disabled() expects disabled to be a bool, got disabled={disabled!r}.')
+
+    _disabled = disabled
+
+
+def set_check_level(level=Cost.IO):
+    """
+    Set the highest cost tier (see :class:`.Cost`) of the checks that are performed, for the entire process. Checks of
+    higher tiers are skipped altogether, e.g. with ``Cost.VALUE``, :class:`.Sequence` checks the type and length of `x`,
+    but does not even iterate over its items. Conversions, such as the default value of :class:`.Optional`, are still
+    applied. Calling this function without arguments restores the default, which is to perform all checks.
+
+    The level applies to :func:`.check`, :func:`.check_many`, :func:`.check_parallel`, :func:`.is_valid` and
+    :func:`.compile_checker` on each call, and to :func:`.check_args` when the decorator is applied (unless it is given
+    a level of its own). Alternatively, set the ``ARGSCHECK_LEVEL`` environment variable (e.g. to ``VALUE``) before
+    ``argscheck`` is imported.
+
+    :param level: *Cost* – Highest cost tier of the checks that are performed.
+
+    :Example:
+
+    .. code-block:: python
+
+        from argscheck import check, set_check_level, Cost, Sequence, Int
+
+
+        set_check_level(Cost.VALUE)
+
+        check(Sequence(Int(ge=0), len_ge=1), [-1])  # Passes, the items are not checked
+        check(Sequence(Int(ge=0), len_ge=1), [])    # Fails, a ValueError is raised (length is less than 1)
+    """
+
+    global _level
+
+    _level = _validate_level(level, 'set_check_level()')
+
+
+def set_code_cache(directory=None):
+    """
+    Cache the code of compiled checkers (see :func:`.compile_checker`) and of functions decorated with
+    :func:`.check_args` on disk, in `directory`, so that processes that start over and over again (e.g. command line
+    tools) load the code instead of compiling it anew. Calling this function without arguments turns the cache off,
+    which is the default. Alternatively, set the ``ARGSCHECK_CODE_CACHE`` environment variable to the directory before
+    ``argscheck`` is imported.
+
+    Entries are keyed by the generated source code and the Python version, so they are never out of date, and the
+    directory may be shared by processes running concurrently. Since cached code is executed as-is, the directory must
+    only be writable by trusted users, just like the directories of ``.pyc`` files.
+
+    :param directory: *Optional[Union[str, os.PathLike]]* – Directory of the cache, created if it does not exist.
+
+    :Example:
+
+    .. code-block:: python
+
+        import argscheck
+
+        argscheck.set_code_cache('~/.cache/argscheck')
+
+        from my_package import convex_sum  # Decorated with @check_args, its code is loaded from the cache
+    """
+
+    if directory is not None and not isinstance(directory, (str, os.PathLike)):
+        raise TypeError(f'set_code_cache() expects directory to be a path (if present), got directory={directory!r}.')
+
+    set_code_cache_dir(directory)
+
+
+def _validate_level(level, caller):
+    if isinstance(level, bool) or not isinstance(level, int):
+        raise TypeError(f'{caller} expects level to be a Cost, got level={level!r} instead.')
+
+    if level not in set(Cost):
+        raise ValueError(f'{caller} expects level to be one of {", ".join(map(str, map(int, Cost)))}, got '
+                         f'level={level!r} instead.')
+
+    return Cost(level)
+
+
+class Wrapper:
+    """
+    Base class to identify deferred checkers i.e. checkers for which calling :func:`.check` with some value only returns
+    a wrapper around that value. Actual checking will be done as items are consumed from that wrapper.
+
+    :meta private:
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, item):
+        """Base class also provides the wrapping functionality. Looking up members looks up in the wrapped object if
+        they are not found on the Wrapper instance itself."""
+        # Avoid infinite recursion if the wrapped object is not set yet, e.g. while being copied
+        if item == 'wrapped':
+            raise AttributeError(item)
+
+        return getattr(self.wrapped, item)
+
+
+class _CheckError:
+    """
+    Mixin for the exceptions of failed checks, which formats the error message only once it is needed (e.g. when the
+    exception is printed). Many of these exceptions are never shown, e.g. those of the options that did not pass in a
+    :class:`.One` checker or those returned with `raise_on_error=False`.
+
+    The value's repr is taken when the exception is created (its cost is bounded, see :func:`.set_repr_limits`), so
+    the message shows the value as it was checked even if it is mutated later.
+
+    Exceptions are instances of a subclass of both this mixin and the requested exception type, so they can be caught
+    exactly as before. However, their type is not the requested type itself, i.e. `type(e) is ValueError` is False.
+
+    :meta private:
+    """
+
+    _types = {}
+
+    @classmethod
+    def create(cls, err_type, checker, name, value):
+        try:
+            error_type = cls._types[err_type]
+        except KeyError:
+            error_type = cls._types[err_type] = cls._make_type(err_type)
+
+        # Exception types that can not be subclassed get an eagerly formatted message
+        if error_type is None:
+            return err_type(checker._format_check_error(name, _value_repr.repr(value)))
+
+        error = error_type.__new__(error_type)
+        error._details = (checker, name, _value_repr.repr(value))
+
+        return error
+
+    @classmethod
+    def _make_type(cls, err_type):
+        if issubclass(err_type, cls):
+            return err_type
+
+        # Same name and module as err_type, so the exception is printed the same in tracebacks
+        attrs = {'__module__': err_type.__module__, '__qualname__': err_type.__qualname__}
+
+        try:
+            return type(err_type.__name__, (cls, err_type), attrs)
+        except TypeError:
+            return None
+
+    @property
+    def message(self):
+        try:
+            return self._message
+        except AttributeError:
+            checker, name, actual = self._details
+            self._message = checker._format_check_error(name, actual)
+
+            return self._message
+
+    @property
+    def args(self):
+        try:
+            return self._args
+        except AttributeError:
+            return (self.message,)
 
-    :Example:
+    @args.setter
+    def args(self, value):
+        self._args = tuple(value)
 
-    .. code-block:: python
+    def __str__(self):
+        args = self.args
 
-        from argscheck import check_args, Number, Float
+        return str(args[0]) if len(args) == 1 else str(args)
 
+    def __repr__(self):
+        args = self.args
+        args = f'({args[0]!r})' if len(args) == 1 else repr(args)
 
-        @check_args
-        def convex_sum(a: Number, b: Number, alpha: (0.0 <= Float) <= 1.0):
-            return alpha * a + (1.0 - alpha) * b
+        return type(self).__name__ + args
 
+    def __reduce__(self):
+        return _unpickle_check_error, (type(self).__mro__[2], self.args)
 
-        convex_sum(0, 2, 0.0)    # Passes, 2.0 is returned
-        convex_sum(0, 2, 1.1)    # Fails, a ValueError is raised (1.1 is greater than 1.0)
-        convex_sum(0, [2], 0.5)  # Fails, a TypeError is raised ([2] is not a number)
 
-    Just like with :func:`.check`, we may prefer to handle errors ourselves, in which case we can use the alternative
-    behaviour by passing a flag to the decorator.
+def _unpickle_check_error(err_type, args):
+    error = _CheckError.create(err_type, None, None, None)
+    error.args = args
 
-    :Example:
+    return error
 
-    .. code-block:: python
 
-        import logging
-        from argscheck import check_args, Number, Float
+class _ErrorSource(str):
+    """Source code of an expression evaluating to an exception, along with the name of that exception's type."""
 
+    def __new__(cls, source, err_type):
+        self = super().__new__(cls, source)
+        self.err_type = err_type
 
-        @check_args(raise_on_error=False)
-        def convex_sum(a: Number, b: Number, alpha: (0.0 <= Float) <= 1.0):
-            # Check a
-            passed, exception, a = a
-            if not passed:
-                logging.critical('Error in a=%s argument of convex_sum: %s', a, exception)
-                raise exception
+        return self
 
-            # Check b
-            passed, exception, b = b
-            if not passed:
-                logging.critical('Error in b=%s argument of convex_sum: %s', b, exception)
-                raise exception
 
-            # Check alpha
-            passed, exception, alpha = alpha
-            if not passed:
-                logging.critical('Error in alpha=%s argument of convex_sum: %s', alpha, exception)
-                raise exception
+class _Emitter:
+    """
+    Generates the source code of a single function that performs the same check as a checker tree, by letting each
+    checker emit its conditions inline (see ``Checker._emit()``) instead of calling down a chain of ``check()`` methods.
 
-            return alpha * a + (1.0 - alpha) * b
+    Two modes are supported:
 
+    * ``'check'`` - ``fn(name, value, **kwargs)`` returns ``(passed, value)``, same as ``Checker.check()``.
+    * ``'raise'`` - ``fn(value, name='')`` returns the (possibly converted) value or raises, same as :func:`.check`.
+    * ``'predicate'`` - ``fn(value)`` returns ``True`` or ``False``, same as :func:`.is_valid`. No errors are created,
+      conversions are skipped and deferred checkers raise ``NotImplementedError``.
 
-        convex_sum(0, 2, 0.0)    # Passes, 2.0 is returned
-        convex_sum(0, 2, 1.1)    # Fails, a ValueError is raised (1.1 is greater than 1.0)
-        convex_sum(0, [2], 0.5)  # Fails, a TypeError is raised ([2] is not a number)
+    With `known_type`, the type check of the top level checker itself is left out (see Checker._compile()).
+
+    :meta private:
     """
 
-    def decorator(fn):
-        checkers = {}
+    # CPython can not compile more than 20 statically nested blocks, so deeper checker trees are split into several
+    # generated functions
+    max_depth = 8
+
+    # Methods that implement checking logic, a checker can only be compiled if _emit() is implemented alongside them
+    checking_methods = ('check', '_get_items', '_check_items')
+
+    _can_inline = {}
+
+    def __init__(self, mode, known_type=False):
+        self.mode = mode
+        self.known_type = known_type
+        self.lines = []
+        self.namespace = {'Wrapper': Wrapper}
+        self.indent = 1
+        self.depth = 0
+        self.top = None
+        self.may_defer = False
+        self.handlers = []
+        self.on_defer = None
+        self._names = {}
+        self._count = 0
 
-        # Extract signature, iterate over parameters and create checkers from annotations
-        signature = inspect.signature(fn)
+    @classmethod
+    def can_inline(cls, checker):
+        """Whether all checking logic of `checker`'s class is implemented by _emit() methods."""
+        checker_type = type(checker)
+
+        try:
+            return cls._can_inline[checker_type]
+        except KeyError:
+            pass
+
+        can_inline = all('_emit' in vars(base) for base in checker_type.__mro__
+                         if any(method in vars(base) for method in cls.checking_methods))
+        cls._can_inline[checker_type] = can_inline
+
+        return can_inline
+
+    def compile(self, checker):
+        """Generate the function for `checker` and return it."""
+        self.top = checker
+        fn_name = 'check_' + type(checker).__name__
+
+        if self.mode == 'check':
+            self.lines.append(f'def {fn_name}(name, value, **kwargs):')
+        elif self.mode == 'raise':
+            self.lines.append(f'def {fn_name}(value, name=\'\'):')
+        else:
+            self.lines.append(f'def {fn_name}(value):')
 
-        for name, parameter in signature.parameters.items():
-            annotation = parameter.annotation
+        self.emit(checker, 'name' if self.converts else "''", 'value')
+        self.line({'check': 'return True, value', 'raise': 'return value', 'predicate': 'return True'}[self.mode])
 
-            # Skip parameters without annotations
-            if annotation is parameter.empty:
-                continue
+        fn = make_function(fn_name, '\n'.join(self.lines) + '\n', self.namespace, f'{self.mode} {checker!r}')
+        fn.may_defer = self.may_defer
 
-            checkers[name] = Checker.from_checker_likes(annotation, f'{fn.__name__}({name})')
+        return fn
 
-        # Build a function that performs argument checking, then, calls original function
-        @wraps(fn)
-        def checked_fn(*args, **kwargs):
-            # Bind arguments to parameters, so we can associate checkers with argument values
-            bound = signature.bind(*args, **kwargs)
-            bound.apply_defaults()
+    def emit(self, checker, name, value):
+        """Emit the conditions checked by `checker` on the variable named `value`."""
+        if self.depth < self.max_depth and self.can_inline(checker):
+            self.depth += 1
+            checker._emit(self, name, value)
+            self.depth -= 1
+        else:
+            self.call(checker, name, value)
+
+    @property
+    def converts(self):
+        """Whether the generated function returns the converted value (and a reason for failure), otherwise checkers
+        may skip their conversions and error reporting."""
+        return self.mode != 'predicate'
+
+    def call(self, checker, name, value):
+        """Emit a call to `checker` (instead of inlining its conditions), handle its result like the inlined
+        conditions would."""
+        if not self.converts and self.can_inline(checker):
+            with self.block(f'if not {self.const(checker._compile(self.mode), "fn")}({value}):'):
+                self.fail(None)
+
+            return
+
+        if self.can_inline(checker):
+            fn = checker._compile('check')
+            may_defer = fn.may_defer
+            callee = self.const(fn, 'fn')
+        else:
+            may_defer = True
+            callee = self.const(checker, 'checker') + '.check'
 
-            # Check each argument for which a checker was defined, then, call original function with checked values
-            for name, checker in checkers.items():
-                value = bound.arguments[name]
-                bound.arguments[name] = check(checker, value, name, raise_on_error=raise_on_error)
+        result, passed, new_value = self.var('result'), self.var('passed'), self.var('value')
+        self.line(f'{result} = {callee}({join(", ", [name, value, self.kwargs_for(checker)], on_empty="drop")})')
 
-            return fn(*bound.args, **bound.kwargs)
+        if may_defer:
+            with self.block(f'if isinstance({result}, Wrapper):'):
+                self.defer(result)
 
-        return checked_fn
+        self.line(f'{passed}, {new_value} = {result}')
 
-    if function is None:
-        # When applied like @check_args(...)
-        return decorator
-    else:
-        # When applied like @check_args
-        return decorator(function)
+        with self.block(f'if not {passed}:'):
+            self.fail(new_value)
 
+        self.line(f'{value} = {new_value}')
 
-def validator(checker, name, raise_on_error=RAISE_ON_ERROR_DEFAULT, **kwargs):
-    """
-    Create a `validator <https://pydantic-docs.helpmanual.io/usage/validators/>`_ for a field in a
-    ``pydantic`` model. The validator will perform the checking and conversion by internally calling the
-    :func:`.check` function.
+    def defer(self, wrapper):
+        """Emit the statement taken when a nested checker returns a wrapper instead of a result."""
+        if self.on_defer is not None:
+            self.line(f'raise NotImplementedError({self.const(self.on_defer, "msg")})')
+        elif not self.converts:
+            message = f'{self.top!r} contains deferred checkers, so it can not be used as a predicate.'
+            self.line(f'raise NotImplementedError({self.const(message, "msg")})')
+        else:
+            self.may_defer = True
+            self.line(f'return {wrapper}')
+
+    @contextmanager
+    def deferred(self, message):
+        """Within this context, nested checkers that return a wrapper raise NotImplementedError(message)."""
+        outer, self.on_defer = self.on_defer, message
+
+        try:
+            yield
+        finally:
+            self.on_defer = outer
+
+    @contextmanager
+    def handler(self, handler):
+        """Within this context, errors of failed checks are passed through handler(error) before being returned."""
+        self.handlers.append(handler)
+
+        try:
+            yield
+        finally:
+            self.handlers.pop()
+
+    def fail(self, error, in_except=False):
+        """Emit the statement taken when a check fails, `error` is an expression evaluating to the exception."""
+        if self.mode == 'predicate':
+            self.line('return False')
+
+            return
+
+        for handler in reversed(self.handlers):
+            error = handler(error)
+
+        if self.mode == 'check':
+            self.line(f'return False, {error}')
+        elif in_except:
+            self.line(f'raise {error} from None')
+        else:
+            self.line(f'raise {error}')
 
-    :param checker: *CheckerLike* - Describes the check that will be performed on the field.
-    :param name: *str* – Name of field for which validator is created.
-    :param raise_on_error: *bool* – See :func:`.check`.
-    :param kwargs: *Optional* – Passed to ``pydantic.validator`` as-is.
+    def error(self, checker, err_type, name, value):
+        """Return an expression that evaluates to checker._make_check_error(err_type, name, value). `err_type` is either
+        an exception type or an expression that evaluates to one."""
+        err_type = getattr(err_type, '__name__', err_type)
+        error = f'{self.const(checker, "checker")}._make_check_error({err_type}, {name}, {value})'
 
-    :Example:
+        return _ErrorSource(error, err_type)
 
-    .. code-block:: python
+    def exception(self, err_type, message):
+        """Return an expression that evaluates to err_type(message), `message` is an expression as well."""
+        return _ErrorSource(f'{err_type.__name__}({message})', err_type.__name__)
 
-        from typing import Any
+    @staticmethod
+    def error_type(error):
+        """Return an expression that evaluates to the type of the `error` expression, without evaluating it if the type
+        is statically known."""
+        return getattr(error, 'err_type', None) or f'type({error})'
 
-        from pydantic import BaseModel
-        from argscheck import validator, Optional
+    def kwargs_for(self, checker):
+        """Keyword arguments passed to checker-level calls. Like with check(), only the top level checker gets them."""
+        if checker is not self.top or not self.converts:
+            return ''
 
+        return '**kwargs' if self.mode == 'check' else 'raise_on_error=True'
 
-        class UserModel(BaseModel):
-            items: Any
-            check_items = validator(Optional(dict, default_factory=dict), 'items')
+    def const(self, obj, hint='const'):
+        """Return a name by which `obj` can be referenced from the generated code."""
+        try:
+            return self._names[id(obj)]
+        except KeyError:
+            name = self._names[id(obj)] = self.var(hint)
+            self.namespace[name] = obj
 
+            return name
 
-        UserModel(items={'a': 1, 'b': 2}).items  # Passes, {'a': 1, 'b': 2} is returned
-        UserModel(items=None).items              # Passes, {} is returned
-        UserModel(items=[1, 2]).items            # Fails, a TypeError is raised
-    """
+    def var(self, hint='var'):
+        """Return a new unique variable name."""
+        self._count += 1
 
-    import pydantic
+        return f'_{hint}{self._count}'
 
-    return pydantic.validator(name, **kwargs)(lambda value: check(checker, value, name, raise_on_error=raise_on_error))
+    def name_var(self, name):
+        """Make sure that the `name` expression is evaluated only once by storing it in a variable."""
+        if name.isidentifier():
+            return name
 
+        var = self.var('name')
+        self.line(f'{var} = {name}')
 
-class Wrapper:
-    """
-    Base class to identify deferred checkers i.e. checkers for which calling :func:`.check` with some value only returns
-    a wrapper around that value. Actual checking will be done as items are consumed from that wrapper.
+        return var
 
-    :meta private:
-    """
+    def line(self, code):
+        self.lines.append('    ' * self.indent + code)
 
-    def __getattr__(self, item):
-        """Base class also provides the wrapping functionality. Looking up members looks up in the wrapped object if
-        they are not found on the Wrapper instance itself."""
-        return getattr(self.wrapped, item)
+    @contextmanager
+    def block(self, header):
+        self.line(header)
+        self.indent += 1
+        length = len(self.lines)
+
+        try:
+            yield
+        finally:
+            if len(self.lines) == length:
+                self.line('pass')
+
+            self.indent -= 1
 
 
 class _CheckerMeta(type):
@@ -247,7 +1552,12 @@ class _CheckerMeta(type):
     """
 
     def __new__(mcs, name, bases, attrs, types=(object,), **kwargs):
-        # __new__ is only defined to consume `types` so it does not get passed to `type.__new__`.
+        # Checkers of this package that do not declare their own attributes do not need a per-instance __dict__ (see
+        # Checker.__slots__). Subclasses defined elsewhere keep their __dict__, so they can set any attribute they need
+        if attrs.get('__module__', '').startswith(__package__ + '.'):
+            attrs.setdefault('__slots__', ())
+
+        # __new__ is also defined to consume `types` so it does not get passed to `type.__new__`.
         # Otherwise, an exception is thrown: TypeError: __init_subclass__() takes no keyword arguments
         return super().__new__(mcs, name, bases, attrs, **kwargs)
 
@@ -259,44 +1569,96 @@ class _CheckerMeta(type):
         if not isinstance(types, tuple) or not all(isinstance(type_, type) for type_ in types):
             raise TypeError(f'`types` must be a tuple of types, got {types} instead.')
 
-        cls.types = types
+        cls._class_types = types
 
         # Extend the class docstring by gathering parameters from all of its base classes
         extend_docstring(cls)
 
+    def __call__(cls, *args, **kwargs):
+        checker = super().__call__(*args, **kwargs)
+
+        # Checkers can not be modified once constructed, see Checker.__setattr__()
+        object.__setattr__(checker, '_frozen', True)
+
+        return checker
+
+    # Defining __eq__ below would otherwise make checker classes unhashable, and they need to be hashable in order to be
+    # used as cache keys (see check())
+    __hash__ = type.__hash__
+
     def __getitem__(cls, item):
         """This allows instantiation of checker objects in a typing style e.g.
         Optional[Set[str]] instead of Optional(Set(str)). With this method however, it is not possible to pass any
         named arguments."""
 
         if isinstance(item, tuple):
-            return cls(*item)
+            return cls._shared(item, None)
         else:
-            return cls(item)
+            return cls._shared((item,), None)
+
+    def _shared(cls, args, name):
+        """
+        Return cls(*args) if `name` is None, or else cls(**{name: args[0]}). Since checkers are immutable, a checker
+        constructed earlier from equal arguments is returned if there is one, so that e.g. check(List[int], x) in a loop
+        constructs (and compiles) a single checker.
+        """
+
+        # Checkers constructed from unhashable arguments are not shared. The entry keeps cls alive (through the
+        # checker), so its id can not be reused by another class while the entry exists
+        try:
+            key = id(cls), name, tuple(map(_shared_key, args))
+            checker = _shared_checkers.get(key)
+        except TypeError:
+            return cls(*args) if name is None else cls(**{name: args[0]})
+
+        if checker is None:
+            checker = cls(*args) if name is None else cls(**{name: args[0]})
+            _shared_checkers.set(key, checker)
+
+        return checker
 
     """
     Comparison methods used for cleaner instantiation of Comparable subclasses e.g. Number < 3 instead of Number() < 3.
     """
 
     def __lt__(cls, other):
-        return cls(lt=other)
+        return cls._shared((other,), 'lt')
 
     def __gt__(cls, other):
-        return cls(gt=other)
+        return cls._shared((other,), 'gt')
 
     def __le__(cls, other):
-        return cls(le=other)
+        return cls._shared((other,), 'le')
 
     def __ge__(cls, other):
-        return cls(ge=other)
+        return cls._shared((other,), 'ge')
 
     def __ne__(cls, other):
-        return cls(ne=other)
+        return cls._shared((other,), 'ne')
 
     # Workaround: when building sphinx docs, CheckerMeta.__eq__ gets called and breaks the build
     if 'sphinx' not in sys.modules:
         def __eq__(cls, other):
-            return cls(eq=other)
+            return cls._shared((other,), 'eq')
+
+
+class _Types:
+    """
+    Descriptor for the `types` attribute. On a checker class, it is the `types` class argument (see _CheckerMeta), on a
+    checker instance it is the same, unless it was set on the instance itself (see Typed).
+    """
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return owner._class_types
+
+        try:
+            return obj._types
+        except AttributeError:
+            return type(obj)._class_types
+
+    def __set__(self, obj, value):
+        obj._types = value
 
 
 class Checker(metaclass=_CheckerMeta):
@@ -306,9 +1668,74 @@ class Checker(metaclass=_CheckerMeta):
     :meta private:
     """
 
+    # Checkers are laid out in __slots__ instead of a per-instance __dict__, which makes them considerably smaller.
+    # Attributes of mixins that are combined with Comparable (i.e. Sized and Collection) are declared here, because
+    # only one of the bases of a class can add slots of its own
+    __slots__ = ('_types', 'len_checker', 'iterable', '_compiled', '_expected_cache', '_key', '_at_levels', '_frozen',
+                 '__weakref__')
+
+    # Slots that are derived from other attributes, and so are not part of the structural key
+    _unkeyed = ('_compiled', '_expected_cache', '_key', '_at_levels', '_frozen', '__weakref__')
+
+    # Slots that are computed on demand, and so may be set after the checker is frozen
+    _caches = ('_compiled', '_expected_cache', '_key', '_at_levels')
+
+    types = _Types()
+
     def __repr__(self):
         return type(self).__qualname__
 
+    def __setattr__(self, name, value):
+        # Checkers are immutable once constructed, so they can be shared freely, e.g. between threads
+        if name not in self._caches and getattr(self, '_frozen', False):
+            raise AttributeError(f'{self!r} is immutable, can not set attribute {name!r}.')
+
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f'{self!r} is immutable, can not delete attribute {name!r}.')
+
+        super().__delattr__(name)
+
+    def __getstate__(self):
+        # Caches are not part of the state, they are recomputed when needed (generated functions can not be pickled)
+        skipped = self._caches + ('_frozen', '__weakref__')
+        slots = [name for base in type(self).__mro__ for name in vars(base).get('__slots__', ())]
+        state = {name: getattr(self, name) for name in slots if name not in skipped and hasattr(self, name)}
+
+        # Checkers defined outside of this package may also have a __dict__
+        if hasattr(self, '__dict__'):
+            state.update(vars(self))
+
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+        object.__setattr__(self, '_frozen', True)
+
+    def _replace(self, **changes):
+        """
+        Return a new checker with the same attributes as this one, except for `changes`, which are set (and validated)
+        like in __init__(). This is how "modified" checkers are created, since checkers themselves are immutable.
+
+        :meta private:
+        """
+
+        clone = object.__new__(type(self))
+
+        for name, value in self.__getstate__().items():
+            object.__setattr__(clone, name, value)
+
+        for name, value in changes.items():
+            setattr(clone, name, value)
+
+        object.__setattr__(clone, '_frozen', True)
+
+        return clone
+
     @classmethod
     def from_checker_likes(cls, value, name='args'):
         """
@@ -365,6 +1792,93 @@ class Checker(metaclass=_CheckerMeta):
 
         return []
 
+    def accepts(self, value):
+        """
+        Same as :func:`.is_valid` with this checker.
+
+        :param value: *Any* - The value being checked.
+        :return: *bool*
+        """
+
+        return self._compile('predicate')(value)
+
+    def at_level(self, level):
+        """
+        Return a checker that performs only the checks of this checker whose cost tier is at most `level`, see
+        :func:`.set_check_level`. If there are no such checks, the checker itself is returned.
+
+        :param level: *Cost* – Highest cost tier of the checks performed by the returned checker.
+        :return: *Checker*
+        """
+
+        if level is Cost.IO:
+            return self
+
+        try:
+            at_levels = self._at_levels
+        except AttributeError:
+            at_levels = self._at_levels = {}
+
+        try:
+            return at_levels[level]
+        except KeyError:
+            pass
+
+        changes = self._level_changes(Cost(level))
+        checker = at_levels[level] = self._replace(**changes) if changes else self
+
+        return checker
+
+    def cost(self):
+        """
+        Return the cost tier of the most expensive check performed by this checker (including its nested checkers).
+
+        :return: *Cost*
+        """
+
+        return next(level for level in Cost if self.at_level(level) is self)
+
+    def _type_only(self):
+        """
+        Whether the outcome of the check depends on nothing but the exact type of the checked value, and a value that
+        passes is returned as-is. Then, once a value of some type passes, all values of that type pass.
+
+        The _type_only() method works by cooperative inheritance, and this here is the end of the super() calls chain.
+        Checkers whose checking logic is not (entirely) known, i.e. can not be compiled, are never type only.
+
+        :meta private:
+        """
+
+        return _Emitter.can_inline(self)
+
+    def _level_changes(self, level):
+        """
+        Return the attribute changes that drop the checks above `level` from this checker, see at_level().
+
+        The _level_changes() method works by cooperative inheritance, and this here is the end of the super() calls
+        chain, which only replaces nested checkers with their counterparts at `level`.
+
+        :meta private:
+        """
+
+        changes = {}
+
+        for name in self._keyed_slots():
+            value = getattr(self, name, None)
+
+            if isinstance(value, Checker):
+                reduced = value.at_level(level)
+            elif isinstance(value, tuple) and any(isinstance(item, Checker) for item in value):
+                reduced = tuple(item.at_level(level) if isinstance(item, Checker) else item for item in value)
+                reduced = value if all(map(operator.is_, reduced, value)) else reduced
+            else:
+                continue
+
+            if reduced is not value:
+                changes[name] = reduced
+
+        return changes
+
     def check(self, name, value, **kwargs):
         """
         The main method of the Checker class, does the actual argument checking.
@@ -386,6 +1900,118 @@ class Checker(metaclass=_CheckerMeta):
 
         return True, value
 
+    def _emit(self, gen, name, value):
+        """
+        Emit source code that checks the same conditions as the check() method into a generated function.
+
+        The _emit() method works by cooperative inheritance just like check(), and this here is the end of the super()
+        calls chain.
+
+        :param gen: *_Emitter* - Emitter of the generated function.
+        :param name: *str* - Expression that evaluates to the name of the argument being checked.
+        :param value: *str* - Name of the variable holding the value being checked, conversions assign to it.
+
+        :meta private:
+        """
+
+        pass
+
+    def structural_key(self):
+        """
+        Return a hashable key that is equal for checkers that perform the same check, i.e. checkers of the same class
+        whose attributes (types, comparison bounds, item checkers, regex pattern, suffixes, default values etc.) are
+        equal. Unlike ``==``, which is used for the comparison shorthands, this key can be used to look up checkers in a
+        dict. See also :func:`.intern_checker`.
+
+        :return: *Hashable*
+        :raise: TypeError. If any of the checker's attributes is not hashable.
+        """
+
+        try:
+            return self._key
+        except AttributeError:
+            pass
+
+        items = [(name, _structural_key(getattr(self, name))) for name in self._keyed_slots() if hasattr(self, name)]
+
+        # Checkers defined outside of this package may also have a __dict__
+        if hasattr(self, '__dict__'):
+            items += sorted((name, _structural_key(value)) for name, value in vars(self).items())
+
+        key = self._key = (_TypeKey(type(self)), tuple(items))
+
+        return key
+
+    @classmethod
+    def _keyed_slots(cls):
+        try:
+            return cls.__dict__['_keyed_slots_cache']
+        except KeyError:
+            slots = [name for base in reversed(cls.__mro__) for name in vars(base).get('__slots__', ())]
+            unkeyed = {name for base in cls.__mro__ for name in vars(base).get('_unkeyed', ())}
+            keyed_slots = tuple(name for name in slots if name not in unkeyed)
+            cls._keyed_slots_cache = keyed_slots
+
+            return keyed_slots
+
+    def _volatile(self):
+        """
+        Whether the check may give a different result for the same value at different times, e.g. because it depends on
+        the file system. A checker is volatile if any of its nested checkers is.
+
+        :meta private:
+        """
+
+        for name in self._keyed_slots():
+            value = getattr(self, name, None)
+            checkers = value if isinstance(value, tuple) else (value,)
+
+            if any(isinstance(checker, Checker) and checker._volatile() for checker in checkers):
+                return True
+
+        return False
+
+    def _compile(self, mode='check', known_type=False):
+        """
+        Return a function generated from this checker, see _Emitter for the supported modes. Generated functions are
+        cached per checker, and shared between structurally equal checkers.
+
+        With `known_type`, the generated function skips the checker's own type check (see Typed), i.e. it may only be
+        called on values of a type that is already known to pass it.
+
+        :meta private:
+        """
+
+        try:
+            compiled = self._compiled
+        except AttributeError:
+            compiled = self._compiled = {}
+
+        variant = (mode, 'known_type') if known_type else mode
+
+        try:
+            return compiled[variant]
+        except KeyError:
+            pass
+
+        try:
+            key = self.structural_key(), variant
+        except TypeError:
+            key = None
+
+        with _compile_lock:
+            fn = None if key is None else _compiled_fns.get(key)
+
+            if fn is None:
+                fn = _Emitter(mode, known_type).compile(self)
+
+                if key is not None:
+                    _compiled_fns[key] = fn
+
+        compiled[variant] = fn
+
+        return fn
+
     def _assert_not_in_kwargs(self, *names, **kwargs):
         """
         Utility method for validating kwargs argument of calls to check method.
@@ -411,12 +2037,42 @@ class Checker(metaclass=_CheckerMeta):
         self._raise_init_error(ValueError, desc, *args, **kwargs)
 
     def _make_check_error(self, err_type, name, value):
+        # The error message is only formatted if and when it is needed
+        return _CheckError.create(err_type, self, name, value)
+
+    def _format_check_error(self, name, actual):
         title = join(' ', ['encountered an error while checking', name], on_empty='drop') + ':'
-        actual = f'ACTUAL: {value!r}'
-        expected = 'EXPECTED: ' + join(", ", self.expected(), on_empty="drop")
-        err_msg = '\n'.join([title, actual, expected])
+        actual = f'ACTUAL: {actual}'
+        expected = 'EXPECTED: ' + join(", ", self._expected(), on_empty="drop")
+
+        return '\n'.join([title, actual, expected])
+
+    def _expected(self):
+        """
+        Same as expected(), but computed only once per checker.
+
+        :meta private:
+        """
+
+        try:
+            return self._expected_cache
+        except AttributeError:
+            expected = self._expected_cache = self.expected()
+
+            return expected
+
+
+def _isinstance_by_type(types):
+    """Whether isinstance(value, types) depends on nothing but the type of value. It may also depend on the value itself
+    for protocols (whose members are looked up on the value) and for types whose metaclass customizes isinstance()."""
+    for type_ in types:
+        if getattr(type_, '_is_protocol', False):
+            return False
 
-        return err_type(err_msg)
+        if type(type_).__instancecheck__ not in (type.__instancecheck__, abc.ABCMeta.__instancecheck__):
+            return False
+
+    return True
 
 
 class Typed(Checker):
@@ -463,6 +2119,21 @@ class Typed(Checker):
         else:
             return False, self._make_check_error(TypeError, name, value)
 
+    def _emit(self, gen, name, value):
+        super()._emit(gen, name, value)
+
+        # Everything is an instance of object, and the type of the top level value may be known to pass already
+        if object in self.types or gen.known_type and self is gen.top:
+            return
+
+        types = gen.const(self.types[0] if len(self.types) == 1 else self.types, 'types')
+
+        with gen.block(f'if not isinstance({value}, {types}):'):
+            gen.fail(gen.error(self, TypeError, name, value))
+
+    def _type_only(self):
+        return super()._type_only() and _isinstance_by_type(self.types)
+
     def expected(self):
         types = ', '.join(map(repr, self.types))
         types = f'({types})' if len(self.types) > 1 else types
@@ -490,6 +2161,9 @@ class One(Checker):
         # Can also be used with a shorthand initialization
         check((list, tuple), [])  # Passes, [] is returned
     """
+
+    __slots__ = ('checkers',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(**kwargs)
 
@@ -506,7 +2180,7 @@ class One(Checker):
             others.append(Typed(*types))
 
         # Validate checker-like positional arguments
-        self.checkers = [Checker.from_checker_likes(other, name=f'args[{i}]') for i, other in enumerate(others)]
+        self.checkers = tuple(Checker.from_checker_likes(other, name=f'args[{i}]') for i, other in enumerate(others))
 
     def check(self, name, value, **kwargs):
         passed, value = super().check(name, value)
@@ -534,9 +2208,57 @@ class One(Checker):
         else:
             return False, self._make_check_error(Exception, name, value)
 
+    def _emit(self, gen, name, value):
+        super()._emit(gen, name, value)
+
+        count, ret_value = gen.var('count'), gen.var('value')
+        gen.line(f'{count} = 0')
+
+        # Each checker is compiled into a function of its own, because all of them must be applied to value
+        for checker in self.checkers:
+            if not gen.converts:
+                with gen.block(f'if {gen.const(checker._compile(gen.mode), "fn")}({value}):'):
+                    gen.line(f'{count} += 1')
+
+                continue
+
+            fn = checker._compile('check')
+            result = gen.var('result')
+            gen.line(f'{result} = {gen.const(fn, "fn")}({name}, {value})')
+
+            if fn.may_defer:
+                err_msg = f'{self!r} does not support nesting deferred checkers such as {checker!r}.'
+
+                with gen.block(f'if isinstance({result}, Wrapper):'):
+                    gen.line(f'raise NotImplementedError({gen.const(err_msg, "msg")})')
+
+            with gen.block(f'if {result}[0]:'):
+                gen.line(f'{count} += 1')
+                gen.line(f'{ret_value} = {result}[1]')
+
+        with gen.block(f'if {count} != 1:'):
+            gen.fail(gen.error(self, Exception, name, value))
+
+        if gen.converts:
+            gen.line(f'{value} = {ret_value}')
+
+    def _level_changes(self, level):
+        # The options are always checked in full, since dropping some of their checks could make more than one of them
+        # pass, i.e. turn a valid value into an error
+        changes = super()._level_changes(level)
+        changes.pop('checkers', None)
+
+        return changes
+
+    def cost(self):
+        return max(super().cost(), *(checker.cost() for checker in self.checkers))
+
+    def _type_only(self):
+        return super()._type_only() and all(checker._type_only() for checker in self.checkers)
+
     def expected(self):
         indent = ' ' * len('EXPECTED: ')
-        options = [', '.join(checker.expected()) for checker in self.checkers]
+        options = [join(', ', checker._expected(), on_empty='drop') for checker in self.checkers]
         options = [f'{indent}{i}. {option}' for i, option in enumerate(options, start=1)]
         expected = 'exactly one of the following:\n' + '\n'.join(options)
 
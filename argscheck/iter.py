@@ -39,7 +39,7 @@ See examples for :class:`.Iterator` and :class:`.Iterable`.
        e.g. ``Collection(Iterable(int))`` is not supported (but ``Iterable(Collection(int))`` is supported).
 """
 
-from .core import check, Checker, Wrapper, RAISE_ON_ERROR_DEFAULT
+from .core import check, Checker, Wrapper, Cost, RAISE_ON_ERROR_DEFAULT
 
 
 class Iterator(Checker):
@@ -64,6 +64,8 @@ class Iterator(Checker):
 
     """
 
+    __slots__ = ('item_checker',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(**kwargs)
 
@@ -78,6 +80,19 @@ class Iterator(Checker):
 
         return _IteratorWrapper(self.item_checker, value, 'item {} from ' + name, **kwargs)
 
+    def _type_only(self):
+        # A wrapper is returned instead of the value
+        return False
+
+    def _level_changes(self, level):
+        changes = super()._level_changes(level)
+
+        # Checking the items is dropped below the ITEMS tier
+        if level < Cost.ITEMS and self.item_checker is not None:
+            changes['item_checker'] = None
+
+        return changes
+
 
 class Iterable(Checker):
     """
@@ -97,6 +112,8 @@ class Iterable(Checker):
             print(item)     # prints "a\\n", "True\\n", then raises TypeError (1.1 is not an str or bool).
 
     """
+    __slots__ = ('item_checker',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(**kwargs)
 
@@ -111,8 +128,23 @@ class Iterable(Checker):
 
         return _IterableWrapper(self.item_checker, value, 'item {} from ' + name, **kwargs)
 
+    def _type_only(self):
+        # A wrapper is returned instead of the value
+        return False
+
+    def _level_changes(self, level):
+        changes = super()._level_changes(level)
+
+        # Checking the items is dropped below the ITEMS tier
+        if level < Cost.ITEMS and self.item_checker is not None:
+            changes['item_checker'] = None
+
+        return changes
+
 
 class _IteratorWrapper(Wrapper):
+    __slots__ = ('checker', 'wrapped', 'name', 'raise_on_error', 'i')
+
     def __init__(self, checker, wrapped, name, raise_on_error=RAISE_ON_ERROR_DEFAULT):
         self.checker = checker
         self.wrapped = wrapped
@@ -144,6 +176,8 @@ class _IteratorWrapper(Wrapper):
 
 
 class _IterableWrapper(Wrapper):
+    __slots__ = ('checker', 'wrapped', 'name', 'raise_on_error')
+
     def __init__(self, checker, wrapped, name, raise_on_error=RAISE_ON_ERROR_DEFAULT):
         self.checker = checker
         self.wrapped = wrapped
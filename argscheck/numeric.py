@@ -7,6 +7,7 @@ This page documents checkers for numeric arguments, as well as for sized argumen
 
 from .core import Checker, Typed
 from . import Comparable
+from .utils import join
 
 
 _ints = (int,)
@@ -280,9 +281,30 @@ class Sized(Checker):
 
         return True, value
 
+    def _emit(self, gen, name, value):
+        super()._emit(gen, name, value)
+
+        length = gen.var('length')
+
+        with gen.block('try:'):
+            gen.line(f'{length} = len({value})')
+
+        with gen.block('except TypeError:'):
+            gen.fail(gen.error(self, TypeError, name, value), in_except=True)
+
+        # A length is always an int, so only the comparisons of self.len_checker are needed
+        for comparator in self.len_checker._comparators():
+            with gen.block(f'if not {comparator.source(length, gen.const(comparator.other, "other"))}:'):
+                gen.fail(gen.error(self, ValueError, name, value))
+
+    def _type_only(self):
+        # The length depends on the value
+        return False
+
     def expected(self):
-        s = self.len_checker.expected()
-        s = 'has length ' + ', '.join(s[1:])  # [1:] to discard "an instance of <class 'int'>" that comes from Int
+        s = self.len_checker._expected()
+        s = join(', ', s[1:], on_empty='drop')  # [1:] to discard "an instance of <class 'int'>" that comes from Int
+        s = 'has length ' + s if s else ''
 
         return super().expected() + [s]
 
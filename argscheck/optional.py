@@ -5,13 +5,28 @@ Optional
 This page documents the :class:`.Optional` checker.
 """
 
-from .core import Checker, Wrapper
+from .core import Checker, Wrapper, _structural_key
 from .utils import Sentinel
 
 
 _missing = Sentinel('<MISSING>')
 
 
+class _Constant:
+    """A default factory that always returns the same value."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self):
+        return self.value
+
+    def structural_key(self):
+        return _structural_key(_Constant), _structural_key(self.value)
+
+
 class Optional(Checker):
     """
     Check if `x` is `None` or something else, similarly to `typing.Optional`.
@@ -39,6 +54,8 @@ class Optional(Checker):
         check(checker, "string")   # Fails, a TypeError is raised
     """
 
+    __slots__ = ('checker', 'default_factory', 'sentinel')
+
     def __init__(self, *args, default_value=_missing, default_factory=_missing, sentinel=None, **kwargs):
         super().__init__(**kwargs)
 
@@ -58,9 +75,9 @@ class Optional(Checker):
         if default_factory is not _missing:
             self.default_factory = default_factory
         elif default_value is not _missing:
-            self.default_factory = lambda: default_value
+            self.default_factory = _Constant(default_value)
         else:
-            self.default_factory = lambda: sentinel
+            self.default_factory = _Constant(sentinel)
 
         self.sentinel = sentinel
 
@@ -85,5 +102,40 @@ class Optional(Checker):
             else:
                 return False, self._make_check_error(type(value_), name, value)
 
+    def _emit(self, gen, name, value):
+        super()._emit(gen, name, value)
+
+        sentinel = 'None' if self.sentinel is None else gen.const(self.sentinel, 'sentinel')
+
+        # A missing value always passes, there is no need to create the default value if it is not returned
+        if not gen.converts:
+            with gen.block(f'if {value} is not {sentinel}:'):
+                gen.emit(self.checker, name, value)
+
+            return
+
+        with gen.block(f'if {value} is {sentinel}:'):
+            # A constant default value is used as-is, instead of being returned from a factory
+            if isinstance(self.default_factory, _Constant):
+                gen.line(f'{value} = {gen.const(self.default_factory.value, "default")}')
+            else:
+                gen.line(f'{value} = {gen.const(self.default_factory, "factory")}()')
+
+        # The inner checker is applied to a copy of value, so errors can be reported in terms of the original value
+        with gen.block('else:'):
+            inner = gen.var('value')
+            gen.line(f'{inner} = {value}')
+
+            with gen.handler(lambda error: gen.error(self, gen.error_type(error), name, value)):
+                gen.emit(self.checker, name, inner)
+
+            gen.line(f'{value} = {inner}')
+
+    def _type_only(self):
+        # Only None is told apart by its type, and it must be returned as-is
+        constant = isinstance(self.default_factory, _Constant) and self.default_factory.value is self.sentinel
+
+        return super()._type_only() and self.sentinel is None and constant and self.checker._type_only()
+
     def expected(self):
-        return super().expected() + ['missing or'] + self.checker.expected()
+        return super().expected() + ['missing or'] + self.checker._expected()
@@ -9,7 +9,7 @@ import re
 from pathlib import Path
 
 from .utils import join
-from .core import Typed
+from .core import Typed, Cost
 
 
 class PathLike(Typed):
@@ -28,6 +28,8 @@ class PathLike(Typed):
     :param as_str: *bool* – If `True`, `x` will be converted to `str` before it is returned.
     :param as_path: *bool* – If `True`, `x` will be converted to `pathlib.Path` before it is returned.
     """
+    __slots__ = ('is_dir', 'is_file', 'as_str', 'as_path', 'suffix')
+
     def __init__(self, is_dir=False, is_file=False, suffix=None, suffixes=None, ignore_suffix_case=True, as_str=False,
                  as_path=False, **kwargs):
         super().__init__(str, Path, **kwargs)
@@ -76,6 +78,57 @@ class PathLike(Typed):
         else:
             return True, value
 
+    def _emit(self, gen, name, value):
+        super()._emit(gen, name, value)
+
+        # Path(value) is only needed by some of the checks and conversions
+        if not (self.is_dir or self.is_file or self.suffix.is_provided() or self.as_path and gen.converts):
+            if self.as_str and gen.converts:
+                gen.line(f'{value} = str({value})')
+
+            return
+
+        path = gen.var('path')
+        gen.line(f'{path} = {gen.const(Path, "Path")}({value})')
+
+        if self.is_dir:
+            with gen.block(f'if not {path}.is_dir():'):
+                gen.fail(gen.error(self, ValueError, name, value))
+
+        if self.is_file:
+            with gen.block(f'if not {path}.is_file():'):
+                gen.fail(gen.error(self, ValueError, name, value))
+
+        if self.suffix.is_provided():
+            with gen.block(f'if not {gen.const(self.suffix, "suffix")}({name}, {path}):'):
+                gen.fail(gen.error(self, ValueError, name, value))
+
+        if not gen.converts:
+            pass
+        elif self.as_path:
+            gen.line(f'{value} = {path}')
+        elif self.as_str:
+            gen.line(f'{value} = str({value})')
+
+    def _volatile(self):
+        return self.is_dir or self.is_file or super()._volatile()
+
+    def _type_only(self):
+        # Suffixes, and whether the path exists, depend on the value
+        return False
+
+    def _level_changes(self, level):
+        changes = super()._level_changes(level)
+
+        # Checking the file system is dropped below the IO tier, and checking suffixes below the VALUE tier
+        if level < Cost.IO and (self.is_dir or self.is_file):
+            changes.update(is_dir=False, is_file=False)
+
+        if level < Cost.VALUE and self.suffix.is_provided():
+            changes['suffix'] = _Suffix(None, None, True, parent=self)
+
+        return changes
+
     def expected(self):
         existing = self.is_dir * 'pointing to an existing directory' + self.is_file * 'pointing to an existing file'
         suffixes = self.suffix.expected_str()
@@ -113,6 +166,8 @@ class ExistingFile(PathLike):
 
 
 class _Suffix:
+    __slots__ = ('suffix', 'suffixes', 'ignore_case', 'suffix_is_provided', 'suffixes_is_provided')
+
     def __init__(self, suffix, suffixes, ignore_case, *, parent):
         # ignore_case must be a bool
         if not isinstance(ignore_case, bool):
@@ -161,6 +216,12 @@ class _Suffix:
         # The suffix(es) check passes if no suffix(es) were provided or at least one of them passes
         return not passed or True in passed
 
+    def structural_key(self):
+        return self.suffix, self.suffixes, self.ignore_case
+
+    def is_provided(self):
+        return self.suffix_is_provided or self.suffixes_is_provided
+
     def expected_str(self):
         suffixes = self.suffix_is_provided * [self.suffix] + self.suffixes_is_provided * [self.suffixes]
         suffixes = ' or '.join(suffixes)
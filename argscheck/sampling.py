@@ -0,0 +1,182 @@
+"""
+Sampling
+========
+
+This page documents the sampling policies that can be passed to :func:`.check_args` in order to check only some of the
+calls of a decorated function.
+
+Each policy counts how many calls it let through to be checked and how many it skipped. The counters are updated
+without locking, so when a function is called from several threads at once they may be slightly off.
+"""
+
+import random
+import time
+
+
+class SamplingPolicy:
+    """
+    Base class for all sampling policies. A policy is called (without arguments) once per call of the decorated
+    function, and returns whether that call's arguments should be checked.
+
+    :meta private:
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.checked = 0
+
+    def __repr__(self):
+        return f'{type(self).__qualname__}(checked={self.checked}, skipped={self.skipped})'
+
+    def __call__(self):
+        raise NotImplementedError
+
+    @property
+    def skipped(self):
+        """Number of calls whose arguments were not checked."""
+        return self.calls - self.checked
+
+    def reset(self):
+        """
+        Reset the counters, and start sampling from scratch (e.g. :class:`.FirstN` checks the next `n` calls again).
+        """
+
+        self.calls = 0
+        self.checked = 0
+
+    @staticmethod
+    def _validate(name, value, type_, type_desc, condition, desc):
+        if not isinstance(value, type_) or isinstance(value, bool):
+            raise TypeError(f'{name} must be {type_desc}, got {name}={value!r} instead.')
+
+        if not condition(value):
+            raise ValueError(f'{name} must be {desc}, got {name}={value!r} instead.')
+
+
+class EveryNth(SamplingPolicy):
+    """
+    Check every `n`-th call, starting with the first one.
+
+    :param n: *int* – Positive number of calls per checked call.
+
+    :Example:
+
+    .. code-block:: python
+
+        from argscheck import check_args, EveryNth, Int
+
+
+        every_100th = EveryNth(100)
+
+        @check_args(sample=every_100th)
+        def scale(x: Int(ge=0)):
+            return 2 * x
+
+
+        for i in range(1000):
+            scale(i)
+
+        every_100th.checked  # 10
+        every_100th.skipped  # 990
+    """
+
+    def __init__(self, n):
+        super().__init__()
+        self._validate('n', n, int, 'an int', lambda value: value > 0, 'positive')
+        self.n = n
+
+    def __call__(self):
+        self.calls += 1
+
+        if (self.calls - 1) % self.n:
+            return False
+
+        self.checked += 1
+
+        return True
+
+
+class RandomFraction(SamplingPolicy):
+    """
+    Check each call with probability `fraction`, independently of other calls.
+
+    :param fraction: *float* – Probability of checking a call, between 0.0 and 1.0.
+    :param seed: *Optional[int]* – Seed of the random number generator, for a reproducible sample.
+    """
+
+    def __init__(self, fraction, seed=None):
+        super().__init__()
+        self._validate('fraction', fraction, (int, float), 'a number', lambda value: 0.0 <= value <= 1.0,
+                       'between 0.0 and 1.0')
+        self.fraction = fraction
+        self._random = random.Random(seed).random
+
+    def __call__(self):
+        self.calls += 1
+
+        if self._random() >= self.fraction:
+            return False
+
+        self.checked += 1
+
+        return True
+
+
+class FirstN(SamplingPolicy):
+    """
+    Check only the first `n` calls (in the current process), e.g. to catch wrong arguments while the program starts up
+    and trust the code path from then on.
+
+    :param n: *int* – Number of calls to check.
+    """
+
+    def __init__(self, n):
+        super().__init__()
+        self._validate('n', n, int, 'an int', lambda value: value >= 0, 'non-negative')
+        self.n = n
+
+    def __call__(self):
+        self.calls += 1
+
+        if self.calls > self.n:
+            return False
+
+        self.checked += 1
+
+        return True
+
+
+class RateLimit(SamplingPolicy):
+    """
+    Check at most `per_second` calls in each second, i.e. the first `per_second` calls of each one second window.
+
+    :param per_second: *int* – Maximum number of checked calls per second.
+    """
+
+    def __init__(self, per_second):
+        super().__init__()
+        self._validate('per_second', per_second, int, 'an int', lambda value: value >= 0, 'non-negative')
+        self.per_second = per_second
+        self._window_start = float('-inf')
+        self._window_checked = 0
+
+    def reset(self):
+        super().reset()
+        self._window_start = float('-inf')
+        self._window_checked = 0
+
+    def __call__(self):
+        self.calls += 1
+        now = time.monotonic()
+
+        if now - self._window_start >= 1.0:
+            self._window_start = now
+            self._window_checked = 0
+
+        if self._window_checked >= self.per_second:
+            return False
+
+        self._window_checked += 1
+        self.checked += 1
+
+        return True
@@ -26,7 +26,7 @@ Checkers that convert values (like :class:`.Optional` for example) are applied a
    actual conversion took place for at least one item).
 """
 
-from .core import Checker, Typed, Wrapper
+from .core import Checker, Typed, Wrapper, Cost, _Emitter, _CheckError
 from .numeric import Sized, NonEmpty
 
 
@@ -50,6 +50,11 @@ class Sequence(Sized, Typed):
         check(checker, ['a', 1])    # Fails, a TypeError is raised (not all items are str)
     """
 
+    __slots__ = ('item_checker',)
+
+    # Types of sequences that _set_items() never fails to set converted items to
+    _settable_types = (list, tuple)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*self.types, **kwargs)
 
@@ -59,6 +64,11 @@ class Sequence(Sized, Typed):
             self.item_checker = None
 
     def check(self, name, value, **kwargs):
+        # Unless a subclass gets the items in its own way, sequences (and sequences nested in them) are checked by
+        # _check_nested(), without recursion
+        if type(self)._get_items is Sequence._get_items:
+            return _check_nested(self, name, value)
+
         passed, value = super().check(name, value)
         if not passed:
             return False, value
@@ -84,6 +94,92 @@ class Sequence(Sized, Typed):
 
         return True, value
 
+    def _emit(self, gen, name, value):
+        super()._emit(gen, name, value)
+
+        if self.item_checker is None:
+            return
+
+        if not gen.converts:
+            self._emit_predicate(gen, value)
+
+            return
+
+        # Same naming as in _get_items(), item names are only formatted when an error is reported
+        name = gen.name_var(name)
+        item_name, seq_name = gen.var('name'), f"({name} or 'it')"
+        gen.line(f"{item_name} = {name} + '[{{}}]' if {name} else 'sequence item {{}}'")
+
+        items, modified, length = gen.var('items'), gen.var('modified'), gen.var('length')
+        gen.line(f'{items} = []')
+        gen.line(f'{modified} = False')
+
+        with gen.block('try:'):
+            gen.line(f'{length} = len({value})')
+
+        with gen.block('except TypeError:'):
+            gen.fail(gen.exception(TypeError, f"'Failed calling len(), make sure ' + {seq_name} + ' is a sequence.'"),
+                     in_except=True)
+
+        i, pre_check_item, post_check_item = gen.var('i'), gen.var('item'), gen.var('item')
+
+        with gen.block(f'for {i} in range({length}):'):
+            with gen.block('try:'):
+                gen.line(f'{pre_check_item} = {value}[{i}]')
+
+            with gen.block('except TypeError:'):
+                message = f"'Failed getting ' + {item_name}.format({i}) + ', make sure ' + {seq_name} + " \
+                          f"' is a sequence.'"
+                gen.fail(gen.exception(TypeError, message), in_except=True)
+
+            gen.line(f'{post_check_item} = {pre_check_item}')
+
+            with gen.deferred(f'{self!r} does not support nesting deferred checkers such as {self.item_checker!r}.'):
+                gen.emit(self.item_checker, f'{item_name}.format({i})', post_check_item)
+
+            with gen.block(f'if {post_check_item} is not {pre_check_item}:'):
+                gen.line(f'{modified} = True')
+
+            gen.line(f'{items}.append({post_check_item})')
+
+        # Same as in check(), items are set only if at least one of them was modified
+        with gen.block(f'if {modified}:'):
+            passed, new_value = gen.var('passed'), gen.var('value')
+            gen.line(f'{passed}, {new_value} = {gen.const(self, "checker")}._set_items({name}, {value}, {items})')
+
+            with gen.block(f'if not {passed}:'):
+                gen.fail(new_value)
+
+            gen.line(f'{value} = {new_value}')
+
+    def _level_changes(self, level):
+        changes = super()._level_changes(level)
+
+        # Checking the items is dropped below the ITEMS tier
+        if level < Cost.ITEMS and self.item_checker is not None:
+            changes['item_checker'] = None
+
+        return changes
+
+    def _start(self, name, value):
+        """
+        Perform all checks on `value` except for checking its items. Return ``(passed, value)`` if there is nothing more
+        to check (or if a check failed), or else a _Frame from which the items are checked, see _check_nested().
+        """
+        passed, value = super().check(name, value)
+        if not passed:
+            return False, value
+
+        if self.item_checker is None:
+            return True, value
+
+        try:
+            length = len(value)
+        except TypeError:
+            return False, TypeError(f'Failed calling len(), make sure {name or "it"} is a sequence.')
+
+        return _Frame(self, value, length)
+
     def _get_items(self, name, value):
         items = []
         items_append = items.append
@@ -129,6 +225,43 @@ class Sequence(Sized, Typed):
 
         return True, items, modified
 
+    def _emit_predicate(self, gen, value):
+        # Setting converted items may fail (see _set_items()), which only checking the sequence finds out, unless the
+        # items are never converted or the sequence is of a type that always takes them
+        if not self.item_checker._type_only():
+            with gen.block(f'if type({value}) not in {gen.const(self._settable_types, "types")}:'):
+                with gen.block(f"if not {gen.const(self._compile('check'), 'fn')}('', {value})[0]:"):
+                    gen.fail(None)
+
+            with gen.block('else:'):
+                self._emit_predicate_items(gen, value)
+
+            return
+
+        self._emit_predicate_items(gen, value)
+
+    def _emit_predicate_items(self, gen, value):
+        # Only the verdict is needed, so items are neither named nor collected into a new sequence
+        length, item = gen.var('length'), gen.var('item')
+
+        with gen.block('try:'):
+            gen.line(f'{length} = len({value})')
+
+        with gen.block('except TypeError:'):
+            gen.fail(None)
+
+        i = gen.var('i')
+
+        with gen.block(f'for {i} in range({length}):'):
+            with gen.block('try:'):
+                gen.line(f'{item} = {value}[{i}]')
+
+            with gen.block('except TypeError:'):
+                gen.fail(None)
+
+            with gen.deferred(f'{self!r} does not support nesting deferred checkers such as {self.item_checker!r}.'):
+                gen.emit(self.item_checker, "''", item)
+
     def _set_items(self, name, value, items):
         # For non-mutable sequences, create a new sequence of the same type, with the modified items
         try:
@@ -140,6 +273,174 @@ class Sequence(Sized, Typed):
             return False, TypeError(err_msg)
 
 
+# Items of these types are checked once per call of _check_nested(), no matter how many times they are referenced
+_memoized_types = (tuple, frozenset)
+
+# Exceptions raised by failed checks: errors made by Checker._make_check_error() (of any exception type, _CheckError is
+# a mixin, so it can not be caught by itself), and the TypeError of an item that is not iterable (or not a sequence)
+_check_errors = (_CheckError, TypeError)
+
+# Items of sequences at least this long are checked by a compiled function (see Checker._compile()), which is worth
+# compiling once there are enough items to check
+_compile_items_from = 32
+
+
+class _Frame:
+    """The state of checking the items of a single sequence, see _check_nested()."""
+
+    __slots__ = ('checker', 'item_checker', 'nested', 'check_item', 'value', 'pre_check_value', 'length', 'index',
+                 'items')
+
+    def __init__(self, checker, value, length):
+        item_checker = checker.item_checker
+
+        self.checker = checker
+        self.item_checker = item_checker
+        self.nested = _is_nestable(item_checker)
+        self.check_item = item_checker._start if self.nested else item_checker.check
+        self.value = value
+
+        if not self.nested and length >= _compile_items_from and _Emitter.can_inline(item_checker):
+            self.check_item = item_checker._compile('check')
+
+        self.length = length
+        self.index = 0
+
+        # Checked items are only collected once one of them is modified (until then, they are the sequence's own items)
+        self.items = None
+
+
+def _is_nestable(checker):
+    """Whether `checker` can be checked by _check_nested() as part of an enclosing sequence."""
+    return isinstance(checker, Sequence) and type(checker).check is Sequence.check and \
+        type(checker)._get_items is Sequence._get_items
+
+
+def _item_name(name, stack, i):
+    """Return the name of item `i` of the sequence at the top of `stack`, same as the names given by _get_items()."""
+    for frame in stack[:-1]:
+        name = f'{name}[{frame.index - 1}]' if name else f'sequence item {frame.index - 1}'
+
+    return f'{name}[{i}]' if name else f'sequence item {i}'
+
+
+def _frame_name(name, stack):
+    """Return the name of the sequence at the top of `stack`."""
+    return _item_name(name, stack[:-1], stack[-2].index - 1) if len(stack) > 1 else name
+
+
+def _check_nested(checker, name, value):
+    """
+    Same as Sequence.check(), only sequences nested in each other (e.g. Sequence(List(Tuple(int)))) are checked with an
+    explicit stack of _Frame objects instead of recursive calls, so the depth of nesting is unlimited and each level
+    costs a single frame object.
+
+    Items are checked with an empty name, and item names (e.g. `x[3][7]`) are only formed if an item fails, by checking
+    it again with its name. Checked items are only collected once an item is modified, i.e. converted.
+
+    Tuples and frozensets that are referenced more than once (e.g. the same inner tuple in many rows) are checked once,
+    the checked value is remembered by the identities of the checker and of the item. Items may be created on access
+    (e.g. by a __getitem__() that builds them) and freed right after, so the memo holds on to each item, its identity
+    can not be reused by another item during the call. Note that reference cycles can not cause endless checking,
+    since each level of nesting is checked by a checker of its own.
+    """
+    result = checker._start(name, value)
+
+    if not isinstance(result, _Frame):
+        return result
+
+    stack = [result]
+    memo = {}
+
+    while True:
+        frame = stack[-1]
+        i = frame.index
+
+        # All items were checked, pop the frame and pass the checked sequence to the enclosing one
+        if i == frame.length:
+            stack.pop()
+            post_check_item = frame.value
+
+            if frame.items is not None:
+                passed, post_check_item = frame.checker._set_items(_frame_name(name, stack + [frame]), frame.value,
+                                                                   frame.items)
+                if not passed:
+                    return False, post_check_item
+
+            if not stack:
+                return True, post_check_item
+
+            pre_check_item = frame.pre_check_value
+
+            if type(pre_check_item) in _memoized_types and type(post_check_item) in _memoized_types:
+                memo[id(frame.checker), id(pre_check_item)] = pre_check_item, post_check_item
+
+            frame = stack[-1]
+        else:
+            frame.index = i + 1
+
+            # Call __getitem__(), if call fails return TypeError (sequences must implement __getitem__())
+            try:
+                pre_check_item = frame.value[i]
+            except TypeError:
+                seq_name = _frame_name(name, stack) or 'it'
+
+                return False, TypeError(f'Failed getting {_item_name(name, stack, i)}, make sure {seq_name} is a '
+                                        f'sequence.')
+
+            # Shared items that were already checked (by the same checker) in this call
+            memoized = type(pre_check_item) in _memoized_types
+            entry = memo.get((id(frame.item_checker), id(pre_check_item))) if memoized else None
+
+            if entry is not None and entry[0] is pre_check_item:
+                post_check_item = entry[1]
+                result = None
+
+            else:
+                # Some checkers raise instead of returning an error (e.g. Collection, whose items are checked by a
+                # deferred Iterable), in which case the item is checked again, so that the error refers to it. Only
+                # errors of failed checks are caught, any other exception is a bug and propagates as-is
+                try:
+                    result = frame.check_item('', pre_check_item)
+                except Exception as e:
+                    if not isinstance(e, _check_errors):
+                        raise
+
+                    result = frame.check_item(_item_name(name, stack, i), pre_check_item)
+
+            if isinstance(result, _Frame):
+                result.pre_check_value = pre_check_item
+                stack.append(result)
+
+                continue
+
+            if isinstance(result, Wrapper):
+                err_msg = f'{frame.checker!r} does not support nesting deferred checkers such as ' \
+                          f'{frame.item_checker!r}.'
+
+                raise NotImplementedError(err_msg)
+
+            if result is not None:
+                passed, post_check_item = result
+
+                # Check the failed item again, with its name, so that the error refers to it
+                if not passed:
+                    result = frame.check_item(_item_name(name, stack, i), pre_check_item)
+
+                    return False, result[1] if not isinstance(result, _Frame) and not result[0] else post_check_item
+
+                # Items converted to mutable values are not remembered, each reference must get a value of its own
+                if memoized and type(post_check_item) in _memoized_types:
+                    memo[id(frame.item_checker), id(pre_check_item)] = pre_check_item, post_check_item
+
+        # Collect the checked items once the first one of them is modified
+        if frame.items is not None:
+            frame.items.append(post_check_item)
+        elif post_check_item is not pre_check_item:
+            frame.items = [frame.value[j] for j in range(frame.index - 1)]
+            frame.items.append(post_check_item)
+
+
 class NonEmptySequence(NonEmpty, Sequence):
     """
     Same as :class:`.Sequence`, plus, the length of `x` must be greater than zero.
@@ -172,6 +473,9 @@ class MutableSequence(Sequence):
     Check if `x` is a mutable sequence.
 
     """
+
+    _settable_types = (list,)
+
     def _set_items(self, name, value, items):
         item_name, seq_name = (name + '[{}]', name) if name else ('sequence item {}', 'it')
 
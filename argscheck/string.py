@@ -7,12 +7,16 @@ This page documents a checker for string arguments.
 
 import re
 
-from .core import Typed
+from .core import Typed, Cost
 
 
 _allowed_methods = {'match', 'fullmatch', 'search'}
 
 
+def _match_any(string):
+    return True
+
+
 class String(Typed):
     """
     Check if `x` is a string and optionally, if it matches a particular regex pattern.
@@ -39,6 +43,11 @@ class String(Typed):
         check(checker, "script.sh")  # Fails, a ValueError is raised ("script.sh" does not end with ".exe")
     """
 
+    __slots__ = ('re_matcher', 'method', 'pattern', 'flags')
+
+    # re_matcher is derived from the other attributes
+    _unkeyed = ('re_matcher',)
+
     def __init__(self, pattern=None, flags=0, method='fullmatch', **kwargs):
         super().__init__(str, **kwargs)
 
@@ -52,14 +61,14 @@ class String(Typed):
         # Create a callable that will return None if value does not match the given pattern
         if pattern is not None:
             re_obj = re.compile(pattern, flags)
-            re_method = getattr(re_obj, method)
-            self.re_matcher = lambda string: re_method(string)
+            self.re_matcher = getattr(re_obj, method)
         else:
-            self.re_matcher = lambda string: True
+            self.re_matcher = _match_any
 
         # Save arguments for use in error messages
         self.method = method
         self.pattern = pattern
+        self.flags = flags
 
     def check(self, name, value, **kwargs):
         passed, value = super().check(name, value)
@@ -72,6 +81,25 @@ class String(Typed):
 
         return True, value
 
+    def _emit(self, gen, name, value):
+        super()._emit(gen, name, value)
+
+        if self.pattern is not None:
+            with gen.block(f'if {gen.const(self.re_matcher, "matcher")}({value}) is None:'):
+                gen.fail(gen.error(self, ValueError, name, value))
+
+    def _type_only(self):
+        return super()._type_only() and self.pattern is None
+
+    def _level_changes(self, level):
+        changes = super()._level_changes(level)
+
+        # Matching the pattern is dropped below the VALUE tier
+        if level < Cost.VALUE and self.pattern is not None:
+            changes.update(re_matcher=_match_any, pattern=None)
+
+        return changes
+
     def expected(self):
         s = '' if self.pattern is None else f'matching the "{self.pattern}" regex pattern via `re.{self.method}()`'
 
@@ -1,5 +1,26 @@
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
+from itertools import count, islice
+import collections.abc
+import copy
 import inspect
+import linecache
+import marshal
+import os
+import reprlib
+import sys
+import threading
+import types
+
+
+class CacheInfo(namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])):
+    __slots__ = ()
+
+    @property
+    def hit_ratio(self):
+        """Fraction of lookups that were hits, 0.0 if there were no lookups yet."""
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
 
 
 class Sentinel:
@@ -11,9 +32,168 @@ class Sentinel:
 
 
 def extend_docstring(cls):
-    cls_doc, *bases_docs = [_DocString.from_class(base) for base in inspect.getmro(cls)]
-    cls_doc.extend_params(bases_docs)
-    cls.__doc__ = cls_doc.to_string()
+    """
+    Extend the docstring of `cls` with the parameters documented by its base classes. The docstring is only parsed and
+    extended when ``cls.__doc__`` is first read (e.g. by Sphinx or ``help()``), see _LazyDocString.
+    """
+    cls.__doc__ = _LazyDocString(cls, cls.__dict__.get('__doc__'))
+
+
+def resolve_docstrings(cls):
+    """
+    Extend the docstrings of `cls` and of all of its subclasses right away, e.g. before building the documentation.
+    """
+    pending = [cls]
+
+    while pending:
+        cls = pending.pop()
+
+        # Reading the docstring is what extends it
+        cls.__doc__
+        pending.extend(cls.__subclasses__())
+
+
+class _LazyDocString:
+    """
+    Stands for the docstring of a class until it is first read. A class's own ``__doc__`` is looked up in its
+    ``__dict__``, and if it is a descriptor, its ``__get__`` is called (also when read from an instance).
+    """
+
+    def __init__(self, cls, doc):
+        self.cls = cls
+        self.doc = doc
+
+    def __get__(self, instance, owner=None):
+        # Base classes' docstrings are extended (if needed) as they are read
+        cls_doc = _DocString(self.doc)
+        cls_doc.extend_params([_DocString.from_class(base) for base in inspect.getmro(self.cls)[1:]])
+        doc = cls_doc.to_string()
+
+        # From now on, the docstring is read as usual
+        self.cls.__doc__ = doc
+
+        return doc
+
+
+_immutable_types = {type(None), type(Ellipsis), bool, int, float, complex, str, bytes, range}
+
+
+def is_immutable(value):
+    """
+    Whether `value` is an instance of a builtin immutable type, tuples and frozensets must also contain only immutable
+    items. Subclasses are not considered immutable, since they may add mutable attributes.
+    """
+    value_type = type(value)
+
+    if value_type in _immutable_types:
+        return True
+
+    if value_type is tuple or value_type is frozenset:
+        return all(is_immutable(item) for item in value)
+
+    # Paths can only be encountered if pathlib was already imported by someone else
+    pathlib = sys.modules.get('pathlib')
+
+    return pathlib is not None and value_type in (pathlib.PurePosixPath, pathlib.PureWindowsPath, pathlib.PosixPath,
+                                                  pathlib.WindowsPath)
+
+
+_function_ids = count()
+
+# Directory of the on-disk cache of compiled generated code (None if it is off), see set_code_cache_dir()
+_code_cache_dir = None
+
+
+def make_function(name, source, namespace, description):
+    """
+    Execute the source code of a generated function definition and return the function.
+
+    The source is registered with ``linecache`` under a unique file name, so that tracebacks through generated code
+    show the actual lines.
+
+    :param name: *str* – Name of the function defined in `source`.
+    :param source: *str* – Source code of the function definition.
+    :param namespace: *dict* – Global namespace of the function, must contain every free name used in `source`.
+    :param description: *str* – Short description of the function, used in its file name.
+    :return: *Callable*
+    """
+    filename = f'<argscheck {description} #{next(_function_ids)}>'
+    code = compile(source, filename, 'exec') if _code_cache_dir is None else _cached_compile(source, filename)
+    exec(code, namespace)
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    return namespace[name]
+
+
+def set_code_cache_dir(directory):
+    """
+    Set the directory of the on-disk cache of compiled generated code, or turn the cache off with None. See
+    argscheck.set_code_cache().
+    """
+    global _code_cache_dir
+
+    if directory is None:
+        _code_cache_dir = None
+
+        return
+
+    # Code compiled by different Python versions is kept apart, since marshalled code is only valid for the version
+    # that created it
+    from importlib.util import MAGIC_NUMBER
+
+    directory = os.path.abspath(os.path.expanduser(directory))
+    _code_cache_dir = os.path.join(directory, f'{sys.implementation.cache_tag}-{MAGIC_NUMBER.hex()}')
+
+
+def _cached_compile(source, filename):
+    """
+    Same as compile(source, filename, 'exec'), only the compiled code is loaded from (or else stored in) the on-disk
+    code cache. Entries are keyed by a hash of the source itself, so they never need to be invalidated, a change to a
+    checker (or to how argscheck generates code) simply results in a different entry.
+    """
+    import hashlib
+
+    directory = _code_cache_dir
+    path = os.path.join(directory, hashlib.sha256(source.encode()).hexdigest())
+
+    # Unreadable or corrupt entries are ignored, and replaced below
+    try:
+        with open(path, 'rb') as file:
+            code = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        code = None
+
+    if isinstance(code, types.CodeType):
+        return _with_filename(code, filename)
+
+    code = compile(source, filename, 'exec')
+
+    # Entries are written to a temporary file and then renamed, so that concurrent processes never read a partially
+    # written entry. Failing to write (e.g. to a read-only directory) only means that the entry is not cached
+    temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+
+        with open(temp_path, 'wb') as file:
+            file.write(marshal.dumps(code))
+
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+    return code
+
+
+def _with_filename(code, filename):
+    """Return `code` (and the code objects nested in it) with co_filename replaced, so tracebacks show `filename`."""
+    consts = tuple(_with_filename(const, filename) if isinstance(const, types.CodeType) else const
+                   for const in code.co_consts)
+
+    return code.replace(co_filename=filename, co_consts=consts)
 
 
 def partition(sequence, condition):
@@ -48,6 +228,183 @@ def join(string, iterable, *, on_empty=None):
     return string.join(iterable)
 
 
+class LRUCache:
+    """
+    A bounded mapping that evicts its least recently used entry once it holds more than ``maxsize`` entries.
+
+    All operations are guarded by a lock, so a single instance can be shared between threads. Unhashable keys raise
+    ``TypeError``, just like with a ``dict``.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Types that reprlib represents by their exact type name, i.e. not including their subclasses
+_bounded_types = {tuple, list, dict, set, frozenset, str, int, collections.deque}
+
+# Containers (including subclasses and lookalikes of builtin ones) and the methods that represent them, first match wins
+_container_reprs = [(str, 'repr_str'), (dict, 'repr_dict'), (tuple, 'repr_tuple'), (list, 'repr_list'),
+                    (collections.deque, 'repr_deque'), (frozenset, 'repr_frozenset'), (set, 'repr_set'),
+                    (collections.abc.Mapping, 'repr_dict'), (collections.abc.Set, 'repr_set'),
+                    (collections.abc.Sequence, 'repr_list')]
+
+
+class BoundedRepr(reprlib.Repr):
+    """
+    A ``reprlib.Repr`` whose output is never longer than ``max_length`` characters, no matter how large or deeply nested
+    the object is. Containers show at most ``max_items`` items and are nested at most ``max_level`` levels deep.
+    """
+
+    def __init__(self, max_length, max_items, max_level):
+        super().__init__()
+        self.configure(max_length, max_items, max_level)
+
+    def configure(self, max_length, max_items, max_level):
+        self.max_length = max_length
+        self.maxlevel = max_level
+        self.maxtuple = self.maxlist = self.maxarray = self.maxdict = self.maxset = self.maxfrozenset = \
+            self.maxdeque = max_items
+
+        # Strings, ints and other objects are only truncated as a whole, by the total length limit
+        self.maxstring = self.maxlong = self.maxother = max_length
+
+    def repr(self, x):
+        # A copy holds the number of characters left for this call, so concurrent calls do not interfere
+        bounded = copy.copy(self)
+        bounded.remaining = self.max_length
+        s = bounded.repr1(x, self.maxlevel)
+
+        if len(s) > self.max_length:
+            s = s[:max(self.max_length - 3, 0)] + '...'
+
+        return s
+
+    def repr1(self, x, level):
+        # Once the length limit is reached, the remaining items of containers are not represented at all
+        if self.remaining <= 0:
+            return '...'
+
+        s = None if type(x) in _bounded_types else self._repr_container(x, level)
+
+        if s is None:
+            s = super().repr1(x, level)
+
+        self.remaining -= len(s) + 2
+
+        return s
+
+    # reprlib sorts dicts and sets in full before taking the first few items, which takes O(n log n) time. Here, only
+    # dicts and sets that are shown in full are sorted, the first items of larger ones are taken in iteration order
+    @staticmethod
+    def _first_items(x, max_items):
+        if len(x) > max_items:
+            return x
+
+        try:
+            return sorted(x)
+        except Exception:
+            return list(x)
+
+    def repr_set(self, x, level):
+        if not x:
+            return 'set()'
+
+        return self._repr_iterable(self._first_items(x, self.maxset), level, '{', '}', self.maxset)
+
+    def repr_frozenset(self, x, level):
+        if not x:
+            return 'frozenset()'
+
+        return self._repr_iterable(self._first_items(x, self.maxfrozenset), level, 'frozenset({', '})',
+                                   self.maxfrozenset)
+
+    def repr_dict(self, x, level):
+        if not x:
+            return '{}'
+
+        if level <= 0:
+            return '{...}'
+
+        pieces = [f'{self.repr1(key, level - 1)}: {self.repr1(x[key], level - 1)}'
+                  for key in islice(self._first_items(x, self.maxdict), self.maxdict)]
+
+        if len(x) > self.maxdict:
+            pieces.append('...')
+
+        return '{' + ', '.join(pieces) + '}'
+
+    def _repr_container(self, x, level):
+        """Represent a subclass of a builtin container (or a container that is not a builtin one) like the container it
+        resembles, reprlib would otherwise call its own (unbounded) __repr__(). Return None for other objects."""
+        for base, method in _container_reprs:
+            if isinstance(x, base):
+                break
+        else:
+            return None
+
+        # Byte strings and ranges are sequences, but are represented (and truncated) as a whole
+        if isinstance(x, (bytes, bytearray, range)):
+            return None
+
+        # Named tuples are shown with their field names
+        if isinstance(x, tuple) and hasattr(type(x), '_fields'):
+            if level <= 0:
+                return f'{type(x).__name__}(...)'
+
+            fields = islice(zip(x._fields, x), self.maxtuple)
+            items = [f'{field}={self.repr1(item, level - 1)}' for field, item in fields]
+
+            if len(x) > self.maxtuple:
+                items.append('...')
+
+            return f'{type(x).__name__}({", ".join(items)})'
+
+        s = getattr(self, method)(x, level)
+
+        # Subclasses that do not customize __repr__() look just like their base, e.g. a subclass of list
+        if type(x).__repr__ is getattr(base, '__repr__'):
+            return s
+
+        return f'{type(x).__name__}({s})'
+
+
 class _DocString:
     def __init__(self, doc):
         self.prefix = ''
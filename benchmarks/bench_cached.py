@@ -0,0 +1,31 @@
+"""
+Measure check() of the same large tuple, uncached, cached by value and cached by identity (see Cached's by_identity).
+
+Usage: python benchmarks/bench_cached.py
+"""
+
+import timeit
+
+from argscheck import check, Cached, Tuple
+
+
+VALUE = tuple((f'10.0.{i}.0', i) for i in range(10000))
+
+CASES = [
+    ('Tuple(Tuple(str, int))', Tuple(Tuple(str, int))),
+    ('Cached(Tuple(Tuple(str, int)))', Cached(Tuple(Tuple(str, int)))),
+    ('Cached(Tuple(Tuple(str, int)), by_identity=True)', Cached(Tuple(Tuple(str, int)), by_identity=True)),
+]
+
+
+def main():
+    print(f'{"checker (10000 items)":<52}{"check() [ms]":>14}')
+
+    for title, checker in CASES:
+        check(checker, VALUE)
+        elapsed = min(timeit.repeat(lambda: check(checker, VALUE), number=10, repeat=5)) / 10 * 1e3
+        print(f'{title:<52}{elapsed:>14.3f}')
+
+
+if __name__ == '__main__':
+    main()
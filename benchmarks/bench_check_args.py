@@ -0,0 +1,46 @@
+"""
+Measure the per-call overhead that check_args adds on top of a plain function call.
+
+Usage: python benchmarks/bench_check_args.py
+"""
+
+import timeit
+
+from argscheck import check_args, Int, Float, String, EveryNth
+
+
+def plain(a, b, alpha=0.5, *, label='x'):
+    return a
+
+
+@check_args
+def typed_only(a: int, b: (int, float), alpha: float = 0.5, *, label: str = 'x'):
+    return a
+
+
+@check_args
+def bounded(a: Int, b: Int >= 0, alpha: (0.0 <= Float) <= 1.0 = 0.5, *, label: String('[a-z]+') = 'x'):
+    return a
+
+
+# Same as bounded, only 1 in 100 calls is checked
+@check_args(sample=EveryNth(100))
+def sampled(a: Int, b: Int >= 0, alpha: (0.0 <= Float) <= 1.0 = 0.5, *, label: String('[a-z]+') = 'x'):
+    return a
+
+
+def best_of(fn, number=200000):
+    return min(timeit.repeat(lambda: fn(1, 2, 0.25, label='abc'), number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    baseline = best_of(plain)
+    print(f'{"function":<14}{"call [ns]":>12}{"overhead [ns]":>16}')
+
+    for fn in (plain, typed_only, bounded, sampled):
+        call_ns = best_of(fn)
+        print(f'{fn.__name__:<14}{call_ns:>12.0f}{call_ns - baseline:>16.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Compare the per-element cost of checking a batch of values with a loop over check() against check_many().
+
+Usage: python benchmarks/bench_check_many.py
+"""
+
+import timeit
+
+from argscheck import check, check_many, Int, String, PathLike, Optional
+
+
+SIZE = 10000
+
+CASES = [
+    ('Int(ge=0)', Int(ge=0), list(range(SIZE))),
+    ('String("[a-z]+")', String('[a-z]+'), ['abcd'] * SIZE),
+    ('PathLike(suffix=".txt")', PathLike(suffix='.txt'), ['a.txt'] * SIZE),
+    ('Optional(Int, default_value=0)', Optional(Int, default_value=0), [None, 1] * (SIZE // 2)),
+]
+
+# A tenth of the values fail the check
+FAILING_CASES = [
+    ('Int(ge=0), 10% failing', Int(ge=0), [-1 if i % 10 == 0 else i for i in range(SIZE)]),
+]
+
+
+def best_of(stmt, number=5):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number / SIZE * 1e9
+
+
+def main():
+    print(f'{"checker":<34}{"check() loop [ns]":>19}{"check_many() [ns]":>19}{"speedup":>9}')
+
+    for title, checker, values in CASES:
+        loop_ns = best_of(lambda: [check(checker, value) for value in values])
+        many_ns = best_of(lambda: check_many(checker, values))
+
+        print(f'{title:<34}{loop_ns:>19.0f}{many_ns:>19.0f}{loop_ns / many_ns:>8.1f}x')
+
+    for title, checker, values in FAILING_CASES:
+        loop_ns = best_of(lambda: [check(checker, value, raise_on_error=False) for value in values])
+        many_ns = best_of(lambda: check_many(checker, values, raise_on_error=False))
+
+        print(f'{title:<34}{loop_ns:>19.0f}{many_ns:>19.0f}{loop_ns / many_ns:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Measure the start up time of a program that decorates many functions with check_args, without the on-disk code cache,
+and with it (see set_code_cache()), when the cache is empty and when it is warm.
+
+Each measurement runs in a fresh interpreter, the best of several runs is reported.
+
+Usage: python benchmarks/bench_code_cache.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+
+RUNS = 5
+
+PROGRAM = '''
+import time
+
+start = time.perf_counter()
+
+from argscheck import check_args, Int, Float, String, Sequence, Optional
+
+for i in range(100):
+    exec(f"""
+@check_args
+def fn_{i}(a{i}: Int(ge={i}), b: String('[a-z]+') = 'x', c: Sequence(Optional(Float)) = (), *, d: Float <= {i} = 0.5):
+    return a{i}
+""")
+
+print(int((time.perf_counter() - start) * 1e3))
+'''
+
+
+def start_up_time(code_cache=None):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.environ.get('PYTHONPATH', '')]))
+    env.pop('ARGSCHECK_CODE_CACHE', None)
+
+    if code_cache is not None:
+        env['ARGSCHECK_CODE_CACHE'] = code_cache
+
+    output = subprocess.run([sys.executable, '-c', PROGRAM], env=env, capture_output=True, text=True, check=True)
+
+    return int(output.stdout)
+
+
+def main():
+    print(f'{"code cache":<14}{"start up [ms]":>16}')
+    print(f'{"off":<14}{min(start_up_time() for _ in range(RUNS)):>16}')
+
+    empty = []
+
+    for _ in range(RUNS):
+        with tempfile.TemporaryDirectory() as directory:
+            empty.append(start_up_time(directory))
+
+    print(f'{"empty":<14}{min(empty):>16}')
+
+    with tempfile.TemporaryDirectory() as directory:
+        start_up_time(directory)
+        print(f'{"warm":<14}{min(start_up_time(directory) for _ in range(RUNS)):>16}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Compare the per-call latency of the interpreted check() path against compiled checkers (see compile_checker()).
+
+Usage: python benchmarks/bench_compile.py
+"""
+
+import timeit
+
+from argscheck import check, compile_checker, Int, Float, String, PathLike, Optional, Sequence, List, One
+
+
+CASES = [
+    ('Int(ge=0)', Int(ge=0), 5),
+    ('(0.0 <= Float) <= 1.0', (0.0 <= Float) <= 1.0, 0.5),
+    ('String("[a-z]+")', String('[a-z]+'), 'abcd'),
+    ('PathLike(suffix=".txt")', PathLike(suffix='.txt'), 'a.txt'),
+    ('Optional(Int, default_value=0)', Optional(Int, default_value=0), None),
+    ('One(int, String)', One(int, String), 'abcd'),
+    ('Sequence(Int, len_ge=1) x 100', Sequence(Int, len_ge=1), list(range(100))),
+    ('List(Optional(Float)) x 100', List(Optional(Float)), [1.0] * 100),
+]
+
+
+def best_of(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    print(f'{"checker":<34}{"check() [ns]":>14}{"compiled [ns]":>15}{"speedup":>9}')
+
+    for title, checker, value in CASES:
+        compiled = compile_checker(checker)
+        number = 2000 if isinstance(value, list) else 100000
+
+        interpreted_ns = best_of(lambda: check(checker, value), number)
+        compiled_ns = best_of(lambda: compiled(value), number)
+
+        print(f'{title:<34}{interpreted_ns:>14.0f}{compiled_ns:>15.0f}{interpreted_ns / compiled_ns:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Show that with argument checking disabled (see argscheck.set_disabled()), a function decorated with check_args costs
+the same as the undecorated function, and check() costs about as much as an identity function.
+
+Usage: python benchmarks/bench_disabled.py
+"""
+
+import timeit
+
+import argscheck
+from argscheck import check, check_args, Int, Float, String
+
+# Must be called before decorating, the environment variable ARGSCHECK_DISABLE=1 has the same effect
+argscheck.set_disabled()
+
+
+def plain(a, b, alpha=0.5, *, label='x'):
+    return a
+
+
+@check_args
+def bounded(a: Int, b: Int >= 0, alpha: (0.0 <= Float) <= 1.0 = 0.5, *, label: String('[a-z]+') = 'x'):
+    return a
+
+
+def identity(checker, value):
+    return value
+
+
+def best_of(stmt, number=500000):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    checker = Int(ge=0)
+
+    print(f'{"call":<34}{"time [ns]":>10}')
+    print(f'{"plain(1, 2, 0.25, label=...)":<34}{best_of(lambda: plain(1, 2, 0.25, label="abc")):>10.0f}')
+    print(f'{"bounded(1, 2, 0.25, label=...)":<34}{best_of(lambda: bounded(1, 2, 0.25, label="abc")):>10.0f}')
+    print(f'{"identity(checker, 1)":<34}{best_of(lambda: identity(checker, 1)):>10.0f}')
+    print(f'{"check(checker, 1)":<34}{best_of(lambda: check(checker, 1)):>10.0f}')
+    print(f'check_args(plain) is plain: {check_args(plain) is plain}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Measure the time it takes to import argscheck, as reported by ``python -X importtime``, and the time it takes to extend
+the docstrings of all checker classes, which is deferred until they are first read.
+
+Each measurement runs in a fresh interpreter, the best of several runs is reported.
+
+Usage: python benchmarks/bench_import.py
+"""
+
+import os
+import subprocess
+import sys
+
+
+RUNS = 15
+
+RESOLVE_DOCSTRINGS = '''
+import time
+import argscheck
+from argscheck.core import Checker
+from argscheck.utils import resolve_docstrings
+
+start = time.perf_counter()
+resolve_docstrings(Checker)
+print(int((time.perf_counter() - start) * 1e6))
+'''
+
+
+def import_times():
+    """Return the cumulative import time of each argscheck module, in microseconds."""
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import argscheck'], env=_env(),
+                            capture_output=True, text=True, check=True).stderr
+    times = {}
+
+    for line in output.splitlines():
+        _, cumulative, module = line.split('|')
+        module = module.strip()
+
+        if module.startswith('argscheck') and cumulative.strip().isdigit():
+            times[module] = int(cumulative)
+
+    return times
+
+
+def resolve_time():
+    output = subprocess.run([sys.executable, '-c', RESOLVE_DOCSTRINGS], env=_env(), capture_output=True, text=True,
+                            check=True).stdout
+
+    return int(output)
+
+
+def _env():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    return dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.environ.get('PYTHONPATH', '')]))
+
+
+def main():
+    runs = [import_times() for _ in range(RUNS)]
+
+    print(f'{"module":<22}{"import [us]":>14}')
+
+    for module in sorted(runs[0], key=lambda module: -runs[0][module]):
+        print(f'{module:<22}{min(run[module] for run in runs):>14}')
+
+    print(f'\nExtending all checker docstrings (deferred): {min(resolve_time() for _ in range(RUNS))} us')
+
+
+if __name__ == '__main__':
+    main()
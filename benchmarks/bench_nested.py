@@ -0,0 +1,44 @@
+"""
+Measure check() on nested sequences, wide and deep ones, and ones whose rows are the same tuple (see
+sequence._check_nested()).
+
+Usage: python benchmarks/bench_nested.py
+"""
+
+import sys
+import timeit
+
+from argscheck import check, Int, Optional, Sequence, List, Tuple
+
+
+CASES = [
+    ('Sequence(Sequence(Int)) 100 x 100', Sequence(Sequence(Int)), [list(range(100))] * 100),
+    ('List(Tuple(Optional(int))) 1000 x 3', List(Tuple(Optional(int))), [(i, None, 3) for i in range(1000)]),
+    ('List(Tuple(Optional(int))) 1000 x 3, shared rows', List(Tuple(Optional(int))), [(1, None, 3)] * 1000),
+    ('Sequence(Sequence(Sequence(str))) 10 x 10 x 10', Sequence(Sequence(Sequence(str))), [[['a'] * 10] * 10] * 10),
+    ('Tuple(Tuple(Optional(int, default_value=0))) 500 x 2', Tuple(Tuple(Optional(int, default_value=0))),
+     ((1, None),) * 500),
+]
+
+
+def main():
+    print(f'{"checker":<56}{"check() [ms]":>14}')
+
+    for title, checker, value in CASES:
+        check(checker, value)
+        elapsed = min(timeit.repeat(lambda: check(checker, value), number=20, repeat=5)) / 20 * 1e3
+        print(f'{title:<56}{elapsed:>14.2f}')
+
+    # Nesting deeper than the recursion limit
+    depth = sys.getrecursionlimit() * 3
+    checker, value = int, 1
+
+    for _ in range(depth):
+        checker, value = Sequence(checker), [value]
+
+    elapsed = min(timeit.repeat(lambda: check(checker, value), number=20, repeat=5)) / 20 * 1e3
+    print(f'{f"Sequence(...) nested {depth} levels deep":<56}{elapsed:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Measure the throughput of check() with a single checker shared by a growing number of threads.
+
+On a free-threaded build of CPython (e.g. python3.13t) the throughput is expected to grow with the number of threads,
+since checkers are immutable and checking takes no locks. With the GIL it stays roughly flat.
+
+Usage: python benchmarks/bench_threads.py
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from argscheck import check, Int, String, Sequence
+
+
+CHECKS_PER_TASK = 5000
+TASKS_PER_THREAD = 4
+
+CASES = [
+    ('Int(ge=0)', Int(ge=0), 7),
+    ('String("[a-z]+")', String('[a-z]+'), 'abcd'),
+    ('Sequence(Int(ge=0))', Sequence(Int(ge=0)), (1, 2, 3, 4)),
+]
+
+
+def task(checker, value):
+    for _ in range(CHECKS_PER_TASK):
+        check(checker, value)
+
+
+def throughput(checker, value, threads):
+    tasks = threads * TASKS_PER_THREAD
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(task, [checker] * tasks, [value] * tasks))
+        elapsed = time.perf_counter() - start
+
+    return tasks * CHECKS_PER_TASK / elapsed / 1e6
+
+
+def main():
+    gil = sys._is_gil_enabled() if hasattr(sys, '_is_gil_enabled') else True
+    thread_counts = [n for n in (1, 2, 4, 8) if n <= max(os.cpu_count() or 1, 1)] or [1]
+
+    print(f'GIL enabled: {gil}, CPUs: {os.cpu_count()}')
+    print(f'{"checker":<24}' + ''.join(f'{f"{n} threads [M/s]":>18}' for n in thread_counts) + f'{"scaling":>10}')
+
+    for title, checker, value in CASES:
+        # Warm up, so that compiling the checker is not measured
+        check(checker, value)
+
+        results = [throughput(checker, value, n) for n in thread_counts]
+        print(f'{title:<24}' + ''.join(f'{result:>18.2f}' for result in results) +
+              f'{results[-1] / results[0]:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,11 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath('..'))
 
+# Docstrings of checker classes are extended with their bases' parameters when first read, do it for all of them now
+from argscheck.core import Checker
+from argscheck.utils import resolve_docstrings
+resolve_docstrings(Checker)
+
 # -- Project information -----------------------------------------------------
 
 project = 'argscheck'
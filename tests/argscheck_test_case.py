@@ -1,7 +1,7 @@
 import unittest
 from functools import partial
 
-from argscheck import check
+from argscheck import check, compile_checker, is_valid
 
 
 class TestCaseArgscheck(unittest.TestCase):
@@ -20,24 +20,47 @@ class TestCaseArgscheck(unittest.TestCase):
 
     checker = property(get_checker, set_checker)
 
+    def checks(self):
+        # Every assertion is made against both the interpreted and the compiled checker
+        return partial(check, self.checker), compile_checker(self.checker)
+
     def assertOutputIsInput(self, value):
-        ret = check(self.checker, value)
-        self.assertIs(ret, value)
+        self.assertTrue(is_valid(self.checker, value))
+
+        for check_ in self.checks():
+            ret = check_(value)
+            self.assertIs(ret, value)
 
     def assertOutputEqualsInput(self, value):
-        ret = check(self.checker, value)
-        self.assertEqual(ret, value)
+        self.assertTrue(is_valid(self.checker, value))
+
+        for check_ in self.checks():
+            ret = check_(value)
+            self.assertEqual(ret, value)
 
     def assertOutputIs(self, value, exp_output):
-        ret = check(self.checker, value)
-        self.assertIs(ret, exp_output)
+        self.assertTrue(is_valid(self.checker, value))
+
+        for check_ in self.checks():
+            ret = check_(value)
+            self.assertIs(ret, exp_output)
 
     def assertOutputEquals(self, value, exp_output):
-        ret = check(self.checker, value)
-        self.assertEqual(ret, exp_output)
+        self.assertTrue(is_valid(self.checker, value))
+
+        for check_ in self.checks():
+            ret = check_(value)
+            self.assertEqual(ret, exp_output)
+
+    def assertRaisesOnCheck(self, expected_exception, value, *args, **kwargs):
+        # Checks that can not be evaluated raise the same error as a predicate, failed checks evaluate to False
+        if expected_exception is NotImplementedError:
+            self.assertRaises(NotImplementedError, is_valid, self.checker, value)
+        else:
+            self.assertFalse(is_valid(self.checker, value))
 
-    def assertRaisesOnCheck(self, expected_exception, *args, **kwargs):
-        return self.assertRaises(expected_exception, partial(check, self.checker), *args, **kwargs)
+        for check_ in self.checks():
+            self.assertRaises(expected_exception, check_, value, *args, **kwargs)
 
     def assertItemsFromIter(self, value, exp_behaviours, exp_output, iterable):
         checker = check(self.checker, value)
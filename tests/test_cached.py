@@ -0,0 +1,157 @@
+import pickle
+from pathlib import Path
+
+from argscheck import Cached, Int, String, Optional, PathLike, ExistingFile, Tuple, List, Collection, check, \
+    compile_checker, check_args, intern_checker
+
+from tests.argscheck_test_case import TestCaseArgscheck
+
+
+class TestCached(TestCaseArgscheck):
+    def test_init(self):
+        # Good arguments
+        Cached(int)
+        Cached(Int(ge=0), str, maxsize=10)
+        Cached(String('a'), maxsize=0, enabled=False)
+
+        # Bad arguments
+        self.assertRaises(TypeError, Cached)
+        self.assertRaises(TypeError, Cached, int, maxsize=-1)
+        self.assertRaises(TypeError, Cached, int, maxsize=1.5)
+        self.assertRaises(TypeError, Cached, int, enabled=1)
+
+        # Checks that read the file system are not cached by default
+        self.assertTrue(Cached(PathLike(suffix='.txt')).enabled)
+        self.assertFalse(Cached(ExistingFile).enabled)
+        self.assertFalse(Cached(Optional(ExistingFile)).enabled)
+        self.assertTrue(Cached(ExistingFile, enabled=True).enabled)
+
+    def test_check(self):
+        self.checker = Cached(Int(ge=0), maxsize=2)
+
+        for _ in range(2):
+            self.assertOutputIsInput(1)
+            self.assertOutputIsInput(2)
+            self.assertRaisesOnCheck(ValueError, -1)
+            self.assertRaisesOnCheck(TypeError, 1.0)
+            self.assertRaisesOnCheck(TypeError, '1')
+
+        # Converted values are cached if they are immutable
+        self.checker = Cached(Optional(int, default_value=0))
+        self.assertOutputIs(None, 0)
+        self.assertOutputIs(None, 0)
+
+        self.checker = Cached(PathLike(suffix='.txt', as_path=True))
+        self.assertOutputEquals('a.txt', Path('a.txt'))
+        self.assertOutputEquals('a.txt', Path('a.txt'))
+
+        # Values that are equal but of different types are cached separately
+        self.checker = Cached(Tuple(int))
+        self.assertOutputIsInput((1, 2))
+        self.assertRaisesOnCheck(TypeError, (1.0, 2))
+
+        # Errors raised while checking the items of a collection refer to the argument's name
+        checker = Cached(Collection(Int(ge=0)))
+
+        @check_args
+        def fun(ids: checker):
+            return ids
+
+        for value in [(1, -1), frozenset({-1})]:
+            with self.assertRaisesRegex(ValueError, 'item [0-9]+ from ids'):
+                check(checker, value, name='ids')
+
+            with self.assertRaisesRegex(ValueError, 'item [0-9]+ from ids'):
+                fun(value)
+
+    def test_cache(self):
+        checker = Cached(String('[a-z]+'), maxsize=2)
+
+        for value in ['a', 'a', 'b', 'a', 'c', 'b']:
+            check(checker, value)
+
+        # Failed and mutable values are never cached
+        self.assertRaises(ValueError, check, checker, 'A')
+        self.assertRaises(ValueError, check, checker, 'A')
+        check(Cached(List(int)), [1])
+
+        info = checker.cache_info()
+        self.assertEqual(info, (2, 6, 2, 2))
+        self.assertAlmostEqual(info.hit_ratio, 0.25)
+
+        checker.cache_clear()
+        self.assertEqual(checker.cache_info(), (0, 0, 2, 0))
+        self.assertEqual(checker.cache_info().hit_ratio, 0.0)
+
+        # Compiled checks share the cache
+        check_ = compile_checker(checker)
+        check_('a')
+        check_('a')
+        check_('b')
+        self.assertEqual(checker.cache_info(), (1, 2, 2, 2))
+
+        # Disabled caches are never used
+        checker = Cached(int, enabled=False)
+        check(checker, 1)
+        check(checker, 1)
+        self.assertEqual(checker.cache_info(), (0, 0, 1024, 0))
+
+    def test_by_identity(self):
+        self.assertRaises(TypeError, Cached, int, by_identity=1)
+
+        checker = Cached(Tuple(Tuple(str, int)), maxsize=2, by_identity=True)
+        routes = tuple((str(i), i) for i in range(100))
+        self.assertIs(check(checker, routes), routes)
+        self.assertIs(check(checker, routes), routes)
+        self.assertEqual(checker.cache_info(), (1, 1, 2, 1))
+
+        # Equal containers are distinct objects, and are checked (and cached) separately
+        copy = tuple(list(routes))
+        self.assertIs(check(checker, copy), copy)
+        self.assertIs(check(checker, copy), copy)
+        self.assertEqual(checker.cache_info(), (2, 2, 2, 2))
+
+        # Failed containers are never cached
+        self.assertRaises(TypeError, check, checker, (('a', 1.0),))
+        self.assertRaises(TypeError, check, checker, (('a', 1.0),))
+        self.assertEqual(checker.cache_info(), (2, 4, 2, 2))
+
+        # Containers of mutable items are never cached, since their items may change between calls
+        checker = Cached(Tuple(List(int)), by_identity=True)
+        value = ([1],)
+        check(checker, value)
+        value[0].append('a')
+        self.assertRaises(TypeError, check, checker, value)
+        self.assertEqual(checker.cache_info().currsize, 0)
+
+        # Converted containers are cached if the result is immutable
+        checker = Cached(Tuple(Optional(int, default_value=0)), by_identity=True)
+        value = (None, 1)
+        self.assertEqual(check(checker, value), (0, 1))
+        self.assertIs(check(checker, value), check(checker, value))
+
+        checker.cache_clear()
+        self.assertEqual(checker.cache_info(), (0, 0, 1024, 0))
+
+    def test_pickle(self):
+        checker = Cached(Int(ge=0), maxsize=8)
+        check(checker, 1)
+
+        # The cache itself is not pickled
+        unpickled = pickle.loads(pickle.dumps(checker))
+        self.assertEqual(unpickled.cache_info(), (0, 0, 8, 0))
+        self.assertEqual(check(unpickled, 1), 1)
+        self.assertRaises(ValueError, check, unpickled, -1)
+        self.assertEqual(unpickled.cache_info(), (0, 2, 8, 1))
+
+    def test_intern_checker(self):
+        # The caches are not part of the key, so equal checkers intern together, before and after pickling
+        checker = Cached(Tuple(Int(ge=0)), maxsize=8)
+        check(checker, (1,))
+        self.assertEqual(checker.structural_key(), Cached(Tuple(Int(ge=0)), maxsize=8).structural_key())
+        self.assertEqual(checker.structural_key(), pickle.loads(pickle.dumps(checker)).structural_key())
+        self.assertNotEqual(checker.structural_key(), Cached(Tuple(Int(ge=0)), maxsize=9).structural_key())
+
+        interned = intern_checker(Cached(Tuple(Int(ge=0)), maxsize=8))
+        self.assertIs(intern_checker(Cached(Tuple(Int(ge=0)), maxsize=8)), interned)
+        self.assertIs(intern_checker(pickle.loads(pickle.dumps(interned))), interned)
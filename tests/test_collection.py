@@ -1,4 +1,4 @@
-from argscheck import Optional, Collection, Set, Iterator, Iterable
+from argscheck import Optional, Collection, Set, Iterator, Iterable, Tuple, check
 
 from tests.argscheck_test_case import TestCaseArgscheck
 from tests.mocks import MockCollection, MockIterator, MockIterable
@@ -23,6 +23,33 @@ class TestCollection(TestCaseArgscheck):
         self.assertRaisesOnCheck(ValueError, ())
         self.assertRaisesOnCheck(TypeError, 'abcd')
 
+    def test_shared_items(self):
+        # Shared tuples and frozensets are checked once per call
+        calls = []
+
+        class Counted(Tuple):
+            def check(self, name, value, **kwargs):
+                calls.append(value)
+                return super().check(name, value, **kwargs)
+
+        checker = Collection(Counted(int))
+        row, other = (1, 2), tuple([1, 2])
+        self.assertEqual(check(checker, [row, other, row, row]), [row, other, row, row])
+        self.assertEqual(calls, [row, other])
+        check(checker, [row])
+        self.assertEqual(len(calls), 3)
+
+        with self.assertRaisesRegex(TypeError, 'item 1 from rows'):
+            check(checker, [row, (1, 'a'), row], 'rows')
+
+        # References to the same item get the same converted item
+        checker = Collection(Tuple(Optional(int, default_value=0)))
+        row = (None, 1)
+        checked = check(checker, [row, row, tuple([None, 1])])
+        self.assertEqual(checked, [(0, 1)] * 3)
+        self.assertIs(checked[0], checked[1])
+        self.assertIsNot(checked[0], checked[2])
+
 
 class TestSet(TestCaseArgscheck):
     def test_check(self):
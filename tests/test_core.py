@@ -1,4 +1,23 @@
-from argscheck import Sized, One, Comparable, String, Int, Iterable, Iterator
+import copy
+import inspect
+import itertools
+import os
+import pickle
+import re
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+import types
+import typing
+from collections import UserList
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from argscheck import check, check_many, check_parallel, is_valid, check_args, precompile, compile_checker, \
+    intern_checker, set_repr_limits, set_disabled, set_check_level, set_code_cache, Cost, Sized, One, Comparable, \
+    String, Int, Iterable, Iterator, Optional, Sequence, Tuple, List, MutableSequence, PathLike, Number, Set, \
+    ExistingFile, Collection, NonNegativeInt
+from argscheck import utils
 
 from tests.argscheck_test_case import TestCaseArgscheck
 from tests.mocks import MockIterable, MockIterator
@@ -91,3 +110,867 @@ class TestOne(TestCaseArgscheck):
         self.checker = (int, Iterator[int])
         self.assertRaisesOnCheck(NotImplementedError, 1)
         self.assertRaisesOnCheck(NotImplementedError, MockIterator([1, 2, 3]))
+
+    def test_expected(self):
+        # Options without length bounds or comparators must not leave a dangling separator
+        for checker in [One(Sequence(int), str), One(String(), int), One(Set(int), int)]:
+            expected = checker.expected()[-1]
+            self.assertNotIn(', \n', expected)
+            self.assertNotIn(', ,', expected)
+            self.assertFalse(expected.endswith(', '))
+
+
+class TestCheck(TestCaseArgscheck):
+    def test_checker_likes_cache(self):
+        check.cache_clear()
+
+        # Resolving the same hashable checker-like twice is a miss followed by a hit
+        self.assertEqual(check((int, float), 1), 1)
+        self.assertEqual(check((int, float), 1.5), 1.5)
+        self.assertEqual(check(Int, 1), 1)
+        self.assertEqual(check(Int, 2), 2)
+        info = check.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 2, 2))
+
+        # Cached checkers still fail like fresh ones
+        self.assertRaises(TypeError, check, (int, float), 'a')
+
+        # Checker instances and unhashable checker-likes bypass the cache
+        check(Int(), 1)
+        check((str, Comparable(lt=3)), 1)
+        self.assertEqual(check.cache_info().currsize, 2)
+
+        check.cache_clear()
+        self.assertEqual(check.cache_info(), (0, 0, 256, 0))
+
+
+class TestCheckMany(TestCaseArgscheck):
+    def test_check_many(self):
+        checker = Optional(Int(ge=0), default_value=0)
+
+        self.assertEqual(check_many(checker, [1, None, 3]), [1, 0, 3])
+        self.assertEqual(check_many(checker, iter([])), [])
+
+        # The error raised for a failed value names its position
+        with self.assertRaisesRegex(ValueError, r'checking xs\[1\]'):
+            check_many(checker, [1, -2, 'a'], 'xs')
+
+        with self.assertRaisesRegex(TypeError, 'checking item 2'):
+            check_many(checker, [1, 2, 'a'])
+
+        # The alternative behaviour reports all failed values by their position
+        passed, values, errors = check_many(checker, [1, -2, None, 'a'], raise_on_error=False)
+        self.assertEqual(passed, bytearray([1, 0, 1, 0]))
+        self.assertEqual(values, [1, -2, 0, 'a'])
+        self.assertEqual(list(errors), [1, 3])
+        self.assertIsInstance(errors[1], ValueError)
+        self.assertIsInstance(errors[3], TypeError)
+
+        # Deferred checkers return wrappers
+        passed, values, errors = check_many(Iterable(int), [[1], ['a']], raise_on_error=False)
+        self.assertEqual(passed, bytearray([1, 1]))
+        self.assertEqual(next(iter(values[0])), (True, 1, 1))
+        self.assertFalse(next(iter(values[1]))[0])
+
+        self.assertRaises(TypeError, check_many, int, [1], raise_on_error=1)
+
+
+class TestCheckParallel(TestCaseArgscheck):
+    def test_check_parallel(self):
+        checker = Optional(Int(ge=0), default_value=0)
+        values = [1, None, 3] * 10
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(check_parallel(checker, values, executor=executor), [1, 0, 3] * 10)
+            self.assertEqual(check_parallel(checker, values, chunk_size=7, executor=executor), [1, 0, 3] * 10)
+            self.assertEqual(check_parallel(checker, [], executor=executor), [])
+
+            # The raised error is that of the first failed value
+            with self.assertRaisesRegex(ValueError, r'checking xs\[11\]'):
+                check_parallel(checker, values[:11] + [-1] + values + ['a'], 'xs', chunk_size=4, executor=executor)
+
+            # The alternative behaviour reports all failed values by their position
+            passed, new_values, errors = check_parallel(checker, values + [-2, 'a'], raise_on_error=False,
+                                                        chunk_size=4, executor=executor)
+            self.assertEqual(passed, bytearray([1] * 30 + [0, 0]))
+            self.assertEqual(new_values, [1, 0, 3] * 10 + [-2, 'a'])
+            self.assertEqual(list(errors), [30, 31])
+            self.assertIsInstance(errors[30], ValueError)
+            self.assertIsInstance(errors[31], TypeError)
+
+        # By default, a process pool is created for the call
+        self.assertEqual(check_parallel(String('[a-z]+'), {'a'}), ['a'])
+        self.assertEqual(check_parallel(String('[a-z]+'), ['a', 'b', 'c'], max_workers=2), ['a', 'b', 'c'])
+
+        with self.assertRaises(ValueError):
+            check_parallel(Int(ge=0), [-1] + list(range(100)), chunk_size=1, max_workers=1)
+
+        self.assertRaises(TypeError, check_parallel, Iterable(int), [[1]])
+        self.assertRaises(TypeError, check_parallel, int, [1], chunk_size=0)
+        self.assertRaises(TypeError, check_parallel, int, [1], max_workers=0)
+        self.assertRaises(TypeError, check_parallel, int, [1], raise_on_error=1)
+
+
+class TestPickle(TestCaseArgscheck):
+    def test_pickle(self):
+        checkers = [Int(ge=0), Number < 3, String('[a-z]+'), String(), Optional(int, default_value=0),
+                    Optional(List(int), default_factory=list), Sequence(Int(ge=0)), Set(str),
+                    PathLike(suffix='.txt', as_path=True), One(int, String('a')), Sized(len_ge=1)]
+        values = [0, -1, 2.5, 'abc', 'A', None, [1], [-1], {'a'}, {'c'}, 'a.txt', (1, 2)]
+
+        for checker in checkers:
+            checker._compile()
+
+            for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+                unpickled = pickle.loads(pickle.dumps(checker, protocol))
+                self.assertIs(type(unpickled), type(checker))
+                self.assertEqual(unpickled.structural_key(), checker.structural_key())
+
+                for value in values:
+                    expected = check(checker, value, raise_on_error=False)
+                    actual = check(unpickled, value, raise_on_error=False)
+                    self.assertEqual(actual[0], expected[0])
+                    self.assertEqual(type(actual[1]), type(expected[1]))
+
+                # Unpickled checkers are immutable too
+                with self.assertRaises(AttributeError):
+                    unpickled.types = (object,)
+
+        # Deferred checkers too
+        checker = pickle.loads(pickle.dumps(Iterable(int)))
+        self.assertEqual(list(check(checker, [1, 2])), [1, 2])
+
+
+class TestIsValid(TestCaseArgscheck):
+    def test_is_valid(self):
+        # A plain bool is returned, for checker-likes and checkers alike
+        self.assertIs(is_valid(int, 1), True)
+        self.assertIs(is_valid((int, str), 1.5), False)
+        self.assertIs(Int(ge=0).accepts(-1), False)
+        self.assertIs(One(Int, bool).accepts(True), False)
+
+        # Conversions are skipped, default factories are not called
+        factory_calls = []
+        checker = Sequence(Optional(Int, default_factory=lambda: factory_calls.append(1)))
+        self.assertTrue(checker.accepts([1, None]))
+        self.assertFalse(checker.accepts([1, 'a']))
+        self.assertEqual(factory_calls, [])
+
+        # Unless setting the converted items may fail, then the verdict is the same as check()'s
+        checker = MutableSequence(Optional(int, default_value=0))
+        self.assertTrue(is_valid(checker, [1, None]))
+        self.assertTrue(is_valid(checker, (1, 2)))
+        self.assertFalse(is_valid(checker, (1, None)))
+        self.assertRaises(TypeError, check, checker, (1, None))
+
+        self.assertTrue(is_valid(Collection(int), {1, 2}))
+        self.assertFalse(is_valid(Collection(int), {1: 2}.keys()))
+        self.assertFalse(is_valid(Collection(Int(ge=0)), {-1: 1}))
+
+        # Deferred checkers can not be evaluated
+        self.assertRaises(NotImplementedError, is_valid, Iterable(int), [1])
+        self.assertRaises(NotImplementedError, is_valid, Tuple(Iterator(int)), (iter([1]),))
+
+
+def _memory_per_instance(factory, n=200):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / len(instances)
+
+
+class TestSlots(TestCaseArgscheck):
+    def test_memory(self):
+        class DictLayout:
+            pass
+
+        objects = [Int(ge=0), List(int), String('a'), PathLike(suffix='.txt'), Optional(int), One(int, String),
+                   Int(ge=0).ge, check(Iterator(int), iter([]))]
+
+        for obj in objects:
+            self.assertFalse(hasattr(obj, '__dict__'), obj)
+
+            # The same attributes, in an instance __dict__
+            dict_obj = DictLayout()
+            for cls in type(obj).__mro__:
+                for name in vars(cls).get('__slots__', ()):
+                    if hasattr(obj, name) and name != '__weakref__':
+                        setattr(dict_obj, name, getattr(obj, name))
+
+            slots_size = _memory_per_instance(lambda: copy.copy(obj))
+            dict_size = _memory_per_instance(lambda: copy.copy(dict_obj))
+            self.assertLess(slots_size, dict_size, obj)
+
+        # Checkers defined outside of argscheck can still set any attribute
+        class Custom(Int):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.custom = 1
+
+        self.assertEqual(Custom(ge=0).custom, 1)
+        self.assertEqual(Custom(ge=0).ge.other, 0)
+
+
+class TestImmutable(TestCaseArgscheck):
+    def test_frozen(self):
+        checker = Int(ge=0)
+
+        with self.assertRaises(AttributeError):
+            checker.ge = 1
+        with self.assertRaises(AttributeError):
+            del checker.ge
+        with self.assertRaises(AttributeError):
+            checker.types = (float,)
+
+        # Shorthands on a checker return a new checker, and leave the original as it was
+        self.checker = checker
+        bounded = checker < 10
+        self.assertIsNot(bounded, checker)
+        self.assertIsNone(checker.lt)
+        self.assertOutputIsInput(10)
+        self.checker = bounded
+        self.assertRaisesOnCheck(ValueError, 10)
+        self.assertOutputIsInput(0)
+
+        # Shorthands are still validated
+        self.assertRaises(ValueError, lambda: checker < -1)
+        self.assertRaises(TypeError, lambda: checker > 1)
+
+    def test_threads(self):
+        checkers = [Int(ge=i) for i in range(50)]
+
+        def check_all(value):
+            return [is_valid(checker, value) for checker in checkers]
+
+        # Checkers are compiled and checked concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(check_all, range(-1, 51)))
+
+        self.assertEqual(results, [[value >= i for i in range(50)] for value in range(-1, 51)])
+
+    def test_shared(self):
+        # Class level shorthands return the same checker for equal arguments
+        self.assertIs(List[int], List[int])
+        self.assertIs(Optional[Set[str]], Optional[Set[str]])
+        self.assertIs(Sequence[int, str], Sequence[int, str])
+        self.assertIs(Int < 3, Int < 3)
+        self.assertIs(0.0 <= Number, 0.0 <= Number)
+        self.assertIsNot(List[int], List[str])
+        self.assertIsNot(List[int], Sequence[int])
+        self.assertIsNot(Int < 3, Int <= 3)
+
+        # Arguments that are equal but of different types are told apart
+        self.checker = Number < 1
+        self.assertRaisesOnCheck(ValueError, 1)
+        self.checker = Number < True
+        self.assertRaisesOnCheck(ValueError, 1)
+        self.assertIsNot(Number < 1, Number < 1.0)
+        self.assertIsNot(Number < 1, Number < True)
+
+        # Unhashable arguments, and arguments that fail, are not shared
+        self.assertIsNot(Comparable == [1], Comparable == [1])
+        self.assertRaises(TypeError, lambda: Int < 'a')
+        self.assertRaises(TypeError, lambda: Int < 'a')
+
+
+class TestDocstring(TestCaseArgscheck):
+    def test_lazy(self):
+        class Base(Int):
+            """
+            Base.
+
+            :param a: *int* – A.
+            """
+
+        class Sub(Base):
+            """
+            Sub.
+
+            :param b: *int* – B.
+            """
+
+        # Docstrings are extended when first read, from the class, from an instance or by inspect
+        self.assertIsInstance(vars(Sub)['__doc__'], utils._LazyDocString)
+        doc = inspect.getdoc(Sub)
+        self.assertIsInstance(vars(Sub)['__doc__'], str)
+        self.assertIsInstance(vars(Base)['__doc__'], str)
+        self.assertLess(doc.index(':param b:'), doc.index(':param a:'))
+        self.assertLess(doc.index(':param a:'), doc.index(':param lt:'))
+        self.assertEqual(Sub().__doc__, Sub.__doc__)
+
+        # Or all at once
+        class Other(Sub):
+            pass
+
+        utils.resolve_docstrings(Base)
+        self.assertIsInstance(vars(Other)['__doc__'], str)
+        self.assertIn(':param b:', Other.__doc__)
+
+
+class TestCost(TestCaseArgscheck):
+    def test_cost(self):
+        self.assertEqual(Number().cost(), Cost.TYPE)
+        self.assertEqual(Int(ge=0).cost(), Cost.VALUE)
+        self.assertEqual(String('[a-z]+').cost(), Cost.VALUE)
+        self.assertEqual(Sequence(int).cost(), Cost.ITEMS)
+        self.assertEqual(Collection(String('a')).cost(), Cost.ITEMS)
+        self.assertEqual(Optional(Iterable(int)).cost(), Cost.ITEMS)
+        self.assertEqual(ExistingFile(suffix='.txt').cost(), Cost.IO)
+        self.assertEqual(One(Int(ge=0), Int(lt=0)).cost(), Cost.VALUE)
+
+    def test_at_level(self):
+        checker = Sequence(Int(ge=0), len_ge=1)
+        self.assertIs(checker.at_level(Cost.ITEMS), checker)
+        self.assertIs(checker.at_level(Cost.VALUE), checker.at_level(Cost.VALUE))
+
+        # Items are not even accessed below the ITEMS tier
+        class Unreadable(list):
+            def __getitem__(self, item):
+                raise AssertionError('items must not be accessed')
+
+        self.checker = checker.at_level(Cost.VALUE)
+        self.assertOutputIsInput(Unreadable([-1]))
+        self.assertRaisesOnCheck(ValueError, [])
+        self.assertRaisesOnCheck(TypeError, 1)
+
+        self.checker = checker.at_level(Cost.TYPE)
+        self.assertOutputIsInput([])
+
+        # Conversions are still applied
+        self.checker = Optional(String('[a-z]+'), default_value='a').at_level(Cost.TYPE)
+        self.assertOutputIsInput('A')
+        self.assertOutputIs(None, 'a')
+        self.assertRaisesOnCheck(TypeError, 1)
+
+        self.checker = ExistingFile(suffix='.txt').at_level(Cost.ITEMS)
+        self.assertOutputIsInput('missing.txt')
+        self.assertRaisesOnCheck(ValueError, 'missing.csv')
+
+        # The options of One are checked in full, otherwise more than one of them could pass
+        checker = One(Int(ge=0), Int(lt=0))
+        self.assertIs(checker.at_level(Cost.TYPE), checker)
+        self.checker = checker.at_level(Cost.TYPE)
+        self.assertOutputIsInput(5)
+        self.assertOutputIsInput(-5)
+        self.assertRaisesOnCheck(Exception, 1.5)
+
+    def test_set_check_level(self):
+        checker = Sequence(Int(ge=0), len_ge=1)
+        set_check_level(Cost.VALUE)
+
+        try:
+            self.assertEqual(check(checker, [-1]), [-1])
+            self.assertRaises(ValueError, check, checker, [])
+            self.assertTrue(is_valid(checker, [-1]))
+            self.assertEqual(check_many(checker, [[-1]]), [[-1]])
+            self.assertEqual(compile_checker(checker)([-1]), [-1])
+
+            @check_args
+            def fun(x: checker):
+                return x
+
+            @check_args(level=Cost.IO)
+            def fun_all(x: checker):
+                return x
+
+            @check_args(level=Cost.IO)
+            def fun_default(x: checker = (-1,)):
+                return x
+        finally:
+            set_check_level()
+
+        # check_args uses the level when it is applied, defaults included
+        self.assertEqual(fun([-1]), [-1])
+        self.assertRaises(ValueError, fun_all, [-1])
+        self.assertRaises(ValueError, fun_default)
+        self.assertRaises(ValueError, check, checker, [-1])
+
+        self.assertRaises(ValueError, set_check_level, 5)
+        self.assertRaises(ValueError, check_args, level=0)
+        self.assertRaises(TypeError, set_check_level, 'VALUE')
+        self.assertRaises(TypeError, check_args, level=True)
+
+        # The environment variable sets the level from import
+        code = 'import argscheck; print(argscheck.check(argscheck.List(argscheck.Int(ge=0)), [-1]))'
+        env = dict(os.environ, ARGSCHECK_LEVEL='value', PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout, '[-1]\n')
+
+
+class TestInternChecker(TestCaseArgscheck):
+    def test_structural_key(self):
+        def key(checker):
+            return checker.structural_key()
+
+        # Equal arguments give equal keys
+        self.assertEqual(key(Int(ge=0)), key(Int(ge=0)))
+        self.assertEqual(key(Sequence(Int(ge=0), len_ge=1)), key(Sequence(Int(ge=0), len_ge=1)))
+        self.assertEqual(key(String('a+', re.I)), key(String('a+', re.I)))
+        self.assertEqual(key(Optional(int, default_value=0)), key(Optional(int, default_value=0)))
+        self.assertEqual(key(PathLike(suffix='.txt')), key(PathLike(suffix='.TXT')))
+        self.assertEqual(key(One(int, String)), key(One(int, String)))
+
+        # Different classes or arguments give different keys
+        self.assertNotEqual(key(Int(ge=0)), key(Int(ge=1)))
+        self.assertNotEqual(key(Int(ge=0)), key(Int(gt=0)))
+        self.assertNotEqual(key(Int(ge=0)), key(Number(ge=0)))
+        self.assertNotEqual(key(Number(ge=0)), key(Number(ge=0.0)))
+        self.assertNotEqual(key(String('a+')), key(String('a+', re.I)))
+        self.assertNotEqual(key(Optional(int, default_value=0)), key(Optional(int, default_value=False)))
+        self.assertNotEqual(key(Sequence(Int(ge=0))), key(Sequence(Int(ge=1))))
+
+        # Shorthands create a new checker with its own key
+        checker = Int(ge=0)
+        self.assertEqual(key(checker < 9), key(Int(ge=0, lt=9)))
+        self.assertEqual(key(checker), key(Int(ge=0)))
+
+        # Unhashable (i.e. mutable) arguments have no key
+        self.assertRaises(TypeError, key, Comparable(ne=[1, 2]))
+        self.assertRaises(TypeError, key, Set(str) <= {'a', 'b'})
+        self.assertRaises(TypeError, key, Optional(int, default_value=[]))
+
+    def test_intern_checker(self):
+        checker = intern_checker(Sequence(Int(ge=0)))
+        self.assertIs(intern_checker(Sequence(Int(ge=0))), checker)
+        self.assertIsNot(intern_checker(Sequence(Int(ge=1))), checker)
+        self.assertIs(intern_checker(int), intern_checker(int))
+
+        # Only checkers of the same class are unified, shorthands are not normalized to their base class
+        self.assertIsNot(intern_checker(NonNegativeInt()), intern_checker(Int(ge=0)))
+
+        # Checkers with unhashable arguments are returned as-is
+        checker = Comparable(ne=[1, 2])
+        self.assertIs(intern_checker(checker), checker)
+
+        # Structurally equal checkers share their compiled forms
+        self.assertIs(compile_checker(Int(ge=3)), compile_checker(Int(ge=3)))
+        self.assertIsNot(compile_checker(Int(ge=3)), compile_checker(Int(ge=4)))
+
+
+class TestCheckError(TestCaseArgscheck):
+    def test_lazy_message(self):
+        checker = Int(ge=0)
+        message = "encountered an error while checking x:\nACTUAL: -1\nEXPECTED: an instance of <class 'int'>, " \
+                  "greater than or equal to 0"
+
+        # The error is a ValueError whose message is formatted on demand
+        passed, error = checker.check('x', -1)
+        self.assertFalse(passed)
+        self.assertIsInstance(error, ValueError)
+        self.assertIs(type(error), type(checker.check('y', -2)[1]))
+        self.assertIsNot(type(error), ValueError)
+        self.assertEqual(str(error), message)
+        self.assertEqual(error.args, (message,))
+        self.assertEqual(repr(error), repr(ValueError(message)))
+
+        # expected() is computed once, also for a checker created from it
+        self.assertIs(checker._expected(), checker._expected())
+        checker = checker < 9
+        expected = message.replace('-1', '9').replace('greater', 'less than 9, greater')
+        self.assertEqual(checker.check('x', 9)[1].args, (expected,))
+
+        # The message shows the value as it was checked, even if it is mutated later
+        value = [1, 2]
+        mutated_error = Sized(len_le=1).check('x', value)[1]
+        value.append(3)
+        self.assertIn('ACTUAL: [1, 2]\n', str(mutated_error))
+
+        # Pickling keeps the type and the message
+        unpickled = pickle.loads(pickle.dumps(error))
+        self.assertIsInstance(unpickled, ValueError)
+        self.assertEqual(str(unpickled), message)
+
+    def test_repr_limits(self):
+        def actual(checker, value):
+            return str(checker.check('x', value)[1]).split('\n')[1]
+
+        # Small values are shown in full
+        self.assertEqual(actual(Int(), [1, 'a', (2.0,)]), "ACTUAL: [1, 'a', (2.0,)]")
+
+        # Large and deeply nested values are truncated
+        try:
+            set_repr_limits(max_length=30, max_items=3, max_level=2)
+            self.assertEqual(actual(Int(), list(range(10 ** 6))), 'ACTUAL: [0, 1, 2, ...]')
+            self.assertEqual(actual(Int(), [[[1]]]), 'ACTUAL: [[[...]]]')
+
+            # Subclasses and lookalikes of builtin containers too
+            class Rows(list):
+                pass
+
+            self.assertEqual(actual(Int(), Rows(range(10 ** 6))), 'ACTUAL: [0, 1, 2, ...]')
+            self.assertEqual(actual(Int(), UserList(range(10 ** 6))), 'ACTUAL: UserList([0, 1, 2, ...])')
+
+            # Large dicts and sets are not sorted, only small ones (which are shown in full) are
+            self.assertEqual(actual(Int(), dict.fromkeys(range(10 ** 6), 0)), 'ACTUAL: {0: 0, 1: 0, 2: 0, ...}')
+            self.assertEqual(actual(Int(), set(range(10 ** 6))), 'ACTUAL: {0, 1, 2, ...}')
+            self.assertEqual(actual(Int(), frozenset(range(10 ** 6))), 'ACTUAL: frozenset({0, 1, 2, ...})')
+            self.assertEqual(actual(Int(), {3: 0, 1: 0}), 'ACTUAL: {1: 0, 3: 0}')
+            self.assertEqual(actual(Int(), {3, 2, 1}), 'ACTUAL: {1, 2, 3}')
+            self.assertEqual(actual(Sequence(Int), [1, 'a' * 100]), "ACTUAL: '" + 'a' * 12 + '...' + 'a' * 13 + "'")
+            self.assertRaises(TypeError, set_repr_limits, max_items=-1)
+        finally:
+            set_repr_limits()
+
+
+class TestCompileChecker(TestCaseArgscheck):
+    def test_compile_checker(self):
+        checker = Sequence(Optional(Int(ge=0), default_value=0), len_ge=1)
+        compiled = compile_checker(checker)
+
+        # Same results and same error messages as check()
+        self.assertEqual(compiled((1, None)), (1, 0))
+        for value in [(), (1, -1), [1, 'a'], 1]:
+            with self.assertRaises(Exception) as expected:
+                check(checker, value, 'x')
+            with self.assertRaises(type(expected.exception)) as actual:
+                compiled(value, 'x')
+            self.assertEqual(str(actual.exception), str(expected.exception))
+
+        # Alternative behaviour
+        compiled = compile_checker(checker, raise_on_error=False)
+        self.assertEqual(compiled([None]), (True, [0], [None]))
+        passed, e, value = compiled([-1])
+        self.assertFalse(passed)
+        self.assertIsInstance(e, ValueError)
+        self.assertEqual(value, [-1])
+
+        # Deferred checkers return a wrapper
+        iterator = compile_checker(Optional(Iterator(int)))(iter([1, 'a']))
+        self.assertEqual(next(iterator), 1)
+        self.assertRaises(TypeError, next, iterator)
+
+        self.assertRaises(TypeError, compile_checker, int, raise_on_error=1)
+
+    def test_code_cache(self):
+        def fun(code_cache_x: Int(ge=0), code_cache_y: String('[a-z]+') = 'a'):
+            return code_cache_x, code_cache_y
+
+        self.assertRaises(TypeError, set_code_cache, 1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            set_code_cache(directory)
+
+            try:
+                # Compiled code is stored on the first time
+                checked = check_args(fun)
+                self.assertEqual(checked(1), (1, 'a'))
+                self.assertRaises(ValueError, checked, -1)
+                entries = [os.path.join(root, name) for root, _, names in os.walk(directory) for name in names]
+                self.assertTrue(entries)
+
+                # And loaded from then on (compiling is made to fail to be sure), with the file name of the new function
+                utils.compile = None
+
+                try:
+                    loaded = check_args(fun)
+                finally:
+                    del utils.compile
+
+                self.assertEqual(loaded(1, 'b'), (1, 'b'))
+                self.assertRaises(ValueError, loaded, 1, 'B')
+                self.assertNotEqual(loaded.__code__.co_filename, checked.__code__.co_filename)
+                self.assertTrue(loaded.__code__.co_filename.startswith('<argscheck check_args fun'))
+
+                # Corrupt entries are compiled again and replaced (the checkers themselves are already compiled, only
+                # the function decorated with check_args is compiled again)
+                for entry in entries:
+                    with open(entry, 'wb') as file:
+                        file.write(b'corrupt')
+
+                self.assertRaises(ValueError, check_args(fun), 1, 'B')
+                contents = []
+
+                for entry in entries:
+                    with open(entry, 'rb') as file:
+                        contents.append(file.read())
+
+                self.assertEqual(contents.count(b'corrupt'), len(entries) - 1)
+            finally:
+                set_code_cache()
+
+            # Once turned off, nothing is stored
+            for entry in entries:
+                os.remove(entry)
+
+            check_args(fun)
+            self.assertFalse([name for _, _, names in os.walk(directory) for name in names])
+
+
+class TestCheckArgs(TestCaseArgscheck):
+    def test_parameter_kinds(self):
+        @check_args
+        def fun(a: int, b: Optional(int, default_value=3) = None, /, c: String = 'c', *args: Tuple(int), d: Int > 0,
+                e=None, **kwargs: dict):
+            return a, b, c, args, d, e, kwargs
+
+        self.assertEqual(fun(1, d=2), (1, 3, 'c', (), 2, None, {}))
+        self.assertEqual(fun(1, None, 'x', 5, 6, d=3, e=[], f='f'), (1, 3, 'x', (5, 6), 3, [], {'f': 'f'}))
+        self.assertEqual(fun(1, 2, c='x', d=3), (1, 2, 'x', (), 3, None, {}))
+        self.assertRaises(TypeError, fun, 'a', d=1)
+        self.assertRaises(TypeError, fun, 1, 2, 'c', 'x', d=1)
+        self.assertRaises(ValueError, fun, 1, d=0)
+        self.assertRaises(TypeError, fun, d=1)
+        self.assertRaises(TypeError, fun, 1)
+
+        # The decorated function looks like the original one
+        self.assertEqual(fun.__name__, 'fun')
+        self.assertEqual(str(inspect.signature(fun)), str(inspect.signature(fun.__wrapped__)))
+
+    def test_method(self):
+        class Class:
+            @check_args
+            def method(self, x: Int):
+                return self, x
+
+        obj = Class()
+        self.assertEqual(obj.method(1), (obj, 1))
+        self.assertRaises(TypeError, obj.method, 1.0)
+
+    def test_raise_on_error(self):
+        @check_args(raise_on_error=False)
+        def fun(x: Int, *, y: Optional(int, default_value=0) = None):
+            return x, y
+
+        self.assertEqual(fun(1), ((True, 1, 1), (True, 0, None)))
+        (passed, e, x), _ = fun('a')
+        self.assertFalse(passed)
+        self.assertIsInstance(e, TypeError)
+        self.assertEqual(x, 'a')
+
+        # Parameters may be named like the builtins used by the generated code
+        @check_args(raise_on_error=False)
+        def fun(isinstance: Int):
+            return isinstance
+
+        self.assertEqual(fun(1), (True, 1, 1))
+
+        self.assertRaises(TypeError, check_args, raise_on_error=1)
+
+    def test_check_defaults_once(self):
+        calls = []
+
+        class Counted(Int, types=(int,)):
+            def check(self, name, value, **kwargs):
+                calls.append(name)
+
+                return super().check(name, value, **kwargs)
+
+        @check_args
+        def fun(a: Counted = 1, b: Optional(int, default_value=5) = None, c: Counted = None):
+            return a, b, c
+
+        # Valid immutable defaults are checked once, when decorating
+        self.assertEqual(calls, ['a', 'c'])
+        self.assertEqual(fun(c=0), (1, 5, 0))
+        self.assertEqual(calls, ['a', 'c', 'c'])
+
+        # Passed arguments are still checked
+        self.assertEqual(fun(2, 3, 0), (2, 3, 0))
+        self.assertEqual(calls, ['a', 'c', 'c', 'a', 'c'])
+        self.assertRaises(TypeError, fun, 'a', c=0)
+
+        # Invalid defaults fail on each call that omits them, just like without checking once
+        self.assertRaises(TypeError, fun)
+        self.assertRaises(TypeError, fun, 1)
+
+        # Mutable defaults are checked on every call
+        @check_args
+        def fun(x: List(int) = []):
+            x.append('a')
+
+            return x
+
+        fun()
+        self.assertRaises(TypeError, fun)
+
+        # Opting out checks defaults on every call
+        @check_args(check_defaults_once=False)
+        def fun(x: Counted = 1):
+            return x
+
+        del calls[:]
+        fun()
+        fun()
+        self.assertEqual(calls, ['x', 'x'])
+        self.assertRaises(TypeError, check_args, check_defaults_once=None)
+
+    def test_disabled(self):
+        def fun(x: Int(ge=0)):
+            return x
+
+        set_disabled()
+
+        try:
+            # Decorated functions are returned as-is, check() returns the value as-is
+            self.assertIs(check_args(fun), fun)
+            self.assertIs(check_args(check_defaults_once=False)(fun), fun)
+            self.assertEqual(check(Int(ge=0), -1), -1)
+            self.assertEqual(check(int, 'a', raise_on_error=False), (True, 'a', 'a'))
+
+            # Functions that expect the results of checks are still checked
+            self.assertFalse(check_args(raise_on_error=False)(fun)(-1)[0])
+        finally:
+            set_disabled(False)
+
+        self.assertIsNot(check_args(fun), fun)
+        self.assertRaises(ValueError, check, Int(ge=0), -1)
+        self.assertRaises(TypeError, set_disabled, 1)
+
+        # The environment variable disables checking from import
+        code = 'import argscheck; print(argscheck.check(int, "a"))'
+        env = dict(os.environ, ARGSCHECK_DISABLE='1', PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout, 'a\n')
+
+    def test_type_signatures(self):
+        calls = []
+
+        class Counted(Int):
+            __slots__ = ()
+
+            def check(self, name, value, **kwargs):
+                calls.append(value)
+                return super().check(name, value, **kwargs)
+
+        @check_args
+        def fun(a: int, b: Int(ge=0), c: List(int), d: Optional(str) = None, *, e: String() = 'x'):
+            return a, b, c, d, e
+
+        # Value dependent parts are still checked once the types passed
+        for _ in range(2):
+            self.assertEqual(fun(1, 2, [3]), (1, 2, [3], None, 'x'))
+            self.assertEqual(fun(1, 2, [3], 'q', e='z'), (1, 2, [3], 'q', 'z'))
+            self.assertRaises(ValueError, fun, 1, -1, [3])
+            self.assertRaises(TypeError, fun, 1, 2, ['x'])
+
+        self.assertEqual(len(fun.__globals__['_argscheck_types']), 2)
+
+        # Types are remembered exactly, e.g. a bool is not an int for this purpose, and types that fail are not
+        # remembered at all
+        self.assertEqual(fun(True, 2, [3]), (True, 2, [3], None, 'x'))
+        self.assertRaises(TypeError, fun, 1.0, 2, [3])
+        self.assertRaises(TypeError, fun, 1, 2.0, [3])
+        self.assertEqual(len(fun.__globals__['_argscheck_types']), 3)
+
+        # Checkers that can not skip their type check (e.g. a subclass that overrides check()) are called as usual
+        @check_args
+        def fun(a: int, b: Counted()):
+            return a, b
+
+        fun(1, 2)
+        fun(1, 3)
+        self.assertEqual(calls, [2, 3])
+
+        # The number of remembered signatures is bounded
+        @check_args
+        def fun(a: object, b: int):
+            return b
+
+        for i in range(300):
+            fun(type(f'Class{i}', (), {})(), i)
+
+        self.assertEqual(len(fun.__globals__['_argscheck_types']), 256)
+
+        # Types for which isinstance() depends on the value itself, not only on its type
+        @typing.runtime_checkable
+        class HasName(typing.Protocol):
+            name: str
+
+        class Named:
+            pass
+
+        named, unnamed = Named(), Named()
+        named.name = 'a'
+
+        @check_args
+        def fun(x: HasName, y: List(HasName)):
+            return x
+
+        self.assertIs(fun(named, [named]), named)
+        self.assertRaises(TypeError, fun, unnamed, [named])
+        self.assertRaises(TypeError, fun, named, [unnamed])
+
+        class Positive(type):
+            def __instancecheck__(cls, instance):
+                return isinstance(instance, int) and instance > 0
+
+        class PositiveInt(metaclass=Positive):
+            pass
+
+        @check_args
+        def fun(x: PositiveInt, y: Sequence(PositiveInt)):
+            return x
+
+        self.assertEqual(fun(1, [1]), 1)
+        self.assertRaises(TypeError, fun, -1, [1])
+        self.assertRaises(TypeError, fun, 1, [-1])
+
+        # Parameters may be named like the builtins used by the generated code
+        @check_args
+        def fun(type: int, len: Int(ge=0)):
+            return type, len
+
+        for _ in range(2):
+            self.assertEqual(fun(1, 2), (1, 2))
+            self.assertRaises(ValueError, fun, 1, -2)
+
+    def test_lazy(self):
+        def fun(x: Int(ge=0), y: int = 1):
+            return x, y
+
+        # Checkers are built on the first call, and only once
+        lazy_fun = check_args(lazy=True)(fun)
+        self.assertEqual(lazy_fun.__name__, 'fun')
+        self.assertEqual(lazy_fun(1), (1, 1))
+        self.assertRaises(ValueError, lazy_fun, -1)
+        self.assertRaises(TypeError, lazy_fun, 1, '2')
+        self.assertFalse(lazy_fun._argscheck_build())
+
+        # Errors in annotations are raised on the first call
+        @check_args(lazy=True)
+        def bad(x: 1):
+            return x
+
+        self.assertRaises(TypeError, bad, 1)
+        self.assertRaises(TypeError, check_args, lazy=1)
+
+        # Methods, and concurrent first calls
+        class Class:
+            @check_args(lazy=True)
+            def method(self, x: Int(ge=0)):
+                return x
+
+            @staticmethod
+            @check_args(lazy=True)
+            def static(x: Int(ge=0)):
+                return x
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            self.assertEqual(list(executor.map(Class().method, range(8))), list(range(8)))
+
+        # Precompile modules, classes, functions and iterables of those, only functions that were not built yet are
+        # counted, and imported functions are skipped
+        module = types.ModuleType('module')
+        module.fun = check_args(lazy=True)(fun)
+        module.fun.__module__ = 'module'
+        module.Class = Class
+        Class.__module__ = 'module'
+        module.imported = check_args(lazy=True)(fun)
+        other = check_args(lazy=True)(fun)
+
+        self.assertEqual(precompile(module), 2)
+        self.assertEqual(precompile([module, Class, other], check_args(fun)), 1)
+        self.assertEqual(precompile(module.imported, other), 1)
+
+        # Iterables in classes are not expanded, they may be iterators, or endless ones
+        class Attributes:
+            values = iter(range(5))
+            counter = itertools.count()
+
+        self.assertEqual(precompile(Attributes), 0)
+        self.assertEqual(list(Attributes.values), list(range(5)))
+        self.assertEqual(Class.static(3), 3)
+        self.assertRaises(ValueError, Class.static, -3)
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+import argscheck
+
+from tests.argscheck_test_case import TestCaseArgscheck
+
+
+COLD_IMPORT = '''
+import sys
+
+import argscheck
+print(' '.join(sorted(sys.modules)))
+'''
+
+
+def cold_import():
+    """Import argscheck in a fresh interpreter, return the names of all imported modules."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run([sys.executable, '-c', COLD_IMPORT], env=env, capture_output=True, text=True,
+                            check=True).stdout
+
+    return set(output.split())
+
+
+class TestImport(TestCaseArgscheck):
+    def test_lazy_submodules(self):
+        # The import time itself is measured by benchmarks/bench_import.py
+        modules = cold_import()
+
+        # Submodules (and the modules they depend on) are only imported when one of their names is accessed
+        for name in ['sampling', 'string', 'collection', 'sequence', 'iter', 'pathlike']:
+            self.assertNotIn(f'argscheck.{name}', modules)
+
+        self.assertNotIn('pathlib', modules)
+        self.assertNotIn('concurrent.futures', modules)
+
+        # All names can be imported, and are listed by dir()
+        for name in argscheck.__all__:
+            self.assertIsNotNone(getattr(argscheck, name))
+            self.assertIn(name, dir(argscheck))
+
+        self.assertIs(argscheck.pathlike.PathLike, argscheck.PathLike)
+        self.assertRaises(AttributeError, getattr, argscheck, 'Missing')
+
+        with self.assertRaises(ImportError):
+            from argscheck import Missing  # noqa: F401
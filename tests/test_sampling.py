@@ -0,0 +1,84 @@
+from unittest import mock
+
+from argscheck import check_args, EveryNth, RandomFraction, FirstN, RateLimit, Int, Optional
+
+from tests.argscheck_test_case import TestCaseArgscheck
+
+
+class TestSampling(TestCaseArgscheck):
+    def sampled(self, policy, calls):
+        return [policy() for _ in range(calls)]
+
+    def test_init(self):
+        # Good arguments
+        EveryNth(1)
+        RandomFraction(0)
+        RandomFraction(0.5, seed=1)
+        FirstN(0)
+        RateLimit(100)
+
+        # Bad arguments
+        self.assertRaises(ValueError, EveryNth, 0)
+        self.assertRaises(TypeError, EveryNth, 2.0)
+        self.assertRaises(ValueError, RandomFraction, 1.5)
+        self.assertRaises(ValueError, RandomFraction, -0.5)
+        self.assertRaises(TypeError, RandomFraction, True)
+        self.assertRaises(TypeError, RandomFraction, '0.5')
+        self.assertRaises(ValueError, FirstN, -1)
+        self.assertRaises(TypeError, FirstN, 1.0)
+        self.assertRaises(ValueError, RateLimit, -1)
+        self.assertRaises(TypeError, RateLimit, None)
+        self.assertRaises(TypeError, check_args, sample=1)
+
+    def test_policies(self):
+        policy = EveryNth(3)
+        self.assertEqual(self.sampled(policy, 7), [True, False, False, True, False, False, True])
+        self.assertEqual((policy.checked, policy.skipped), (3, 4))
+
+        policy.reset()
+        self.assertEqual((policy.checked, policy.skipped), (0, 0))
+        self.assertEqual(self.sampled(EveryNth(1), 3), [True] * 3)
+
+        policy = RandomFraction(0.25, seed=0)
+        self.assertEqual(sum(self.sampled(policy, 1000)), policy.checked)
+        self.assertTrue(200 < policy.checked < 300)
+        self.assertEqual(self.sampled(RandomFraction(0.25, seed=1), 10), self.sampled(RandomFraction(0.25, seed=1), 10))
+        self.assertEqual(self.sampled(RandomFraction(0.0), 10), [False] * 10)
+        self.assertEqual(self.sampled(RandomFraction(1.0), 10), [True] * 10)
+
+        policy = FirstN(2)
+        self.assertEqual(self.sampled(policy, 4), [True, True, False, False])
+        policy.reset()
+        self.assertEqual(self.sampled(policy, 3), [True, True, False])
+
+        # At most per_second calls are checked in each one second window
+        policy = RateLimit(2)
+
+        with mock.patch('time.monotonic', side_effect=[0.0, 0.1, 0.2, 0.9, 1.0, 1.5, 2.5]):
+            self.assertEqual(self.sampled(policy, 7), [True, True, False, False, True, True, True])
+
+        self.assertEqual(repr(policy), 'RateLimit(checked=5, skipped=2)')
+
+    def test_check_args(self):
+        policy = EveryNth(2)
+
+        @check_args(sample=policy)
+        def fun(x: Int(ge=0), y: Optional(int, default_value=3) = None):
+            return x, y
+
+        # Only every other call is checked, but checked defaults and conversions are always used
+        self.assertRaises(ValueError, fun, -1)
+        self.assertEqual(fun(-1), (-1, 3))
+        self.assertEqual(fun(1, None), (1, 3))
+        self.assertEqual(fun(-1, None), (-1, 3))
+        self.assertEqual(fun(1, 2), (1, 2))
+        self.assertEqual(fun(-1, 2), (-1, 2))
+        self.assertEqual((policy.checked, policy.skipped), (3, 3))
+
+        @check_args(raise_on_error=False, sample=FirstN(1))
+        def fun(x: Int(ge=0), y: Optional(int, default_value=3) = None):
+            return x, y
+
+        self.assertEqual(fun(1), ((True, 1, 1), (True, 3, None)))
+        self.assertEqual(fun(-1), ((True, -1, -1), (True, 3, None)))
+        self.assertEqual(fun(-1, None), ((True, -1, -1), (True, 3, None)))
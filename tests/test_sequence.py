@@ -1,4 +1,7 @@
-from argscheck import Optional, List, Tuple, Sequence, Iterable, Iterator
+import collections.abc
+import sys
+
+from argscheck import check, Optional, List, Tuple, Sequence, Iterable, Iterator, Collection, Int
 
 from tests.argscheck_test_case import TestCaseArgscheck
 from tests.mocks import MockIterable, MockIterator
@@ -18,6 +21,105 @@ class TestSequence(TestCaseArgscheck):
         self.assertRaisesOnCheck(ValueError, [[1, 'a'], [2, 3]])
         self.assertRaisesOnCheck(ValueError, [[1, 'a'], [2, 3, 4], ['b', 'c']])
 
+    def test_nested(self):
+        # Errors refer to the failed item, wherever it is nested
+        checker = Sequence(List(Tuple(Int(ge=0))))
+        value = [[(1, 2)] * 5] * 3 + [[(1, 2)] * 7 + [(1, -1)]]
+
+        for name, item_name in [('x', 'x[3][7][1]'), ('', 'sequence item 3[7][1]')]:
+            with self.assertRaises(ValueError) as context:
+                check(checker, value, name)
+            self.assertIn(f'checking {item_name}:', str(context.exception))
+
+        with self.assertRaises(TypeError) as context:
+            check(checker, [[(1,)], [(1,), [1]]], 'x')
+        self.assertIn('checking x[1][1]:', str(context.exception))
+
+        with self.assertRaises(TypeError) as context:
+            check(Sequence(Sequence(Collection(int))), [[{1}], [{'a'}]], 'x')
+        self.assertIn('from x[1][0]:', str(context.exception))
+
+        # Converted items are set (or a new sequence is created) at each level, unconverted ones are returned as-is
+        checker = List(Tuple(List(Optional(int, default_value=0))))
+        value = [([1], [2]), ([3], [None])]
+        inner = value[0]
+        self.assertEqual(check(checker, value), [([1], [2]), ([3], [0])])
+        self.assertIs(value[0], inner)
+
+        self.checker = Tuple(Tuple(Optional(int, default_value=0)))
+        self.assertOutputIsInput(((1, 2), (3,)))
+        self.assertOutputEquals(((1, 2), (None, 3)), ((1, 2), (0, 3)))
+
+        # Wide sequences, whose items are checked by a compiled function
+        self.checker = Sequence(Sequence(Int(ge=0)))
+        self.assertOutputIsInput([list(range(100))] * 3)
+
+        with self.assertRaises(ValueError) as context:
+            check(self.checker, [list(range(100))] * 2 + [list(range(40)) + [-1]], 'x')
+        self.assertIn('checking x[2][40]:', str(context.exception))
+
+        # Nesting is not limited by the recursion limit
+        checker, value = int, 1
+
+        for _ in range(sys.getrecursionlimit() * 2):
+            checker, value = Sequence(checker), [value]
+
+        self.assertIs(check(checker, value), value)
+        self.assertRaises(TypeError, check, checker, [[['a']]])
+
+    def test_shared_items(self):
+        # Shared tuples and frozensets are checked once per call
+        calls = []
+
+        class Counted(Tuple):
+            def check(self, name, value, **kwargs):
+                calls.append(value)
+                return super().check(name, value, **kwargs)
+
+        checker = List(Counted(int))
+        row, other = (1, 2), tuple([1, 2])
+        value = [row, other, row, row]
+        self.assertIs(check(checker, value), value)
+        self.assertEqual(calls, [row, other])
+        check(checker, [row])
+        self.assertEqual(len(calls), 3)
+        self.assertRaises(TypeError, check, checker, [row, (1, 'a'), row])
+
+        self.checker = Tuple(Tuple(Optional(int, default_value=0)))
+        row = (None, 1)
+        checked = check(self.checker, (row, row, tuple([None, 1])))
+        self.assertEqual(checked, ((0, 1),) * 3)
+        self.assertIs(checked[0], checked[1])
+        self.assertIsNot(checked[0], checked[2])
+
+        # Items created on access may be freed once checked, and their identities reused by later items
+        class Rows(collections.abc.Sequence):
+            def __init__(self, rows):
+                self.rows = rows
+
+            def __len__(self):
+                return len(self.rows)
+
+            def __getitem__(self, i):
+                return tuple(self.rows[i])
+
+        rows = [[None] * 25 + [i] for i in range(2000)]
+        checked = check(Sequence(Tuple(Optional(int, default_value=0))), Rows(rows))
+        self.assertEqual([i for i, row in enumerate(checked) if row != (0,) * 25 + (i,)], [])
+
+        rows[1500][-1] = 'a'
+        self.assertRaises(TypeError, check, Sequence(Tuple(Optional(int))), Rows(rows))
+
+        # Only errors of failed checks are checked again with the item's name, bugs in checkers propagate as-is
+        class Broken(Tuple):
+            def check(self, name, value, **kwargs):
+                calls.append(value)
+                raise KeyError(name)
+
+        calls.clear()
+        self.assertRaises(KeyError, check, List(Broken(int)), [(1,)])
+        self.assertEqual(len(calls), 1)
+
 
 class TestTuple(TestCaseArgscheck):
     def test_init(self):